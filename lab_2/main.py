@@ -3,6 +3,12 @@ import time
 
 from src.table_truth_generator.logical_function import LogicalFunction
 from src.table_truth_generator.truth_table import TruthTable
+from src.table_truth_generator.incremental import IncrementalSession
+
+# Bigger tables are streamed: only the first and last PREVIEW_ROWS rows are
+# evaluated and printed, the full table and the normal forms are skipped.
+STREAMING_VARIABLES_LIMIT = 16
+PREVIEW_ROWS = 8
 
 
 def main():
@@ -13,7 +19,10 @@ def main():
     print(Fore.WHITE + "Variables: Single letters (a-z, A-Z)" + Style.RESET_ALL)
     print(Fore.WHITE + "Example: (a & b) | !c" + Style.RESET_ALL)
     print(Fore.WHITE + "Enter 'exit' to quit." + Style.RESET_ALL)
-    print(Fore.WHITE + "Note: Formulas with more than 10 variables may have limited index form output." + Style.RESET_ALL)
+    print(Fore.WHITE + f"Note: Formulas with more than {STREAMING_VARIABLES_LIMIT} variables show only the first and last {PREVIEW_ROWS} rows." + Style.RESET_ALL)
+
+    # Between formulas the columns of unchanged subformulas are reused.
+    session = IncrementalSession()
 
     while True:
         text = input(Fore.YELLOW + "\nEnter formula: " + Style.RESET_ALL)
@@ -27,13 +36,21 @@ def main():
         try:
             start_time = time.perf_counter()
 
-            logical_function = LogicalFunction(text)
+            logical_function = LogicalFunction(text, factory=session.factory)
+
+            if len(logical_function.variables) > STREAMING_VARIABLES_LIMIT:
+                table = TruthTable(logical_function, lazy=True)
+                print(Fore.MAGENTA + f"\nTruth Table (first and last {PREVIEW_ROWS} of {table.rows_count} rows):" + Style.RESET_ALL)
+                table.display(0, PREVIEW_ROWS)
+                table.display(-PREVIEW_ROWS)
+                print(Fore.YELLOW + "Warning: Normal forms and index form are skipped for large formulas." + Style.RESET_ALL)
 
-            if len(logical_function.variables) > 10:
-                print(Fore.YELLOW + "Warning: Formula has more than 10 variables. Index form will be shown as binary string only." + Style.RESET_ALL)
+                elapsed_time = time.perf_counter() - start_time
+                print(Fore.CYAN + f"Processing time: {elapsed_time:.4f} seconds" + Style.RESET_ALL)
+                continue
 
             print(Fore.MAGENTA + "\nTruth Table:" + Style.RESET_ALL)
-            table = TruthTable(logical_function)
+            table = session.truth_table(logical_function)
             table.display()
 
             print(Fore.BLUE + Style.BRIGHT + "PCNF: " + Style.RESET_ALL + table.get_pcnf())
@@ -46,11 +63,9 @@ def main():
             print(Fore.GREEN + Style.BRIGHT + "Numeric form of PCNF: " + Style.RESET_ALL + table.get_num_form_pcnf())
             print(Fore.GREEN + Style.BRIGHT + "Numeric form of PDNF: " + Style.RESET_ALL + table.get_num_form_pdnf())
 
-            index_form = table.get_index_form()
-            if len(logical_function.variables) <= 10:
-                print(Fore.MAGENTA + Style.BRIGHT + "Index form: " + Style.RESET_ALL + f"{int(index_form, 2)} - {index_form}")
-            else:
-                print(Fore.MAGENTA + Style.BRIGHT + "Index form (binary): " + Style.RESET_ALL + index_form)
+            index_form = table.index_form
+            print(Fore.MAGENTA + Style.BRIGHT + "Index form: " + Style.RESET_ALL + f"{index_form.to_decimal()} - {index_form.to_binary()}")
+            print(Fore.MAGENTA + Style.BRIGHT + "Index form (hex): " + Style.RESET_ALL + index_form.to_hex())
 
         except Exception as e:
             print(Fore.RED + f"Error: {str(e)}" + Style.RESET_ALL)
@@ -0,0 +1,75 @@
+from typing import Dict, List
+
+from src.table_truth_generator.language import VARIABLE, NOT, AND, OR, IMP, EQU
+from src.table_truth_generator.nodes import ExpressionNode, iter_postorder
+
+# Column patterns for the three lowest row-index bits inside a single byte
+# (bit k of the byte is row k).
+LOW_BIT_PATTERNS = (0xAA, 0xCC, 0xF0)
+
+
+def variable_column(position: int, variables_count: int) -> int:
+    # Row i holds the variable at `position` in bit (variables_count - 1 - position)
+    # of i, the same order itertools.product produces.
+    weight = variables_count - 1 - position
+    rows_count = 2**variables_count
+    if weight < 3:
+        pattern = LOW_BIT_PATTERNS[weight]
+        if rows_count < 8:
+            return pattern & ((1 << rows_count) - 1)
+        return int.from_bytes(bytes([pattern]) * (rows_count // 8), "little")
+
+    block = b"\x00" * 2 ** (weight - 3) + b"\xff" * 2 ** (weight - 3)
+    return int.from_bytes(block * (rows_count // 2 ** (weight + 1)), "little")
+
+
+class BitwiseEvaluator:
+    # Every column is a Python int whose bit i is the value in row i.
+    bitwise_opr = {
+        NOT: lambda full, x: full ^ x,
+        AND: lambda full, x, y: x & y,
+        OR: lambda full, x, y: x | y,
+        IMP: lambda full, x, y: (full ^ x) | y,
+        EQU: lambda full, x, y: full ^ x ^ y,
+    }
+
+    def __init__(self, ast: ExpressionNode, variables: List[str]):
+        self.ast = ast
+        self.variables = variables
+        self.rows_count = 2 ** len(variables)
+        self.full_mask = (1 << self.rows_count) - 1
+
+    def get_columns(self) -> Dict[str, int]:
+        count = len(self.variables)
+        return {var: variable_column(i, count) for i, var in enumerate(self.variables)}
+
+    def evaluate(self) -> int:
+        columns = self.get_columns()
+        nodes = list(iter_postorder(self.ast))
+
+        # Count the consumers of every node so intermediate columns can be
+        # released as soon as the last one has read them.
+        consumers: Dict[int, int] = {}
+        for node in nodes:
+            for operand in node.operands:
+                consumers[id(operand)] = consumers.get(id(operand), 0) + 1
+
+        values: Dict[int, int] = {}
+        for node in nodes:
+            if node.operator == VARIABLE:
+                values[id(node)] = columns[node.name]
+                continue
+            if node.operator not in self.bitwise_opr:
+                raise ValueError("Unknown operator")
+
+            operand_values = []
+            for operand in node.operands:
+                operand_values.append(values[id(operand)])
+                consumers[id(operand)] -= 1
+                if consumers[id(operand)] == 0:
+                    del values[id(operand)]
+            values[id(node)] = self.bitwise_opr[node.operator](
+                self.full_mask, *operand_values
+            )
+
+        return values[id(self.ast)]
@@ -1,10 +1,11 @@
 from src.table_truth_generator.language import Lexer, VARIABLE, NOT, AND, OR, LPAREN, RPAREN, IMP, EQU, EOF
-from src.table_truth_generator.nodes import VariableNode, UnaryOperationNode, BinaryOperationNode, ExpressionNode
+from src.table_truth_generator.nodes import ExpressionNode, NodeFactory
 
 
 class Parser:
-    def __init__(self, lexer: Lexer):
+    def __init__(self, lexer: Lexer, factory: NodeFactory = None):
         self.lexer = lexer
+        self.factory = NodeFactory() if factory is None else factory
         self.current_token = lexer.get_next_token()
 
     def error(self):
@@ -20,10 +21,10 @@ class Parser:
         token = self.current_token
         if token.type == VARIABLE:
             self.eat(VARIABLE)
-            return VariableNode(token)
+            return self.factory.variable(token)
         elif token.type == NOT:
             self.eat(NOT)
-            return UnaryOperationNode(token, self.element())
+            return self.factory.unary(token, self.element())
         elif token.type == LPAREN:
             self.eat(LPAREN)
             node = self.equivalence()
@@ -36,11 +37,7 @@ class Parser:
         while self.current_token.type == AND:
             operator = self.current_token
             self.eat(AND)
-            node = BinaryOperationNode(
-                left_operand=node,
-                operator=operator,
-                right_operand=self.element(),
-            )
+            node = self.factory.binary(node, operator, self.element())
         return node
 
     def disjunction(self) -> ExpressionNode:
@@ -48,11 +45,7 @@ class Parser:
         while self.current_token.type == OR:
             operator = self.current_token
             self.eat(OR)
-            node = BinaryOperationNode(
-                left_operand=node,
-                operator=operator,
-                right_operand=self.conjunction(),
-            )
+            node = self.factory.binary(node, operator, self.conjunction())
         return node
 
     def implication(self) -> ExpressionNode:
@@ -60,11 +53,7 @@ class Parser:
         while self.current_token.type == IMP:
             operator = self.current_token
             self.eat(IMP)
-            node = BinaryOperationNode(
-                left_operand=node,
-                operator=operator,
-                right_operand=self.disjunction(),  # Сейчас левая ассоциация, чтобы сделать правую: right_operand=self.implication()
-            )
+            node = self.factory.binary(node, operator, self.disjunction())  # Сейчас левая ассоциация, чтобы сделать правую: right_operand=self.implication()
         return node
 
     def equivalence(self) -> ExpressionNode:
@@ -72,11 +61,7 @@ class Parser:
         while self.current_token.type == EQU:
             operator = self.current_token
             self.eat(EQU)
-            node = BinaryOperationNode(
-                left_operand=node,
-                operator=operator,
-                right_operand=self.implication(),
-            )
+            node = self.factory.binary(node, operator, self.implication())
         return node
 
     def parse(self) -> ExpressionNode:
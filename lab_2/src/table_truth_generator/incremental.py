@@ -0,0 +1,86 @@
+from typing import Dict, List, Optional
+
+from src.table_truth_generator.language import VARIABLE
+from src.table_truth_generator.nodes import (
+    ExpressionNode,
+    InterningNodeFactory,
+    iter_postorder,
+)
+from src.table_truth_generator.bitwise import BitwiseEvaluator, variable_column
+from src.table_truth_generator.logical_function import LogicalFunction
+from src.table_truth_generator.packed import BitColumn
+from src.table_truth_generator.truth_table import TruthTable
+
+
+class IncrementalSession:
+    # Successive formulas are parsed through one interning factory, so every
+    # subtree an edit leaves alone is the very node it was before, and its
+    # result column, kept under the node's identity, is reused as it is.
+    # Only the new nodes (the edited subterm and its ancestors up to the
+    # root) are evaluated.
+    def __init__(self):
+        self.factory = InterningNodeFactory()
+        self.variables: Optional[List[str]] = None
+        self.columns: Dict[int, int] = {}
+        # Nodes evaluated and reused by the last update.
+        self.evaluated = 0
+        self.reused = 0
+
+    def update(self, formula: str) -> TruthTable:
+        return self.truth_table(LogicalFunction(formula, factory=self.factory))
+
+    def truth_table(self, function: LogicalFunction) -> TruthTable:
+        # The function must come from this session's factory.
+        if function.variables != self.variables:
+            # Another set of variables means another row layout.
+            self.variables = function.variables
+            self.columns.clear()
+        column = self.evaluate(function.ast)
+        self.release(function.ast)
+        return TruthTable(
+            function, column=BitColumn.from_int(column, 2 ** len(self.variables))
+        )
+
+    def evaluate(self, root: ExpressionNode) -> int:
+        rows_count = 2 ** len(self.variables)
+        full_mask = (1 << rows_count) - 1
+        positions = {var: k for k, var in enumerate(self.variables)}
+        bitwise_opr = BitwiseEvaluator.bitwise_opr
+        columns = self.columns
+
+        # Post-order walk that stops at every node already in the cache.
+        self.evaluated = 0
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in columns:
+                continue
+            if not expanded:
+                stack.append((node, True))
+                for operand in reversed(node.operands):
+                    if id(operand) not in columns:
+                        stack.append((operand, False))
+                continue
+
+            if node.operator == VARIABLE:
+                value = variable_column(positions[node.name], len(self.variables))
+            elif node.operator in bitwise_opr:
+                value = bitwise_opr[node.operator](
+                    full_mask, *(columns[id(operand)] for operand in node.operands)
+                )
+            else:
+                raise ValueError("Unknown operator")
+            columns[id(node)] = value
+            self.evaluated += 1
+        return columns[id(root)]
+
+    def release(self, root: ExpressionNode) -> None:
+        # Only the current formula's nodes and columns are kept. Dropping a
+        # node from the factory and its column together keeps ids unique
+        # among the live entries, since a live node's operands are live.
+        live = {id(node) for node in iter_postorder(root)}
+        self.reused = len(live) - self.evaluated
+        self.columns = {key: self.columns[key] for key in live}
+        self.factory.nodes = {
+            key: node for key, node in self.factory.nodes.items() if id(node) in live
+        }
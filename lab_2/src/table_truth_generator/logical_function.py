@@ -1,15 +1,16 @@
-from typing import Dict
+from typing import Dict, Optional
 
 from src.table_truth_generator.language import Lexer
 from src.table_truth_generator.grammar import Parser
+from src.table_truth_generator.nodes import NodeFactory
 
 
 class LogicalFunction:
-    def __init__(self, formula: str):
+    def __init__(self, formula: str, factory: Optional[NodeFactory] = None):
         self.formula = formula
 
         lexer = Lexer(formula)
-        parser = Parser(lexer)
+        parser = Parser(lexer, factory)
 
         self.ast = parser.parse()
         self.variables = lexer.get_variables()
@@ -1,6 +1,7 @@
 from abc import abstractmethod, ABC
+from typing import Dict, Iterator, Tuple
 
-from src.table_truth_generator.language import Token
+from src.table_truth_generator.language import Token, VARIABLE
 
 
 class ExpressionNode(ABC):
@@ -8,6 +9,15 @@ class ExpressionNode(ABC):
     def to_python(self):
         pass
 
+    @property
+    @abstractmethod
+    def operator(self) -> str:
+        pass
+
+    @property
+    def operands(self) -> Tuple["ExpressionNode", ...]:
+        return ()
+
 
 class VariableNode(ExpressionNode):
     def __init__(self, variable: Token):
@@ -16,6 +26,10 @@ class VariableNode(ExpressionNode):
     def to_python(self) -> str:
         return self.name
 
+    @property
+    def operator(self) -> str:
+        return VARIABLE
+
 
 class UnaryOperationNode(ExpressionNode):
     def __init__(self, operator: Token, operand: ExpressionNode):
@@ -30,6 +44,14 @@ class UnaryOperationNode(ExpressionNode):
         else:
             raise ValueError("Unknown unary operator")
 
+    @property
+    def operator(self) -> str:
+        return self.opr.type
+
+    @property
+    def operands(self) -> Tuple[ExpressionNode, ...]:
+        return (self.opd,)
+
 
 class BinaryOperationNode(ExpressionNode):
     def __init__(
@@ -57,3 +79,80 @@ class BinaryOperationNode(ExpressionNode):
             return self.binary_opr[self.opr.type](left_opd_value, right_opd_value)
         else:
             raise ValueError("Unknown binary operator")
+
+    @property
+    def operator(self) -> str:
+        return self.opr.type
+
+    @property
+    def operands(self) -> Tuple[ExpressionNode, ...]:
+        return (self.left_opd, self.right_opd)
+
+
+class NodeFactory:
+    # Plain construction; the parser calls these instead of the node classes
+    # so a different factory can change how nodes are allocated.
+    def variable(self, token: Token) -> ExpressionNode:
+        return VariableNode(token)
+
+    def unary(self, operator: Token, operand: ExpressionNode) -> ExpressionNode:
+        return UnaryOperationNode(operator, operand)
+
+    def binary(
+        self, left: ExpressionNode, operator: Token, right: ExpressionNode
+    ) -> ExpressionNode:
+        return BinaryOperationNode(
+            left_operand=left, operator=operator, right_operand=right
+        )
+
+
+class InterningNodeFactory(NodeFactory):
+    # Hash-consing: structurally identical subtrees are built once and shared.
+    # Operands are interned before their parent, which makes their identity a
+    # complete structural key.
+    def __init__(self):
+        self.nodes: Dict[tuple, ExpressionNode] = {}
+
+    def variable(self, token: Token) -> ExpressionNode:
+        key = (VARIABLE, token.value)
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = VariableNode(token)
+        return node
+
+    def unary(self, operator: Token, operand: ExpressionNode) -> ExpressionNode:
+        key = (operator.type, id(operand))
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = UnaryOperationNode(operator, operand)
+        return node
+
+    def binary(
+        self, left: ExpressionNode, operator: Token, right: ExpressionNode
+    ) -> ExpressionNode:
+        key = (operator.type, id(left), id(right))
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = BinaryOperationNode(
+                left_operand=left, operator=operator, right_operand=right
+            )
+        return node
+
+
+def iter_postorder(root: ExpressionNode) -> Iterator[ExpressionNode]:
+    # Iterative walk: every distinct node is yielded once, after its operands,
+    # so deep formulas don't hit the recursion limit.
+    visited = set()
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in visited:
+            continue
+        if expanded:
+            visited.add(id(node))
+            yield node
+            continue
+        stack.append((node, True))
+        for operand in reversed(node.operands):
+            if id(operand) not in visited:
+                stack.append((operand, False))
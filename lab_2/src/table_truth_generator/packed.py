@@ -0,0 +1,85 @@
+from typing import Iterator, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Positions of the set bits of every byte value, used to walk a packed column
+# a byte at a time instead of a bit at a time.
+BYTE_BITS = tuple(
+    tuple(b for b in range(8) if (value >> b) & 1) for value in range(256)
+)
+
+
+class BitColumn:
+    # Bit i of the column lives in byte i // 8 at bit position i % 8.
+    def __init__(self, data: Buffer, length: int):
+        if len(data) * 8 < length:
+            raise ValueError("Buffer is too small for the column length")
+        self.data = data
+        self.length = length
+
+    @classmethod
+    def zeros(cls, length: int) -> "BitColumn":
+        return cls(bytearray((length + 7) // 8), length)
+
+    @classmethod
+    def from_int(cls, value: int, length: int) -> "BitColumn":
+        return cls(bytearray(value.to_bytes((length + 7) // 8, "little")), length)
+
+    def to_int(self) -> int:
+        value = int.from_bytes(self.data[: (self.length + 7) // 8], "little")
+        return value & ((1 << self.length) - 1)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Column index out of range")
+        return (self.data[index >> 3] >> (index & 7)) & 1
+
+    def __setitem__(self, index: int, bit: int) -> None:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Column index out of range")
+        if bit:
+            self.data[index >> 3] |= 1 << (index & 7)
+        else:
+            self.data[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BitColumn):
+            return NotImplemented
+        return self.length == other.length and self.to_int() == other.to_int()
+
+    def __iter__(self) -> Iterator[int]:
+        for i in range(self.length):
+            yield (self.data[i >> 3] >> (i & 7)) & 1
+
+    @property
+    def nbytes(self) -> int:
+        return (self.length + 7) // 8
+
+    def count(self) -> int:
+        return self.to_int().bit_count()
+
+    def iter_ones(self, start: int = 0, stop: int = None) -> Iterator[int]:
+        return self._iter_bits(True, start, stop)
+
+    def iter_zeros(self, start: int = 0, stop: int = None) -> Iterator[int]:
+        return self._iter_bits(False, start, stop)
+
+    def _iter_bits(self, value: bool, start: int, stop: int) -> Iterator[int]:
+        stop = self.length if stop is None else min(stop, self.length)
+        flip = 0 if value else 0xFF
+        for byte_index in range(start >> 3, (stop + 7) >> 3):
+            byte = self.data[byte_index] ^ flip
+            if not byte:
+                continue
+            base = byte_index << 3
+            for bit in BYTE_BITS[byte]:
+                index = base + bit
+                if start <= index < stop:
+                    yield index
@@ -1,59 +1,228 @@
-from typing import List
+import sys
+from typing import List, Dict, Iterator, Optional, TextIO, Tuple
+from collections.abc import Sequence
 from itertools import product
 from tabulate import tabulate
 
 from src.table_truth_generator.logical_function import LogicalFunction
+from src.table_truth_generator.bitwise import BitwiseEvaluator
+from src.table_truth_generator.packed import BitColumn
+from src.table_truth_generator.index_form import IndexForm, default_variables
+
+BACKENDS = ("rows", "bitwise")
+
+
+class TruthTableRows(Sequence):
+    # Read-only list-of-rows view: each row is built from its index and the
+    # packed result column on access, nothing is stored per row.
+    def __init__(self, truth_table: "TruthTable"):
+        self.truth_table = truth_table
+
+    def __len__(self) -> int:
+        return self.truth_table.rows_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                self.truth_table.get_row(i) for i in range(*index.indices(len(self)))
+            ]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Row index out of range")
+        return self.truth_table.get_row(index)
+
+    def __iter__(self) -> Iterator[List[int]]:
+        for i in range(len(self)):
+            yield self.truth_table.get_row(i)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, TruthTableRows)):
+            return len(self) == len(other) and all(
+                row == other_row for row, other_row in zip(self, other)
+            )
+        return NotImplemented
 
 
 class TruthTable:
-    def __init__(self, logical_function: LogicalFunction):
+    def __init__(
+        self,
+        logical_function: Optional[LogicalFunction] = None,
+        backend: str = "bitwise",
+        lazy: bool = False,
+        *,
+        variables: Optional[List[str]] = None,
+        column: Optional[BitColumn] = None,
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+
         self.logical_function = logical_function
-        self.variables = logical_function.variables
+        self.backend = backend
+        self._result_column: Optional[BitColumn] = None
+
+        if logical_function is not None:
+            self.variables = logical_function.variables
+            self.rows_count = 2 ** len(self.variables)
+            # In lazy mode the result column is only built when something
+            # needs the whole table; row access evaluates the formula row by row.
+            # A column already computed for the function is taken as it is.
+            if column is not None:
+                self._set_result_column(column)
+            elif not lazy:
+                self._build_result_column()
+        elif variables is not None and column is not None:
+            # A ready result column: nothing is parsed or evaluated.
+            self.variables = list(variables)
+            self.rows_count = 2 ** len(self.variables)
+            self._set_result_column(column)
+        else:
+            raise ValueError(
+                "Either a logical function or variables with a column are required"
+            )
+        self.table = TruthTableRows(self)
 
-        self.num_form_pcnf = []
-        self.num_form_pdnf = []
+    @classmethod
+    def from_index_form(
+        cls, index_form: IndexForm, variables: Optional[List[str]] = None
+    ) -> "TruthTable":
+        # The column comes straight from the index number; without names the
+        # variables are x1 .. xn.
+        if variables is None:
+            variables = default_variables(index_form.variables_count)
+        elif len(variables) != index_form.variables_count:
+            raise ValueError("Index form does not match the number of variables")
+        return cls(variables=variables, column=index_form.to_column())
 
-        self.table = []
-        self._generate_table()
+    def _set_result_column(self, column: BitColumn) -> None:
+        if len(column) != self.rows_count:
+            raise ValueError("Column length must be 2 ** len(variables)")
+        self._result_column = column
 
+    @property
+    def result_header(self) -> str:
+        if self.logical_function is None:
+            return "Result"
+        return self.logical_function.formula
 
-    def _generate_table(self) -> List[List[bool]]:
-        combinations = product([False, True], repeat=len(self.variables))
+    def _build_result_column(self) -> None:
+        if self.backend == "bitwise":
+            self._generate_table_bitwise()
+        else:
+            self._generate_table()
+
+    def _generate_table(self) -> None:
+        self._result_column = BitColumn.zeros(self.rows_count)
+        combinations = product([0, 1], repeat=len(self.variables))
         for i, combination in enumerate(combinations):
             assignment = dict(zip(self.variables, combination))
-            result = self.logical_function.evaluate(assignment)
+            if self.logical_function.evaluate(assignment):
+                self._result_column[i] = 1
+
+    def _generate_table_bitwise(self) -> None:
+        column = BitwiseEvaluator(self.logical_function.ast, self.variables).evaluate()
+        self._result_column = BitColumn.from_int(column, self.rows_count)
 
-            if result:
-                self.num_form_pdnf.append(i)
+    @property
+    def result_column(self) -> BitColumn:
+        if self._result_column is None:
+            self._build_result_column()
+        return self._result_column
+
+    @property
+    def num_form_pdnf(self) -> List[int]:
+        return list(self.result_column.iter_ones())
+
+    @property
+    def num_form_pcnf(self) -> List[int]:
+        return list(self.result_column.iter_zeros())
+
+    def get_assignment(self, index: int) -> Dict[str, int]:
+        count = len(self.variables)
+        return {
+            var: (index >> (count - 1 - k)) & 1 for k, var in enumerate(self.variables)
+        }
+
+    def get_result(self, index: int) -> int:
+        if self._result_column is not None:
+            return self._result_column[index]
+        if not 0 <= index < self.rows_count:
+            raise IndexError("Row index out of range")
+        return int(self.logical_function.evaluate(self.get_assignment(index)))
+
+    def get_row(self, index: int) -> List[int]:
+        count = len(self.variables)
+        row = [(index >> (count - 1 - k)) & 1 for k in range(count)]
+        row.append(self.get_result(index))
+        return row
+
+    def iter_rows(
+        self, start: Optional[int] = None, stop: Optional[int] = None
+    ) -> Iterator[Tuple[int, Dict[str, int], int]]:
+        # Slice semantics, so iter_rows(-5) yields the last five rows.
+        for i in range(self.rows_count)[start:stop]:
+            assignment = self.get_assignment(i)
+            if self._result_column is not None:
+                result = self._result_column[i]
             else:
-                self.num_form_pcnf.append(i)
+                result = int(self.logical_function.evaluate(assignment))
+            yield i, assignment, result
+
+    def display(self, start: Optional[int] = None, stop: Optional[int] = None) -> str:
+        headers = self.variables + [self.result_header]
+        if start is None and stop is None:
+            print(tabulate(self.table, headers=headers, tablefmt="simple_grid"))
+            return
 
-            row = list(combination) + [result]
-            self.table.append(row)
+        indexes, rows = [], []
+        for i, assignment, result in self.iter_rows(start, stop):
+            indexes.append(i)
+            rows.append(list(assignment.values()) + [result])
+        print(
+            tabulate(rows, headers=headers, showindex=indexes, tablefmt="simple_grid")
+        )
 
-    def display(self) -> str:
-        headers = self.variables + [self.logical_function.formula]
-        table_data = [[int(cell) for cell in row] for row in self.table]
-        print(tabulate(table_data, headers=headers, tablefmt="simple_grid"))
+    def write(
+        self,
+        stream: Optional[TextIO] = None,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> None:
+        # Plain-text rows written one at a time, so the output never has to
+        # fit in memory the way a tabulate grid does.
+        stream = sys.stdout if stream is None else stream
+        headers = self.variables + [self.result_header]
+        widths = [len(header) for header in headers]
+        stream.write(" ".join(headers) + "\n")
+        for _, assignment, result in self.iter_rows(start, stop):
+            cells = list(assignment.values()) + [result]
+            stream.write(
+                " ".join(str(cell).rjust(width) for cell, width in zip(cells, widths))
+                + "\n"
+            )
 
     def get_num_form_pdnf(self) -> str:
         str_num_form_pdnf = map(lambda x: str(x), self.num_form_pdnf)
         return f"({", ".join(str_num_form_pdnf)}) |"
-    
+
     def get_num_form_pcnf(self) -> str:
         str_num_form_pdnf = map(lambda x: str(x), self.num_form_pcnf)
         return f"({", ".join(str_num_form_pdnf)}) &"
-    
+
+    @property
+    def index_form(self) -> IndexForm:
+        return IndexForm.from_column(self.result_column)
+
     def get_index_form(self) -> str:
-         result = ["0"] * 2 ** len(self.variables)
-         for i in self.num_form_pdnf:
-              result[i] = "1"
-         return "".join(result)
+        return self.index_form.to_binary()
 
     def get_pcnf(self) -> str:
         maxterms = []
         for j in self.num_form_pcnf:
-            terms = [f"!{var}" if self.table[j][i] else var for i, var in enumerate(self.variables)]
+            terms = [
+                f"!{var}" if self.table[j][i] else var
+                for i, var in enumerate(self.variables)
+            ]
             maxterm = "(" + "|".join(terms) + ")"
             maxterms.append(maxterm)
         return "&".join(maxterms)
@@ -61,7 +230,10 @@ class TruthTable:
     def get_pdnf(self) -> str:
         minterms = []
         for j in self.num_form_pdnf:
-            terms = [var if self.table[j][i] else f"!{var}" for i, var in enumerate(self.variables)]
+            terms = [
+                var if self.table[j][i] else f"!{var}"
+                for i, var in enumerate(self.variables)
+            ]
             minterm = "(" + "&".join(terms) + ")"
             minterms.append(minterm)
         return "|".join(minterms)
@@ -0,0 +1,29 @@
+from table_truth_generator.incremental import IncrementalSession
+from table_truth_generator.logical_function import LogicalFunction
+from table_truth_generator.truth_table import TruthTable
+
+EDITS = [
+    "(a & b) | (c > d) | (e ~ f)",
+    "(a & b) | (c > !d) | (e ~ f)",
+    "(a & b) | (c > !d) | !(e ~ f)",
+    "a | b",
+    "(a | b) & !(c | d)",
+]
+
+
+def test_tables_match_full_rebuild():
+    session = IncrementalSession()
+    for formula in EDITS:
+        table = session.update(formula)
+        expected = TruthTable(LogicalFunction(formula))
+        assert table.variables == expected.variables
+        assert table.result_column.to_int() == expected.result_column.to_int()
+
+
+def test_only_the_edited_path_is_evaluated():
+    session = IncrementalSession()
+    session.update("(a & b) | (c > d) | (e ~ f)")
+    # !d, (c > !d) and the two ORs above it are new.
+    session.update("(a & b) | (c > !d) | (e ~ f)")
+    assert session.evaluated == 4
+    assert session.reused == 8
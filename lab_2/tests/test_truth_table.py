@@ -122,3 +122,48 @@ def test_truth_table_implication():
     assert table.get_index_form() == "1101"
     assert table.num_form_pdnf == [0, 1, 3]
     assert table.num_form_pcnf == [2]
+
+
+def test_truth_table_iter_rows_lazy():
+    func = LogicalFunction("x > y")
+    table = TruthTable(func, lazy=True)
+
+    rows = list(table.iter_rows(-2))
+    assert rows == [(2, {"x": 1, "y": 0}, 0), (3, {"x": 1, "y": 1}, 1)]
+
+
+def test_truth_table_display_range(capsys):
+    func = LogicalFunction("x & y")
+    table = TruthTable(func, lazy=True)
+    table.display(0, 2)
+    captured = capsys.readouterr()
+    assert "x & y" in captured.out
+    assert captured.out.count("│   1 │") == 1
+
+
+def test_index_form_number_and_rendering():
+    table = TruthTable(LogicalFunction("a > b"))
+    index_form = table.index_form
+    assert index_form.number == 0b1101
+    assert index_form.to_decimal() == "13"
+    assert index_form.to_hex() == "d"
+    assert str(index_form) == table.get_index_form()
+
+
+def test_truth_table_from_index_form():
+    func = LogicalFunction("(a | b) & !(c ~ d) > a")
+    table = TruthTable(func)
+    loaded = TruthTable.from_index_form(table.index_form, table.variables)
+    assert loaded.logical_function is None
+    assert loaded.table == table.table
+    assert loaded.get_pdnf() == table.get_pdnf()
+
+
+def test_index_form_decimal_past_ten_variables():
+    variables = "abcdefghijklmn"
+    table = TruthTable(LogicalFunction(" & ".join(variables)))
+    assert table.index_form.number == 1
+    assert table.index_form.to_decimal() == "1"
+    table = TruthTable(LogicalFunction(" | ".join(variables)))
+    assert table.index_form.number == 2 ** (2**14 - 1) - 1
+    assert len(table.index_form.to_decimal()) == 4932
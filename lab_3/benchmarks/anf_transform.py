@@ -0,0 +1,56 @@
+# Run from lab_3: python -m benchmarks.anf_transform
+import time
+
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+from src.pnf_contructor.anf import ZhegalkinPolynomial
+from benchmarks.bitwise_engine import generate_formula
+
+VARIABLE_COUNTS = (8, 10, 12, 16, 20, 24)
+# The O(4**n) subset sums are only run up to this size.
+NAIVE_LIMIT = 10
+
+
+def naive_coefficients(table: TruthTable) -> int:
+    rows = [table.get_result(i) for i in range(table.rows_count)]
+    coefficients = 0
+    for i in range(table.rows_count):
+        value = 0
+        for j in range(table.rows_count):
+            if j & ~i == 0:
+                value ^= rows[j]
+        coefficients |= value << i
+    return coefficients
+
+
+def timed(build):
+    start = time.perf_counter()
+    result = build()
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'variables':>10} {'naive, s':>10} {'to ANF, s':>10} {'from ANF, s':>12} "
+        f"{'monomials':>10} {'degree':>7}"
+    )
+    for count in VARIABLE_COUNTS:
+        table = TruthTable(LogicalFunction(generate_formula(count)))
+        polynomial, to_time = timed(lambda: ZhegalkinPolynomial.from_truth_table(table))
+        column, from_time = timed(polynomial.to_column)
+        assert column == table.result_column.to_int()
+
+        if count <= NAIVE_LIMIT:
+            naive, naive_time = timed(lambda: naive_coefficients(table))
+            assert naive == polynomial.coefficients
+            naive_cell = f"{naive_time:>10.3f}"
+        else:
+            naive_cell = f"{'-':>10}"
+        print(
+            f"{count:>10} {naive_cell} {to_time:>10.4f} {from_time:>12.4f} "
+            f"{len(polynomial.monomials):>10} {polynomial.degree():>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Run from lab_3: python -m benchmarks.bdd_backend
+import time
+
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+from src.pnf_contructor.bdd import BinaryDecisionDiagram
+from benchmarks.bitwise_engine import generate_formula
+
+TRUTH_TABLE_LIMIT = 20
+# Past this many pairs the sorted order (every x before every y) is too big.
+SORTED_PAIRS_LIMIT = 10
+
+
+def timed(build):
+    start = time.perf_counter()
+    result = build()
+    return result, time.perf_counter() - start
+
+
+def comparator(pairs: int) -> str:
+    return " & ".join(f"(x{i} ~ y{i})" for i in range(pairs))
+
+
+def main():
+    print("Random formulas: truth table vs BDD (sorted order)")
+    print(
+        f"{'variables':>10} {'table, s':>10} {'bdd, s':>10} {'nodes':>8} {'models':>12}"
+    )
+    for count in (10, 16, 20, 26):
+        function = LogicalFunction(generate_formula(count))
+        bdd, bdd_time = timed(lambda: BinaryDecisionDiagram(function))
+        if count <= TRUTH_TABLE_LIMIT:
+            table, table_time = timed(lambda: TruthTable(function))
+            assert len(table.num_form_pdnf) == bdd.count_models()
+            table_cell = f"{table_time:>10.3f}"
+        else:
+            table_cell = f"{'-':>10}"
+        print(
+            f"{count:>10} {table_cell} {bdd_time:>10.4f} {bdd.size:>8} "
+            f"{bdd.count_models():>12}"
+        )
+
+    print()
+    print("Comparator x == y: variable order and sifting")
+    print(
+        f"{'variables':>10} {'sorted':>8} {'sifted':>8} {'sift, s':>9} "
+        f"{'interleaved':>12} {'equivalent, s':>14}"
+    )
+    for pairs in (4, 8, 10, 20, 40):
+        function = LogicalFunction(comparator(pairs))
+        interleaved = [var for i in range(pairs) for var in (f"x{i}", f"y{i}")]
+        best = BinaryDecisionDiagram(function, order=interleaved)
+        if pairs <= SORTED_PAIRS_LIMIT:
+            sorted_size = BinaryDecisionDiagram(function).size
+            sifted, sift_time = timed(
+                lambda: BinaryDecisionDiagram(function, sifting=True)
+            )
+            sorted_cell = f"{sorted_size:>8}"
+            sifted_cell = f"{sifted.size:>8} {sift_time:>9.3f}"
+        else:
+            sorted_cell = f"{'-':>8}"
+            sifted_cell = f"{'-':>8} {'-':>9}"
+
+        differ = " | ".join(f"(x{i} & !y{i} | !x{i} & y{i})" for i in range(pairs))
+        other = BinaryDecisionDiagram(
+            LogicalFunction(f"!({differ})"), order=interleaved
+        )
+        equivalent, equivalent_time = timed(lambda: best.equivalent(other))
+        assert equivalent
+        print(
+            f"{2 * pairs:>10} {sorted_cell} {sifted_cell} {best.size:>12} "
+            f"{equivalent_time:>14.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
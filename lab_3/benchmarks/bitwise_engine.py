@@ -0,0 +1,70 @@
+# Run from lab_3: python -m benchmarks.bitwise_engine
+import random
+import time
+from itertools import product, islice
+from string import ascii_lowercase
+
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.bitwise import BitwiseEvaluator
+
+VARIABLE_COUNTS = (10, 16, 20, 24)
+# Past this many rows the row-by-row evaluation is timed on a sample and
+# extrapolated, otherwise a single 24-variable run takes minutes.
+FULL_ROWS_LIMIT = 2**20
+SAMPLE_ROWS = 2**16
+
+
+def generate_formula(variables_count: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    variables = list(ascii_lowercase[:variables_count])
+    clauses = []
+    for i in range(0, variables_count, 2):
+        left, right = variables[i], variables[(i + 1) % variables_count]
+        operator = rng.choice(["&", "|", ">", "~"])
+        negation = rng.choice(["", "!"])
+        clauses.append(f"({negation}{left} {operator} {right})")
+    return (
+        " | ".join(clauses[: len(clauses) // 2])
+        + " > "
+        + " & ".join(clauses[len(clauses) // 2 :])
+    )
+
+
+def time_rows(function: LogicalFunction) -> tuple:
+    rows_count = 2 ** len(function.variables)
+    measured_rows = rows_count if rows_count <= FULL_ROWS_LIMIT else SAMPLE_ROWS
+    combinations = islice(
+        product([0, 1], repeat=len(function.variables)), measured_rows
+    )
+
+    start = time.perf_counter()
+    for combination in combinations:
+        function.evaluate(dict(zip(function.variables, combination)))
+    elapsed = time.perf_counter() - start
+    return elapsed * rows_count / measured_rows, measured_rows < rows_count
+
+
+def time_bitwise(function: LogicalFunction) -> float:
+    start = time.perf_counter()
+    BitwiseEvaluator(function.ast, function.variables).evaluate()
+    return time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'vars':>4} {'rows':>10} {'row-by-row, s':>16} {'bitwise, s':>12} {'speedup':>10}"
+    )
+    for count in VARIABLE_COUNTS:
+        function = LogicalFunction(generate_formula(count))
+        rows_time, estimated = time_rows(function)
+        bitwise_time = time_bitwise(function)
+        rows_label = f"{rows_time:.3f}{'*' if estimated else ''}"
+        print(
+            f"{count:>4} {2**count:>10} {rows_label:>16} {bitwise_time:>12.4f} "
+            f"{rows_time / bitwise_time:>9.0f}x"
+        )
+    print("* extrapolated from a sample of rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Run from lab_3: python -m benchmarks.compiled_evaluation
+import time
+from itertools import product
+
+from src.pnf_contructor.logical_function import LogicalFunction
+from benchmarks.bitwise_engine import generate_formula
+
+VARIABLE_COUNTS = (8, 12, 16)
+
+
+def eval_lambda(function: LogicalFunction):
+    # The evaluator LogicalFunction used to build: eval of a generated source
+    # string, called with **assignment.
+    return eval(f"lambda {', '.join(function.variables)}: {function.formula_expr}")
+
+
+def time_calls(calls) -> float:
+    start = time.perf_counter()
+    calls()
+    return time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'vars':>4} {'eval + **dict, s':>17} {'positional, s':>14} "
+        f"{'evaluate_index, s':>18} {'speedup (positional / index)':>30}"
+    )
+    for count in VARIABLE_COUNTS:
+        function = LogicalFunction(generate_formula(count))
+        variables = function.variables
+        rows = list(product([False, True], repeat=count))
+        old = eval_lambda(function)
+
+        def dict_calls():
+            for values in rows:
+                old(**dict(zip(variables, values)))
+
+        def positional_calls():
+            evaluate = function.eval_formula
+            for values in rows:
+                evaluate(*values)
+
+        def index_calls():
+            evaluate_index = function.eval_index
+            for i in range(len(rows)):
+                evaluate_index(i)
+
+        dict_time = time_calls(dict_calls)
+        positional_time = time_calls(positional_calls)
+        index_time = time_calls(index_calls)
+        print(
+            f"{count:>4} {dict_time:>17.4f} {positional_time:>14.4f} "
+            f"{index_time:>18.4f} "
+            f"{dict_time / positional_time:>20.1f}x / {dict_time / index_time:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Run from lab_3: python -m benchmarks.espresso
+import random
+import time
+
+from src.pnf_contructor.truth_table import TruthTable
+from src.pnf_contructor.index_form import default_variables
+from src.corno.minimizer import Minimizer
+from src.corno.espresso import EspressoMinimizer
+
+# At 10 variables the exact cover may run out of its time budget and fall
+# back to the best cover it has found.
+EXACT_VARIABLE_COUNTS = (6, 8, 10)
+EXACT_FUNCTIONS = 20
+LARGE_VARIABLE_COUNTS = (16, 24, 32, 40)
+SEED_CUBES = 25
+# Every seed cube is cut into 2 ** SPLIT_BITS smaller cubes, so the input
+# cover is far from minimal and the seeds bound the answer from above.
+SPLIT_BITS = 3
+
+
+def random_cube(variables_count: int, literals: int, rng: random.Random):
+    mask = sum(1 << p for p in rng.sample(range(variables_count), literals))
+    return rng.getrandbits(variables_count) & mask, mask
+
+
+def split_cube(cube, variables_count: int, rng: random.Random):
+    value, mask = cube
+    free = [p for p in range(variables_count) if not (mask >> p) & 1]
+    bits = rng.sample(free, SPLIT_BITS)
+    for k in range(2**SPLIT_BITS):
+        extra = sum(1 << p for j, p in enumerate(bits) if (k >> j) & 1)
+        yield value | extra, mask | sum(1 << p for p in bits)
+
+
+def compare_with_exact(rng: random.Random) -> None:
+    print(
+        f"{'vars':>4} {'exact terms':>12} {'espresso terms':>15} {'worse':>6} "
+        f"{'exact, s':>9} {'espresso, s':>12}"
+    )
+    for count in EXACT_VARIABLE_COUNTS:
+        exact_total = espresso_total = worse = 0
+        exact_time = espresso_time = 0.0
+        for _ in range(EXACT_FUNCTIONS):
+            table = TruthTable(
+                variables=default_variables(count),
+                column=rng.getrandbits(2**count),
+            )
+            minimizer = Minimizer(table)
+            start = time.perf_counter()
+            _, chosen = minimizer.get_minimal_implicants(True, False)
+            exact_time += time.perf_counter() - start
+            start = time.perf_counter()
+            terms = EspressoMinimizer(table.iter_pdnf_terms(), count).minimize()
+            espresso_time += time.perf_counter() - start
+            exact_total += len(chosen)
+            espresso_total += len(terms)
+            worse += len(terms) > len(chosen)
+        print(
+            f"{count:>4} {exact_total:>12} {espresso_total:>15} {worse:>6} "
+            f"{exact_time:>9.3f} {espresso_time:>12.3f}"
+        )
+
+
+def large_functions(rng: random.Random) -> None:
+    print(f"{'vars':>4} {'input cubes':>12} {'seeds':>6} {'result':>7} {'time, s':>8}")
+    for count in LARGE_VARIABLE_COUNTS:
+        seeds = [
+            random_cube(count, rng.randint(count // 4, count // 2), rng)
+            for _ in range(SEED_CUBES)
+        ]
+        cubes = [cube for seed in seeds for cube in split_cube(seed, count, rng)]
+        start = time.perf_counter()
+        terms = EspressoMinimizer(cubes, count).minimize()
+        elapsed = time.perf_counter() - start
+        print(
+            f"{count:>4} {len(cubes):>12} {len(seeds):>6} {len(terms):>7} "
+            f"{elapsed:>8.3f}"
+        )
+
+
+def main():
+    rng = random.Random(0)
+    compare_with_exact(rng)
+    print()
+    large_functions(rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# Run from lab_3: python -m benchmarks.gray_evaluation
+import time
+from string import ascii_lowercase
+
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+from benchmarks.bitwise_engine import generate_formula
+from benchmarks.incremental_update import random_clauses
+
+BACKENDS = ("rows", "gray", "bitwise")
+
+
+def build_corpus():
+    corpus = [
+        ("generated, 16 vars", generate_formula(16)),
+        ("XOR parity, 16 vars", " ^ ".join(ascii_lowercase[:16])),
+        (
+            "EQU chain, 16 vars",
+            " ~ ".join(f"({var} > !{var})" for var in ascii_lowercase[:16]),
+        ),
+    ]
+    pdnf = TruthTable(LogicalFunction(generate_formula(10))).get_pdnf()
+    corpus.append(("PDNF, 10 vars", pdnf))
+    cnf = " & ".join(
+        "(" + " | ".join(literals) + ")" for literals in random_clauses(14, 120)
+    )
+    corpus.append(("3-CNF, 14 vars", cnf))
+    return corpus
+
+
+def main():
+    print(
+        f"{'formula':>22}" + "".join(f"{backend + ', s':>12}" for backend in BACKENDS)
+    )
+    for name, formula in build_corpus():
+        function = LogicalFunction(formula)
+        columns = []
+        line = f"{name:>22}"
+        for backend in BACKENDS:
+            start = time.perf_counter()
+            columns.append(TruthTable(function, backend=backend).result_column.to_int())
+            line += f"{time.perf_counter() - start:>12.3f}"
+        assert columns[0] == columns[1] == columns[2]
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
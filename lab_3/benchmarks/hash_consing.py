@@ -0,0 +1,60 @@
+# Run from lab_3: python -m benchmarks.hash_consing
+import gc
+import sys
+import time
+import tracemalloc
+
+from src.pnf_contructor.language import RegexLexer
+from src.pnf_contructor.grammar import IterativeParser
+from src.pnf_contructor.nodes import NodeFactory, InterningNodeFactory, iter_postorder
+from src.pnf_contructor.bitwise import BitwiseEvaluator
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+from benchmarks.bitwise_engine import generate_formula
+
+
+def measure(formula: str, factory_class):
+    lexer = RegexLexer(formula)
+    variables = lexer.get_variables()
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    root = IterativeParser(lexer, factory_class()).parse()
+    parse_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    nodes = sum(1 for _ in iter_postorder(root))
+    start = time.perf_counter()
+    column = BitwiseEvaluator(root, variables).evaluate()
+    evaluate_time = time.perf_counter() - start
+    return parse_time, peak, nodes, evaluate_time, column
+
+
+def main():
+    variables_count = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    table = TruthTable(LogicalFunction(generate_formula(variables_count)))
+    pcnf = table.get_pcnf()
+    print(
+        f"{variables_count} variables, PCNF of {len(table.num_form_pcnf)} clauses, "
+        f"{len(pcnf) / 2**20:.1f} MB of text"
+    )
+
+    print(
+        f"{'factory':>20} {'nodes':>10} {'peak, MB':>10} {'parse, s':>10} "
+        f"{'evaluate, s':>12}"
+    )
+    columns = []
+    for factory_class in (NodeFactory, InterningNodeFactory):
+        parse_time, peak, nodes, evaluate_time, column = measure(pcnf, factory_class)
+        columns.append(column)
+        print(
+            f"{factory_class.__name__:>20} {nodes:>10} {peak / 2**20:>10.1f} "
+            f"{parse_time:>10.3f} {evaluate_time:>12.3f}"
+        )
+    assert columns[0] == columns[1] == table.result_column.to_int()
+
+
+if __name__ == "__main__":
+    main()
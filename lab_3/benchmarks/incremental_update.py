@@ -0,0 +1,84 @@
+# Run from lab_3: python -m benchmarks.incremental_update
+import random
+import sys
+import time
+from string import ascii_lowercase
+
+from src.pnf_contructor.incremental import IncrementalSession
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+
+EDITS_COUNT = 20
+
+
+def random_clauses(variables_count: int, clauses_count: int, seed: int = 0):
+    rng = random.Random(seed)
+    variables = ascii_lowercase[:variables_count]
+    clauses = []
+    for _ in range(clauses_count):
+        literals = rng.sample(variables, 3)
+        clauses.append([rng.choice(["", "!"]) + var for var in literals])
+    return clauses
+
+
+def edit_sequence(variables_count: int, clauses_count: int, seed: int = 0):
+    # One literal is negated (or un-negated) per edit, the way a formula gets
+    # tweaked by hand between runs.
+    rng = random.Random(seed)
+    clauses = random_clauses(variables_count, clauses_count, seed)
+    formulas = []
+    for _ in range(EDITS_COUNT + 1):
+        formulas.append(
+            " & ".join(
+                "(" + " | ".join(literals[:2]) + " > " + literals[2] + ")"
+                for literals in clauses
+            )
+        )
+        literals = rng.choice(clauses)
+        k = rng.randrange(3)
+        literal = literals[k]
+        literals[k] = literal[1:] if literal.startswith("!") else "!" + literal
+    return formulas
+
+
+def main():
+    variables_count = int(sys.argv[1]) if len(sys.argv) > 1 else 18
+    print(
+        f"{variables_count} variables, {EDITS_COUNT} edits, latency per edit "
+        f"from formula text to truth table"
+    )
+    print(
+        f"{'clauses':>8} {'full, ms':>10} {'incremental, ms':>16} "
+        f"{'evaluated':>10} {'reused':>8}"
+    )
+    for clauses_count in (8, 32, 128):
+        formulas = edit_sequence(variables_count, clauses_count)
+
+        start = time.perf_counter()
+        expected = [
+            TruthTable(LogicalFunction(formula)).result_column.to_int()
+            for formula in formulas[1:]
+        ]
+        full_time = (time.perf_counter() - start) / EDITS_COUNT
+
+        session = IncrementalSession()
+        session.update(formulas[0])
+        evaluated = reused = 0
+        start = time.perf_counter()
+        actual = []
+        for formula in formulas[1:]:
+            actual.append(session.update(formula).result_column.to_int())
+            evaluated += session.evaluated
+            reused += session.reused
+        incremental_time = (time.perf_counter() - start) / EDITS_COUNT
+        assert actual == expected
+
+        print(
+            f"{clauses_count:>8} {full_time * 1000:>10.2f} "
+            f"{incremental_time * 1000:>16.2f} {evaluated / EDITS_COUNT:>10.1f} "
+            f"{reused / EDITS_COUNT:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
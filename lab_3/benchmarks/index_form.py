@@ -0,0 +1,56 @@
+# Run from lab_3: python -m benchmarks.index_form
+import time
+
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+from src.pnf_contructor.index_form import IndexForm
+from benchmarks.bitwise_engine import generate_formula
+
+VARIABLE_COUNTS = (10, 16, 20, 24)
+# The old joined-string form is only timed up to this size.
+STRING_FORM_LIMIT = 20
+
+
+def joined_index_form(table: TruthTable) -> str:
+    result = ["0"] * table.rows_count
+    for i in table.num_form_pdnf:
+        result[i] = "1"
+    return "".join(result)
+
+
+def timed(build):
+    start = time.perf_counter()
+    result = build()
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'variables':>10} {'joined, s':>10} {'number, s':>10} {'binary, s':>10} "
+        f"{'hex, s':>8} {'decimal, s':>11} {'load, s':>8}"
+    )
+    for count in VARIABLE_COUNTS:
+        table = TruthTable(LogicalFunction(generate_formula(count)))
+        index_form, number_time = timed(lambda: table.index_form)
+        binary, binary_time = timed(index_form.to_binary)
+        _, hex_time = timed(index_form.to_hex)
+        _, decimal_time = timed(index_form.to_decimal)
+        loaded, load_time = timed(
+            lambda: TruthTable.from_index_form(IndexForm.from_binary(binary))
+        )
+        assert loaded.result_column == table.result_column
+
+        if count <= STRING_FORM_LIMIT:
+            joined, joined_time = timed(lambda: joined_index_form(table))
+            assert joined == binary
+            joined_cell = f"{joined_time:>10.4f}"
+        else:
+            joined_cell = f"{'-':>10}"
+        print(
+            f"{count:>10} {joined_cell} {number_time:>10.4f} {binary_time:>10.4f} "
+            f"{hex_time:>8.4f} {decimal_time:>11.4f} {load_time:>8.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# Run from lab_3: python -m benchmarks.iterative_parser
+import sys
+import time
+
+from src.pnf_contructor.language import RegexLexer
+from src.pnf_contructor.grammar import Parser, IterativeParser
+from benchmarks.regex_lexer import generate_formula
+
+
+def time_parse(parser_class, formula: str) -> float:
+    lexer = RegexLexer(formula)
+    start = time.perf_counter()
+    try:
+        parser_class(lexer).parse()
+    except RecursionError:
+        return None
+    return time.perf_counter() - start
+
+
+def main():
+    cases = [
+        ("flat, 100k chars", generate_formula(100_000, list("abcdefghij"))),
+        ("flat, 1M chars", generate_formula(1_000_000, list("abcdefghij"))),
+        ("nested 300 parens", "(" * 300 + "a | b" + ")" * 300),
+        ("nested 100k parens", "(" * 100_000 + "a | b" + ")" * 100_000),
+        ("100k negations", "!" * 100_000 + "a"),
+    ]
+    print(f"{'input':>20} {'recursive, s':>14} {'iterative, s':>14} {'speedup':>8}")
+    for label, formula in cases:
+        recursive_time = time_parse(Parser, formula)
+        iterative_time = time_parse(IterativeParser, formula)
+        if recursive_time is None:
+            print(
+                f"{label:>20} {'RecursionError':>14} {iterative_time:>14.4f} {'-':>8}"
+            )
+        else:
+            print(
+                f"{label:>20} {recursive_time:>14.4f} {iterative_time:>14.4f} "
+                f"{recursive_time / iterative_time:>7.1f}x"
+            )
+    print(f"(recursion limit {sys.getrecursionlimit()})")
+
+
+if __name__ == "__main__":
+    main()
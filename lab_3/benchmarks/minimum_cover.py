@@ -0,0 +1,56 @@
+# Run from lab_3: python -m benchmarks.minimum_cover
+import random
+import time
+
+from src.pnf_contructor.truth_table import TruthTable
+from src.pnf_contructor.index_form import default_variables
+from src.pnf_contructor.terms import iter_term_rows
+from src.corno.minimizer import Minimizer
+
+VARIABLE_COUNTS = (4, 6, 8, 10, 12)
+FUNCTIONS_COUNT = 5
+
+
+def main():
+    print(
+        f"{'vars':>4} {'primes':>7} {'essential':>10} {'uncovered':>10} "
+        f"{'greedy':>7} {'cover':>6} {'exact':>6} {'cover, s':>9}"
+    )
+    rng = random.Random(0)
+    for count in VARIABLE_COUNTS:
+        for _ in range(FUNCTIONS_COUNT):
+            table = TruthTable(
+                variables=default_variables(count), column=rng.getrandbits(2**count)
+            )
+            minimizer = Minimizer(table)
+            minterms = table.num_form_pdnf
+            primes = Minimizer.prime_implicants(table.iter_pdnf_terms(), count)
+
+            # What the essential implicants alone cover, as
+            # found_unique_implicant used to select.
+            cubes = [set(iter_term_rows(term, count)) for term in primes]
+            essential = set()
+            for minterm in minterms:
+                covering = [i for i, cube in enumerate(cubes) if minterm in cube]
+                if len(covering) == 1:
+                    essential.add(covering[0])
+            covered = set().union(*(cubes[i] for i in essential))
+            uncovered = len(set(minterms) - covered)
+
+            # The greedy cover the search starts from.
+            minimizer.cover_time_budget = 0
+            greedy = len(minimizer.minimum_cover(primes, minterms))
+            minimizer.cover_time_budget = Minimizer.cover_time_budget
+
+            start = time.perf_counter()
+            chosen = minimizer.minimum_cover(primes, minterms)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{count:>4} {len(primes):>7} {len(essential):>10} {uncovered:>10} "
+                f"{greedy:>7} {len(chosen):>6} {str(minimizer.cover_exact):>6} "
+                f"{elapsed:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Run from lab_3: python -m benchmarks.multi_output
+import random
+import time
+
+from src.pnf_contructor.multi_output import MultiOutputTruthTable
+from src.pnf_contructor.index_form import default_variables
+from src.corno.minimizer import Minimizer
+
+# Primes for all outputs come from one pass; the joint chart is a single
+# cover search, bounded by cover_time_budget like that of one output, but
+# harder than each output's own, so from 10 variables it may use it up.
+VARIABLE_COUNTS = (4, 6, 8, 10)
+OUTPUTS = 4
+TABLES = 5
+# The functions share structure, as the outputs of one circuit do: each
+# output is a random mix of a few common cubes and some noise.
+COMMON_CUBES = 6
+NOISE = 0.05
+
+
+def random_table(variables_count: int, rng: random.Random) -> MultiOutputTruthTable:
+    rows_count = 2**variables_count
+    cubes = []
+    for _ in range(COMMON_CUBES):
+        mask = rng.getrandbits(variables_count) | 1 << rng.randrange(variables_count)
+        value = rng.getrandbits(variables_count) & mask
+        cubes.append(sum(1 << i for i in range(rows_count) if i & mask == value))
+    columns = []
+    for _ in range(OUTPUTS):
+        column = 0
+        for cube in cubes:
+            if rng.random() < 0.5:
+                column |= cube
+        column ^= sum(1 << i for i in range(rows_count) if rng.random() < NOISE)
+        columns.append(column)
+    return MultiOutputTruthTable(default_variables(variables_count), columns)
+
+
+def main():
+    print(
+        f"{'vars':>4} {'separate products':>18} {'joint products':>15} "
+        f"{'separate, s':>12} {'joint, s':>9}"
+    )
+    rng = random.Random(0)
+    for count in VARIABLE_COUNTS:
+        separate_products = joint_products = 0
+        separate_time = joint_time = 0.0
+        for _ in range(TABLES):
+            table = random_table(count, rng)
+            minimizer = Minimizer(table)
+
+            start = time.perf_counter()
+            distinct = set()
+            for k in range(OUTPUTS):
+                primes, chosen = minimizer.for_output(k).get_minimal_implicants(
+                    True, False
+                )
+                distinct |= {tuple(primes[i]) for i in chosen}
+            separate_time += time.perf_counter() - start
+            separate_products += len(distinct)
+
+            start = time.perf_counter()
+            products, _ = minimizer.get_joint_cover(True)
+            joint_time += time.perf_counter() - start
+            joint_products += len(products)
+
+        print(
+            f"{count:>4} {separate_products:>18} {joint_products:>15} "
+            f"{separate_time:>12.3f} {joint_time:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Run from lab_3: python -m benchmarks.nary_operators
+import time
+from typing import Dict
+
+from src.pnf_contructor.language import RegexLexer
+from src.pnf_contructor.grammar import IterativeParser
+from src.pnf_contructor.nodes import ExpressionNode, NodeFactory, iter_postorder
+from src.pnf_contructor.bitwise import BitwiseEvaluator
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+from benchmarks.bitwise_engine import generate_formula
+
+REPEATS = 3
+
+
+def to_binary_chains(root: ExpressionNode) -> ExpressionNode:
+    # The left-deep binary tree the parser used to build for every chain.
+    factory = NodeFactory()
+    nodes: Dict[int, ExpressionNode] = {}
+    for node in iter_postorder(root):
+        operands = [nodes[id(operand)] for operand in node.operands]
+        if len(operands) == 0:
+            nodes[id(node)] = node
+        elif len(operands) == 1:
+            nodes[id(node)] = factory.unary(node.opr, operands[0])
+        else:
+            left = operands[0]
+            for right in operands[1:]:
+                left = factory.binary(left, node.opr, right)
+            nodes[id(node)] = left
+    return nodes[id(root)]
+
+
+def depth(root: ExpressionNode) -> int:
+    depths: Dict[int, int] = {}
+    for node in iter_postorder(root):
+        depths[id(node)] = 1 + max(
+            (depths[id(operand)] for operand in node.operands), default=0
+        )
+    return depths[id(root)]
+
+
+def best_time(action) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def build_corpus():
+    corpus = []
+    for variables_count in (10, 12, 14):
+        table = TruthTable(LogicalFunction(generate_formula(variables_count)))
+        corpus.append((f"PDNF, {variables_count} vars", table.get_pdnf()))
+    for variables_count in (16, 20):
+        variables = [chr(ord("a") + k) for k in range(variables_count)]
+        corpus.append((f"XOR parity, {variables_count}", " ^ ".join(variables)))
+    return corpus
+
+
+def main():
+    print(
+        f"{'formula':>22} {'nodes':>8} {'depth':>8} {'n-ary, ms':>10} "
+        f"{'depth':>8} {'binary, ms':>11}"
+    )
+    for name, formula in build_corpus():
+        lexer = RegexLexer(formula)
+        variables = lexer.get_variables()
+        nary = IterativeParser(lexer).parse()
+        binary = to_binary_chains(nary)
+
+        columns = []
+        times = []
+        for root in (nary, binary):
+            evaluator = BitwiseEvaluator(root, variables)
+            times.append(best_time(evaluator.evaluate))
+            columns.append(evaluator.evaluate())
+        assert columns[0] == columns[1]
+        nodes = sum(1 for _ in iter_postorder(nary))
+        print(
+            f"{name:>22} {nodes:>8} {depth(nary):>8} {times[0] * 1000:>10.2f} "
+            f"{depth(binary):>8} {times[1] * 1000:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Run from lab_3: python -m benchmarks.optimizer
+import time
+
+from src.pnf_contructor.nodes import iter_postorder
+from src.pnf_contructor.bitwise import BitwiseEvaluator
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+from benchmarks.bitwise_engine import generate_formula
+
+# Row-by-row throughput is measured on the first rows only.
+SAMPLE_ROWS = 2**14
+REPEATS = 3
+
+
+def build_corpus():
+    corpus = []
+    for variables_count in (12, 16, 20):
+        formula = generate_formula(variables_count)
+        corpus.append((f"generated, {variables_count} vars", formula))
+        # The shapes hand-written and generated formulas pick up: double
+        # negations, constant operands, repeated and absorbed subformulas.
+        corpus.append(
+            (
+                f"redundant, {variables_count} vars",
+                f"!!({formula}) & (a | !a) & (({formula}) | b) & (1 | c) "
+                f"| 0 & d | ({formula}) & ({formula})",
+            )
+        )
+    table = TruthTable(LogicalFunction(generate_formula(12)))
+    corpus.append(("PCNF, 12 vars", table.get_pcnf()))
+    corpus.append(("PDNF, 12 vars", table.get_pdnf()))
+    return corpus
+
+
+def best_time(action) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(function: LogicalFunction):
+    nodes = sum(1 for _ in iter_postorder(function.ast))
+    evaluator = BitwiseEvaluator(function.ast, function.variables)
+    column_time = best_time(evaluator.evaluate)
+
+    try:
+        evaluate_index = function.eval_index
+    except RecursionError:
+        # Unflattened normal forms nest too deep for the Python compiler.
+        return nodes, column_time, None, evaluator.evaluate()
+    rows = range(min(SAMPLE_ROWS, 2 ** len(function.variables)))
+    rows_time = best_time(lambda: [evaluate_index(i) for i in rows])
+    return nodes, column_time, len(rows) / rows_time, evaluator.evaluate()
+
+
+def format_rate(rate) -> str:
+    return "too deep" if rate is None else f"{rate:.0f}"
+
+
+def main():
+    print(f"{'formula':>22} {'nodes':>15} {'column, ms':>19} {'rows/s':>23}")
+    print(
+        f"{'':>22} {'before':>7} {'after':>7} {'before':>9} {'after':>9} "
+        f"{'before':>11} {'after':>11}"
+    )
+    for name, formula in build_corpus():
+        before = measure(LogicalFunction(formula, optimize=False))
+        after = measure(LogicalFunction(formula))
+        assert before[3] == after[3]
+        print(
+            f"{name:>22} {before[0]:>7} {after[0]:>7} "
+            f"{before[1] * 1000:>9.2f} {after[1] * 1000:>9.2f} "
+            f"{format_rate(before[2]):>11} {format_rate(after[2]):>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# Run from lab_3: python -m benchmarks.packed_storage
+import time
+import tracemalloc
+from string import ascii_lowercase
+
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+
+VARIABLE_COUNTS = (12, 16, 18, 20)
+
+
+def generate_formula(variables_count: int) -> str:
+    variables = ascii_lowercase[:variables_count]
+    pairs = [
+        f"({variables[i]} > {variables[i + 1]})"
+        for i in range(0, variables_count - 1, 2)
+    ]
+    return " & ".join(pairs) + f" | {variables[-1]}"
+
+
+def measure(build) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    print(
+        f"{'vars':>4} {'list rows, B/row':>18} {'packed, B/row':>15} {'ratio':>8} {'packed build, s':>16}"
+    )
+    for count in VARIABLE_COUNTS:
+        function = LogicalFunction(generate_formula(count))
+        table, elapsed, packed_peak = measure(lambda: TruthTable(function))
+        # The previous representation: one Python list per row plus the
+        # num_form_pdnf/num_form_pcnf index lists.
+        _, _, list_peak = measure(
+            lambda: (list(table.table), table.num_form_pdnf, table.num_form_pcnf)
+        )
+        rows_count = 2**count
+        print(
+            f"{count:>4} {list_peak / rows_count:>18.1f} {packed_peak / rows_count:>15.3f} "
+            f"{list_peak / packed_peak:>7.0f}x {elapsed:>16.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
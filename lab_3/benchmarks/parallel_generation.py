@@ -0,0 +1,39 @@
+# Run from lab_3: python -m benchmarks.parallel_generation [max_workers]
+import os
+import sys
+import time
+
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+from benchmarks.bitwise_engine import generate_formula
+
+CASES = (("rows", 20), ("bitwise", 24))
+
+
+def time_table(function: LogicalFunction, backend: str, workers: int) -> tuple:
+    start = time.perf_counter()
+    table = TruthTable(function, backend=backend, workers=workers)
+    return time.perf_counter() - start, table.result_column
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    print(f"{os.cpu_count()} CPUs, up to {max_workers} workers")
+    print(
+        f"{'backend':>8} {'variables':>10} {'workers':>8} {'time, s':>9} {'speedup':>8}"
+    )
+    for backend, count in CASES:
+        function = LogicalFunction(generate_formula(count))
+        serial_time, serial_column = time_table(function, backend, 1)
+        print(f"{backend:>8} {count:>10} {1:>8} {serial_time:>9.3f} {1:>7.1f}x")
+        for workers in range(2, max_workers + 1):
+            parallel_time, column = time_table(function, backend, workers)
+            assert column == serial_column
+            print(
+                f"{backend:>8} {count:>10} {workers:>8} {parallel_time:>9.3f} "
+                f"{serial_time / parallel_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
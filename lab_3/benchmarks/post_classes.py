@@ -0,0 +1,58 @@
+# Run from lab_3: python -m benchmarks.post_classes
+import time
+
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+from src.pnf_contructor.post_classes import PostClassAnalyzer
+from benchmarks.bitwise_engine import generate_formula
+
+VARIABLE_COUNTS = (10, 16, 20, 24)
+# Row loops are only timed up to this size.
+ROWS_LIMIT = 16
+
+
+def row_loop_checks(table: TruthTable) -> tuple:
+    # Self-duality, monotonicity (over neighbouring rows) and essential
+    # variables the way they are written against table rows.
+    count = len(table.variables)
+    values = [table.get_result(i) for i in range(table.rows_count)]
+    full = table.rows_count - 1
+    self_dual = all(values[i] != values[full - i] for i in range(table.rows_count))
+    monotone, essential = True, []
+    for k, var in enumerate(table.variables):
+        bit = 1 << (count - 1 - k)
+        differs = False
+        for i in range(table.rows_count):
+            if not i & bit:
+                if values[i] > values[i | bit]:
+                    monotone = False
+                if values[i] != values[i | bit]:
+                    differs = True
+        if differs:
+            essential.append(var)
+    return self_dual, monotone, essential
+
+
+def main():
+    print(f"{'variables':>10} {'row loops, s':>13} {'bitwise, s':>11} {'classes':>30}")
+    for count in VARIABLE_COUNTS:
+        table = TruthTable(LogicalFunction(generate_formula(count)))
+        start = time.perf_counter()
+        analyzer = PostClassAnalyzer(table)
+        classes = analyzer.post_classes()
+        essential = analyzer.essential_variables()
+        bitwise_time = time.perf_counter() - start
+
+        if count <= ROWS_LIMIT:
+            start = time.perf_counter()
+            expected = row_loop_checks(table)
+            rows_cell = f"{time.perf_counter() - start:>13.3f}"
+            assert expected == (classes["S"], classes["M"], essential)
+        else:
+            rows_cell = f"{'-':>13}"
+        members = " ".join(name for name, inside in classes.items() if inside) or "-"
+        print(f"{count:>10} {rows_cell} {bitwise_time:>11.4f} {members:>30}")
+
+
+if __name__ == "__main__":
+    main()
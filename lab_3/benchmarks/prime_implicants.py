@@ -0,0 +1,55 @@
+# Run from lab_3: python -m benchmarks.prime_implicants
+import random
+import time
+
+from src.pnf_contructor.truth_table import TruthTable
+from src.pnf_contructor.index_form import default_variables
+from src.corno.minimizer import Minimizer
+
+VARIABLE_COUNTS = (8, 10, 12, 14, 16)
+DENSITIES = (0.5, 0.9)
+# merge_groups scans its groups pairwise and its result lists linearly: at
+# 11 variables and 90% ones it already takes over a minute.
+MERGE_GROUPS_LIMIT = 10
+
+
+def random_column(variables_count: int, density: float, rng: random.Random) -> int:
+    return sum(1 << i for i in range(2**variables_count) if rng.random() < density)
+
+
+def main():
+    print(
+        f"{'vars':>4} {'ones':>5} {'minterms':>9} {'primes':>7} "
+        f"{'merge_groups, s':>16} {'bitmask, s':>11}"
+    )
+    rng = random.Random(0)
+    for density in DENSITIES:
+        for count in VARIABLE_COUNTS:
+            table = TruthTable(
+                variables=default_variables(count),
+                column=random_column(count, density, rng),
+            )
+
+            start = time.perf_counter()
+            primes = Minimizer.prime_implicants(table.iter_pdnf_terms(), count)
+            bitmask_time = time.perf_counter() - start
+
+            merge_groups_time = "-"
+            if count <= MERGE_GROUPS_LIMIT:
+                start = time.perf_counter()
+                expected = Minimizer.merge_groups(
+                    table.group_pdnf(), display_merging=False
+                )
+                merge_groups_time = f"{time.perf_counter() - start:.3f}"
+                assert sorted(map(Minimizer.implicant_to_term, expected)) == sorted(
+                    primes
+                )
+
+            print(
+                f"{count:>4} {density:>5.0%} {len(table.num_form_pdnf):>9} "
+                f"{len(primes):>7} {merge_groups_time:>16} {bitmask_time:>11.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Run from lab_3: python -m benchmarks.regex_lexer
+import random
+import time
+
+from src.pnf_contructor.language import Lexer, RegexLexer, EOF
+
+FORMULA_LENGTH = 100_000
+
+
+def generate_formula(length: int, variables: list, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    while size < length:
+        part = f"({rng.choice(['', '!'])}{rng.choice(variables)} {rng.choice('&|>~')} {rng.choice(variables)})"
+        parts.append(part)
+        size += len(part) + 3
+    return " | ".join(parts)
+
+
+def drain(lexer) -> int:
+    count = 0
+    while lexer.get_next_token().type != EOF:
+        count += 1
+    return count
+
+
+def main():
+    print(
+        f"{'formula':>26} {'tokens':>8} {'char lexer, s':>14} {'regex lexer, s':>15} {'speedup':>8}"
+    )
+    single = generate_formula(FORMULA_LENGTH, list("abcdefghij"))
+    multi = generate_formula(FORMULA_LENGTH, [f"x_{i}" for i in range(40)])
+    for label, formula in (
+        ("100k chars, single-letter", single),
+        ("100k chars, x_N names", multi),
+    ):
+        start = time.perf_counter()
+        regex_tokens = drain(RegexLexer(formula))
+        regex_time = time.perf_counter() - start
+
+        if label.endswith("single-letter"):
+            start = time.perf_counter()
+            char_tokens = drain(Lexer(formula))
+            char_time = time.perf_counter() - start
+            assert char_tokens == regex_tokens
+            print(
+                f"{label:>26} {regex_tokens:>8} {char_time:>14.4f} {regex_time:>15.4f} "
+                f"{char_time / regex_time:>7.1f}x"
+            )
+        else:
+            # The character lexer cannot tokenize multi-character names.
+            print(
+                f"{label:>26} {regex_tokens:>8} {'-':>14} {regex_time:>15.4f} {'-':>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# Run from lab_3: python -m benchmarks.table_file
+import os
+import random
+import tempfile
+import time
+
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+from src.pnf_contructor.table_file import TableFile
+from benchmarks.bitwise_engine import generate_formula
+
+VARIABLE_COUNTS = (16, 20, 24)
+QUERIES_COUNT = 10_000
+
+
+def main():
+    print(
+        f"{'vars':>4} {'file, MB':>9} {'evaluate, s':>12} {'save, s':>8} "
+        f"{'open, ms':>9} {'queries, ms':>12}"
+    )
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        for count in VARIABLE_COUNTS:
+            path = os.path.join(directory, f"table_{count}.ttbl")
+            start = time.perf_counter()
+            table = TruthTable(LogicalFunction(generate_formula(count)))
+            evaluate_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            table.save(path)
+            save_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with TableFile(path) as table_file:
+                loaded = TruthTable(table_file=table_file)
+                open_time = time.perf_counter() - start
+
+                indexes = [
+                    rng.randrange(table.rows_count) for _ in range(QUERIES_COUNT)
+                ]
+                start = time.perf_counter()
+                results = [loaded.get_result(i) for i in indexes]
+                query_time = time.perf_counter() - start
+                assert results == [table.get_result(i) for i in indexes]
+                del loaded
+
+            print(
+                f"{count:>4} {os.path.getsize(path) / 2**20:>9.2f} "
+                f"{evaluate_time:>12.3f} {save_time:>8.3f} "
+                f"{open_time * 1000:>9.3f} {query_time * 1000:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
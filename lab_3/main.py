@@ -1,5 +1,4 @@
-from src.pnf_contructor.truth_table import TruthTable
-from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.incremental import IncrementalSession
 from src.corno.minimizer import Minimizer
 from colorama import init, Fore, Style
 
@@ -34,12 +33,13 @@ def print_minimization_results(minimizer: Minimizer, function_str: str):
 
     print("\n" + Fore.GREEN + "1. Perfect Normal Forms:" + Style.RESET_ALL)
     print("-" * 40)
-    print(
-        Fore.YELLOW + "PCNF:" + Style.RESET_ALL,
-        minimizer.truth_table.get_pcnf(),
-        end="\n\n",
-    )
-    print(Fore.YELLOW + "PDNF:" + Style.RESET_ALL, minimizer.truth_table.get_pdnf())
+    # The perfect forms are written term by term instead of joined first.
+    print(Fore.YELLOW + "PCNF:" + Style.RESET_ALL, end=" ")
+    minimizer.truth_table.write_pcnf()
+    print(end="\n\n")
+    print(Fore.YELLOW + "PDNF:" + Style.RESET_ALL, end=" ")
+    minimizer.truth_table.write_pdnf()
+    print()
     print("-" * 40)
 
     print("\n" + Fore.GREEN + "2. Minimization Results:" + Style.RESET_ALL)
@@ -80,6 +80,8 @@ def print_minimization_results(minimizer: Minimizer, function_str: str):
 
 def main():
     print_header()
+    # Columns of the subformulas an edit leaves unchanged are reused.
+    session = IncrementalSession()
 
     while True:
         function_str = input("\nEnter logical expression> ")
@@ -93,8 +95,7 @@ def main():
             continue
 
         try:
-            function = LogicalFunction(function_str)
-            table = TruthTable(function)
+            table = session.update(function_str)
             minimizer = Minimizer(table)
 
             print_minimization_results(minimizer, function_str)
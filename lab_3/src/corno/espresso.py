@@ -0,0 +1,268 @@
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from src.pnf_contructor.terms import Term
+
+# A cube holds two bits per variable, at positions 2p and 2p + 1 for the
+# variable at term bit p: 01 means the variable is 0, 10 that it is 1, 11
+# that it does not appear and 00 that the cube is empty. Intersection is &,
+# the smallest cube containing two cubes is |, and a cover is a list of
+# cubes.
+ZERO, ONE, BOTH = 0b01, 0b10, 0b11
+Cube = int
+
+
+class EspressoMinimizer:
+    # Heuristic two-level minimization in the spirit of Espresso: the cover
+    # is expanded into primes against the off-set, made irredundant, then
+    # reduced and expanded again while the cost (cubes, then literals) keeps
+    # going down. Nothing here enumerates minterms, so the size of the input
+    # cover matters, not the number of variables, and neither the off-set
+    # nor any other complement is ever listed: a cube may grow while the
+    # function still covers it, which is a tautology check.
+    def __init__(
+        self,
+        on_set: Iterable[Term],
+        variables_count: int,
+        dont_cares: Iterable[Term] = (),
+    ):
+        self.variables_count = variables_count
+        self.full = (1 << 2 * variables_count) - 1
+        # The low bit of every pair.
+        self.low = self.full // 3
+        self.on_set = [self.to_cube(term) for term in on_set]
+        self.dont_cares = [self.to_cube(term) for term in dont_cares]
+
+    # ------------------------------------------------------------
+    # --------------------------- CUBES ---------------------------
+    # ------------------------------------------------------------
+    def to_cube(self, term: Term) -> Cube:
+        value, mask = term
+        cube = 0
+        for p in range(self.variables_count):
+            if not (mask >> p) & 1:
+                cube |= BOTH << 2 * p
+            elif (value >> p) & 1:
+                cube |= ONE << 2 * p
+            else:
+                cube |= ZERO << 2 * p
+        return cube
+
+    def to_term(self, cube: Cube) -> Term:
+        value = mask = 0
+        for p in range(self.variables_count):
+            pair = (cube >> 2 * p) & BOTH
+            if pair != BOTH:
+                mask |= 1 << p
+                if pair == ONE:
+                    value |= 1 << p
+        return value, mask
+
+    def is_empty(self, cube: Cube) -> bool:
+        return (cube | cube >> 1) & self.low != self.low
+
+    def literals(self, cube: Cube) -> int:
+        return self.variables_count - (cube & cube >> 1 & self.low).bit_count()
+
+    def cost(self, cover: Sequence[Cube]) -> Tuple[int, int]:
+        return len(cover), sum(self.literals(cube) for cube in cover)
+
+    def cofactor(self, cover: Sequence[Cube], cube: Cube) -> List[Cube]:
+        # The part of the cover inside the cube, with the cube's literals
+        # dropped.
+        rest = self.full & ~cube
+        return [c | rest for c in cover if not self.is_empty(c & cube)]
+
+    def literal_columns(self, cover: Sequence[Cube]) -> Tuple[int, int]:
+        # Low pair bits of the variables some cube needs at 0 and at 1.
+        zeros = ones = 0
+        for c in cover:
+            zeros |= ~c >> 1
+            ones |= ~c
+        return zeros & self.low, ones & self.low
+
+    def split_variable(self, cover: Sequence[Cube], candidates: int) -> int:
+        # Of the candidate variables (low pair bits), the one with a literal
+        # in the most cubes.
+        counts: Dict[int, int] = {}
+        for c in cover:
+            # A low pair bit is clear in c & c >> 1 when c has the literal.
+            bits = candidates & ~(c & c >> 1)
+            while bits:
+                low = bits & -bits
+                counts[low] = counts.get(low, 0) + 1
+                bits ^= low
+        return (max(counts, key=counts.get).bit_length() - 1) // 2
+
+    # ------------------------------------------------------------
+    # ------------------------ TAUTOLOGY -------------------------
+    # ------------------------------------------------------------
+    def tautology(self, cover: Sequence[Cube]) -> bool:
+        while True:
+            if not cover:
+                return False
+            if self.full in cover:
+                return True
+            zeros, ones = self.literal_columns(cover)
+            unate = zeros ^ ones
+            if unate:
+                # A cube with a literal of a unate variable never helps to
+                # cover the other side of it.
+                unate_pairs = unate | unate << 1
+                reduced = [c for c in cover if ~c & unate_pairs == 0]
+                if len(reduced) < len(cover):
+                    cover = reduced
+                    continue
+            binate = zeros & ones
+            if not binate:
+                return False
+            # Cubes that hold fewer minterms in all than the space cannot
+            # fill it.
+            volume = sum(1 << (c & c >> 1 & self.low).bit_count() for c in cover)
+            if volume < 1 << self.variables_count:
+                return False
+            p = self.split_variable(cover, binate)
+            one = self.full & ~(ZERO << 2 * p)
+            zero = self.full & ~(ONE << 2 * p)
+            return self.tautology(self.cofactor(cover, one)) and self.tautology(
+                self.cofactor(cover, zero)
+            )
+
+    def covers(self, cover: Sequence[Cube], cube: Cube) -> bool:
+        return self.tautology(self.cofactor(cover, cube))
+
+    # ------------------------------------------------------------
+    # ------------------------ COMPLEMENT ------------------------
+    # ------------------------------------------------------------
+    def complement_supercube(self, cover: Sequence[Cube]) -> Cube:
+        # The smallest cube containing the complement of the cover, 0 when
+        # the cover is a tautology, found without listing the complement.
+        if not cover:
+            return self.full
+        if self.full in cover:
+            return 0
+        if len(cover) == 1:
+            # De Morgan: one cube per literal, with the literal flipped.
+            (cube,) = cover
+            result = 0
+            for p in range(self.variables_count):
+                pair = (cube >> 2 * p) & BOTH
+                if pair != BOTH:
+                    result |= self.full & ~(pair << 2 * p)
+            return result
+
+        zeros, ones = self.literal_columns(cover)
+        unate = zeros ^ ones
+        if unate:
+            # With x only ever a literal, the complement where x holds lies
+            # inside the complement where it does not, so one branch and a
+            # tautology check do.
+            low = unate & -unate
+            p = (low.bit_length() - 1) // 2
+            literal = ONE if ones & low else ZERO
+            literal_cube = self.full & ~((BOTH ^ literal) << 2 * p)
+            opposite_cube = self.full & ~(literal << 2 * p)
+            supercube = self.complement_supercube(self.cofactor(cover, opposite_cube))
+            if not supercube:
+                return 0
+            supercube &= opposite_cube
+            if not self.tautology(self.cofactor(cover, literal_cube)):
+                supercube |= BOTH << 2 * p
+            return supercube
+
+        p = self.split_variable(cover, zeros & ones)
+        one_literal = self.full & ~(ZERO << 2 * p)
+        zero_literal = self.full & ~(ONE << 2 * p)
+        return (
+            self.complement_supercube(self.cofactor(cover, one_literal)) & one_literal
+        ) | (
+            self.complement_supercube(self.cofactor(cover, zero_literal)) & zero_literal
+        )
+
+    # ------------------------------------------------------------
+    # ------------------------ OPERATIONS ------------------------
+    # ------------------------------------------------------------
+    def remove_contained(self, cover: Sequence[Cube]) -> List[Cube]:
+        result: List[Cube] = []
+        for cube in sorted(set(cover), key=self.literals):
+            if not any(cube & ~other == 0 for other in result):
+                result.append(cube)
+        return result
+
+    def expand(self, cover: Sequence[Cube], function: Sequence[Cube]) -> List[Cube]:
+        # Every cube is grown literal by literal as long as the function (the
+        # on-set and the don't-cares) still covers it; the largest cubes go
+        # first and every cube they swallow is
+        # dropped. Literals whose opposite is common in the cover are raised
+        # first, as that is where the other cubes are.
+        zero_counts = [0] * self.variables_count
+        one_counts = [0] * self.variables_count
+        for cube in cover:
+            for p in range(self.variables_count):
+                pair = (cube >> 2 * p) & BOTH
+                if pair == ZERO:
+                    zero_counts[p] += 1
+                elif pair == ONE:
+                    one_counts[p] += 1
+
+        expanded: List[Cube] = []
+        for cube in sorted(cover, key=self.literals):
+            if any(cube & ~other == 0 for other in expanded):
+                continue
+            positions = [
+                p for p in range(self.variables_count) if (cube >> 2 * p) & BOTH != BOTH
+            ]
+            positions.sort(
+                key=lambda p: -(
+                    one_counts[p] if (cube >> 2 * p) & BOTH == ZERO else zero_counts[p]
+                )
+            )
+            for p in positions:
+                # The cube is covered already, so only the half it gains
+                # needs checking.
+                gained = cube ^ BOTH << 2 * p
+                if self.covers(function, gained):
+                    cube |= gained
+            expanded = [other for other in expanded if other & ~cube != 0]
+            expanded.append(cube)
+        return expanded
+
+    def irredundant(
+        self, cover: Sequence[Cube], dont_cares: Sequence[Cube]
+    ) -> List[Cube]:
+        # Cubes covered by the rest go, the smallest first.
+        result = list(cover)
+        for cube in sorted(cover, key=lambda c: -self.literals(c)):
+            others = [c for c in result if c != cube]
+            if self.covers(others + list(dont_cares), cube):
+                result = others
+        return result
+
+    def reduce(self, cover: Sequence[Cube], dont_cares: Sequence[Cube]) -> List[Cube]:
+        # Every cube shrinks to the smallest cube holding the minterms only
+        # it covers, so the next expansion may grow it another way.
+        result: List[Cube] = []
+        pending = sorted(cover, key=self.literals)
+        for i, cube in enumerate(pending):
+            others = result + pending[i + 1 :] + list(dont_cares)
+            supercube = self.complement_supercube(self.cofactor(others, cube))
+            if supercube:
+                result.append(cube & supercube)
+        return result
+
+    def minimize(self) -> List[Term]:
+        on_set = self.remove_contained(self.on_set)
+        if not on_set:
+            return []
+        function = on_set + self.dont_cares
+        cover = self.irredundant(self.expand(on_set, function), self.dont_cares)
+        cost = self.cost(cover)
+        while True:
+            reduced = self.reduce(cover, self.dont_cares)
+            candidate = self.irredundant(
+                self.expand(reduced, function), self.dont_cares
+            )
+            candidate_cost = self.cost(candidate)
+            if candidate_cost >= cost:
+                break
+            cover, cost = candidate, candidate_cost
+        return sorted(self.to_term(cube) for cube in cover)
@@ -1,15 +1,83 @@
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional, Union
 from tabulate import tabulate
 from itertools import product
 
-from src.pnf_contructor.truth_table import TruthTable
+from src.pnf_contructor.truth_table import DONT_CARE, TruthTable
+from src.pnf_contructor.multi_output import MultiOutputTruthTable
+from src.pnf_contructor.terms import Term, iter_term_rows, terms_to_column
+from src.pnf_contructor.gray import gray_sequence
+from src.corno.cover import CoverSolver, iter_bits
+from src.corno.espresso import EspressoMinimizer
 
 
 class Minimizer:
-    def __init__(self, truth_table: TruthTable) -> None:
-        self.truth_table = truth_table
+    methods = {
+        "computational": "computational_minimization",
+        "computational_table": "computational_table_minimization",
+        "karnaugh": "karnaugh_map_minimization",
+        "espresso": "espresso_minimization",
+    }
+    # Seconds the exact cover may search before it settles for the best
+    # cover found so far; None for no limit.
+    cover_time_budget: Optional[float] = 5.0
+
+    def __init__(
+        self, truth_table: Union[TruthTable, MultiOutputTruthTable]
+    ) -> None:
+        # A multi-output table is minimized output by output with
+        # minimize_outputs; the single-output methods see its first output.
+        # Checked by attribute, as the table class can be imported under more
+        # than one package path.
+        if hasattr(truth_table, "outputs"):
+            self.multi_output_table = truth_table
+            self.truth_table = truth_table.output(0)
+        else:
+            self.multi_output_table = None
+            self.truth_table = truth_table
         self.variables = self.truth_table.variables
         self.variables_count = len(self.variables)
+        # Work that depends on the variables only, shared with the minimizers
+        # of the other outputs.
+        self.shared: Dict[str, object] = {}
+        # Whether the last cover was proved minimal within the time budget.
+        self.cover_exact = True
+        # After minimize_jointly: every product used by several outputs,
+        # with the names of those outputs.
+        self.shared_terms: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_terms(
+        cls, terms: Iterable[Term], variables: List[str], is_pdnf: bool = True
+    ) -> "Minimizer":
+        # (value, mask) terms of a DNF (or a CNF) straight into a truth table,
+        # without writing the formula out and parsing it back.
+        column = terms_to_column(terms, len(variables), is_pdnf)
+        return cls(TruthTable(variables=variables, column=column))
+
+    def for_output(self, output: Union[int, str]) -> "Minimizer":
+        if self.multi_output_table is None:
+            raise ValueError("Minimizer was not given a multi-output table")
+        minimizer = Minimizer(self.multi_output_table.output(output))
+        minimizer.shared = self.shared
+        return minimizer
+
+    def minimize_outputs(
+        self, method: str = "karnaugh", *, is_pdnf: bool, **options
+    ) -> Dict[str, str]:
+        if method not in Minimizer.methods:
+            raise ValueError(f"Unknown minimization method: {method}")
+        if self.multi_output_table is None:
+            outputs = [self.truth_table.result_header]
+            minimizers = [self]
+        else:
+            outputs = self.multi_output_table.outputs
+            minimizers = [self.for_output(output) for output in outputs]
+        return {
+            output: getattr(minimizer, Minimizer.methods[method])(
+                is_pdnf=is_pdnf, **options
+            )
+            for output, minimizer in zip(outputs, minimizers)
+        }
 
     # ------------------------------------------------------------
     # -------------------------- MERGING --------------------------
@@ -115,6 +183,366 @@ class Minimizer:
             for x, y in zip(first_constituent, second_constituent)
         )
 
+    # ------------------------------------------------------------
+    # ---------------------- BITMASK MERGING ----------------------
+    # ------------------------------------------------------------
+    @staticmethod
+    def term_to_implicant(term: Term, variables_count: int) -> List:
+        value, mask = term
+        return [
+            (value >> (variables_count - 1 - k)) & 1
+            if (mask >> (variables_count - 1 - k)) & 1
+            else "*"
+            for k in range(variables_count)
+        ]
+
+    @staticmethod
+    def implicant_to_term(implicant: List) -> Term:
+        value = mask = 0
+        for el in implicant:
+            value <<= 1
+            mask <<= 1
+            if el != "*":
+                value |= el
+                mask |= 1
+        return value, mask
+
+    @staticmethod
+    def prime_implicants(
+        terms: Iterable[Term],
+        variables_count: int,
+        display_merging: bool = False,
+        dont_cares: Iterable[Term] = (),
+    ) -> List[Term]:
+        # The same primes as merge_groups, with a cube kept as (value, mask).
+        # Cubes sit in buckets by (mask, number of ones): only a cube of
+        # bucket (mask, ones) and one of (mask, ones + 1) can merge, and only
+        # when they differ in a single cared bit, so instead of testing
+        # x ^ y against every cube of the next bucket, the one possible
+        # partner per bit is looked up in its set.
+        level: Dict[Tuple[int, int], set] = {}
+        for value, mask in terms:
+            value &= mask
+            level.setdefault((mask, value.bit_count()), set()).add(value)
+        # Don't-cares merge like the terms, but a prime made of them alone is
+        # of no use: the cubes holding some term are tracked apart. None when
+        # there are no don't-cares and every cube holds a term.
+        required: Optional[Dict[Tuple[int, int], set]] = None
+        dont_cares = list(dont_cares)
+        if dont_cares:
+            required = {key: set(values) for key, values in level.items()}
+            for value, mask in dont_cares:
+                value &= mask
+                level.setdefault((mask, value.bit_count()), set()).add(value)
+        if display_merging:
+            Minimizer.print_terms(level, variables_count)
+
+        primes = []
+        while level:
+            merged_level: Dict[Tuple[int, int], set] = {}
+            merged_required: Dict[Tuple[int, int], set] = {}
+            used: Dict[Tuple[int, int], set] = {key: set() for key in level}
+            for (mask, ones), values in level.items():
+                uppers = level.get((mask, ones + 1))
+                if not uppers:
+                    continue
+                used_lowers, used_uppers = used[mask, ones], used[mask, ones + 1]
+                # The merged cubes of every cared bit, kept by the lower cube.
+                merged = {
+                    1 << k: merged_level.setdefault((mask ^ (1 << k), ones), set())
+                    for k in range(variables_count)
+                    if (mask >> k) & 1
+                }
+                if required is not None:
+                    required_lowers = required.get((mask, ones), set())
+                    required_uppers = required.get((mask, ones + 1), set())
+                    merged_required_values = {
+                        bit: merged_required.setdefault((mask ^ bit, ones), set())
+                        for bit in merged
+                    }
+                for value in values:
+                    for bit, merged_values in merged.items():
+                        if not value & bit and value | bit in uppers:
+                            merged_values.add(value)
+                            used_lowers.add(value)
+                            used_uppers.add(value | bit)
+                            if required is not None and (
+                                value in required_lowers
+                                or value | bit in required_uppers
+                            ):
+                                merged_required_values[bit].add(value)
+            for (mask, ones), values in level.items():
+                unused = values - used[mask, ones]
+                if required is not None:
+                    unused &= required.get((mask, ones), set())
+                primes.extend((value, mask) for value in unused)
+            merged_level = {
+                key: values for key, values in merged_level.items() if values
+            }
+            if merged_level and display_merging:
+                Minimizer.print_terms(merged_level, variables_count)
+            level = merged_level
+            if required is not None:
+                required = merged_required
+
+        # A fixed order, so the minimized forms do not depend on set order:
+        # by the number of ones, then position by position with 0 < 1 < *.
+        return sorted(
+            primes,
+            key=lambda term: (
+                term[0].bit_count(),
+                [
+                    2 if el == "*" else el
+                    for el in Minimizer.term_to_implicant(term, variables_count)
+                ],
+            ),
+        )
+
+    @staticmethod
+    def print_terms(level: Dict[Tuple[int, int], set], variables_count: int) -> None:
+        group = {}
+        for (mask, ones), values in level.items():
+            group.setdefault(ones, []).extend(
+                Minimizer.term_to_implicant((value, mask), variables_count)
+                for value in sorted(values)
+            )
+        Minimizer.print_group(group)
+
+    def iter_terms(self, is_pdnf: bool) -> Iterator[Term]:
+        if is_pdnf:
+            return self.truth_table.iter_pdnf_terms()
+        return self.truth_table.iter_pcnf_terms()
+
+    def iter_dont_care_terms(self) -> Iterator[Term]:
+        return self.truth_table.iter_dont_care_terms()
+
+    def get_prime_implicants(self, is_pdnf: bool, display_merging: bool) -> List[List]:
+        return [
+            Minimizer.term_to_implicant(term, self.variables_count)
+            for term in Minimizer.prime_implicants(
+                self.iter_terms(is_pdnf),
+                self.variables_count,
+                display_merging,
+                self.iter_dont_care_terms(),
+            )
+        ]
+
+    # ------------------------------------------------------------
+    # --------------------------- COVER ---------------------------
+    # ------------------------------------------------------------
+    def minimum_cover(self, primes: List[Term], minterms: List[int]) -> List[int]:
+        # Indices of the primes that cover the minterms with the fewest
+        # primes and, among those covers, the fewest literals.
+        columns = {minterm: j for j, minterm in enumerate(minterms)}
+        rows = []
+        for term in primes:
+            row = 0
+            for index in iter_term_rows(term, self.variables_count):
+                if index in columns:
+                    row |= 1 << columns[index]
+            rows.append(row)
+        weight = self.variables_count * len(primes) + 1
+        costs = [weight + mask.bit_count() for _, mask in primes]
+        solver = CoverSolver(rows, costs, self.cover_time_budget)
+        chosen = solver.solve((1 << len(minterms)) - 1)
+        self.cover_exact = solver.exact
+        return chosen
+
+    def get_minimal_implicants(
+        self, is_pdnf: bool, display_merging: bool
+    ) -> Tuple[List[List], List[int]]:
+        # All the prime implicants and the indices of a minimum cover; only
+        # the terms are columns, the don't-cares never need covering.
+        terms = list(self.iter_terms(is_pdnf))
+        primes = Minimizer.prime_implicants(
+            terms, self.variables_count, display_merging, self.iter_dont_care_terms()
+        )
+        chosen = self.minimum_cover(primes, [value for value, _ in terms])
+        implicants = [
+            Minimizer.term_to_implicant(term, self.variables_count) for term in primes
+        ]
+        return implicants, chosen
+
+    # ------------------------------------------------------------
+    # ----------------------- MULTI-OUTPUT -----------------------
+    # ------------------------------------------------------------
+    @staticmethod
+    def multi_output_prime_implicants(
+        term_sets: List[List[Term]],
+        variables_count: int,
+        dont_care_sets: Optional[List[List[Term]]] = None,
+    ) -> List[Tuple[Term, int]]:
+        # prime_implicants for all outputs in one pass. A cube carries the
+        # bitset of the outputs it is an implicant of and the bitset of
+        # those it holds a term of; a merge keeps the outputs both halves
+        # serve. A cube is prime for its outputs unless some merge keeps
+        # them all. Returns (term, outputs it holds a term of) pairs.
+        level: Dict[Tuple[int, int], Dict[int, Tuple[int, int]]] = {}
+
+        def add(terms: Iterable[Term], output: int, required: bool) -> None:
+            for value, mask in terms:
+                value &= mask
+                values = level.setdefault((mask, value.bit_count()), {})
+                outputs, holds = values.get(value, (0, 0))
+                values[value] = (outputs | output, holds | (output if required else 0))
+
+        for k, terms in enumerate(term_sets):
+            add(terms, 1 << k, True)
+        for k, terms in enumerate(dont_care_sets or []):
+            add(terms, 1 << k, False)
+
+        primes = []
+        while level:
+            merged_level: Dict[Tuple[int, int], Dict[int, Tuple[int, int]]] = {}
+            covered: Dict[Tuple[int, int], set] = {key: set() for key in level}
+            for (mask, ones), values in level.items():
+                uppers = level.get((mask, ones + 1))
+                if not uppers:
+                    continue
+                covered_lowers = covered[mask, ones]
+                covered_uppers = covered[mask, ones + 1]
+                merged = {
+                    1 << k: merged_level.setdefault((mask ^ (1 << k), ones), {})
+                    for k in range(variables_count)
+                    if (mask >> k) & 1
+                }
+                for value, (outputs, holds) in values.items():
+                    for bit, merged_values in merged.items():
+                        if value & bit or value | bit not in uppers:
+                            continue
+                        upper_outputs, upper_holds = uppers[value | bit]
+                        common = outputs & upper_outputs
+                        if not common:
+                            continue
+                        merged_values[value] = (common, (holds | upper_holds) & common)
+                        if common == outputs:
+                            covered_lowers.add(value)
+                        if common == upper_outputs:
+                            covered_uppers.add(value | bit)
+            for (mask, ones), values in level.items():
+                primes.extend(
+                    ((value, mask), holds)
+                    for value, (_, holds) in values.items()
+                    if holds and value not in covered[mask, ones]
+                )
+            level = {key: values for key, values in merged_level.items() if values}
+
+        return sorted(
+            primes,
+            key=lambda prime: (
+                prime[0][0].bit_count(),
+                [
+                    2 if el == "*" else el
+                    for el in Minimizer.term_to_implicant(prime[0], variables_count)
+                ],
+            ),
+        )
+
+    def output_tables(self) -> List[TruthTable]:
+        if self.multi_output_table is None:
+            return [self.truth_table]
+        return list(self.multi_output_table)
+
+    def get_joint_cover(self, is_pdnf: bool) -> Tuple[List[Term], List[List[int]]]:
+        # The products that cover every output with the fewest distinct
+        # products (then literals), and per output the indices of those it
+        # uses. Columns are (output, term) pairs and a product's row spans
+        # every output it serves, so a product shared by several outputs is
+        # paid for once.
+        tables = self.output_tables()
+        term_sets = [
+            list(table.iter_pdnf_terms() if is_pdnf else table.iter_pcnf_terms())
+            for table in tables
+        ]
+        primes = Minimizer.multi_output_prime_implicants(
+            term_sets,
+            self.variables_count,
+            [list(table.iter_dont_care_terms()) for table in tables],
+        )
+
+        columns: Dict[Tuple[int, int], int] = {}
+        output_columns = []
+        for k, terms in enumerate(term_sets):
+            first = len(columns)
+            for value, _ in terms:
+                columns[k, value] = len(columns)
+            output_columns.append(((1 << len(columns)) - 1) ^ ((1 << first) - 1))
+        rows = []
+        for term, outputs in primes:
+            row = 0
+            for index in iter_term_rows(term, self.variables_count):
+                for k in iter_bits(outputs):
+                    j = columns.get((k, index))
+                    if j is not None:
+                        row |= 1 << j
+            rows.append(row)
+        # The fewest products only: with literals in the cost as well, as in
+        # minimum_cover, the search has to tell apart the many covers of the
+        # same size and takes far longer on several outputs. A product is
+        # then swapped for a shorter one wherever that still covers.
+        all_columns = (1 << len(columns)) - 1
+        solver = CoverSolver(rows, None, self.cover_time_budget)
+        chosen = solver.solve(all_columns)
+        self.cover_exact = solver.exact
+        costs = [mask.bit_count() for (_, mask), _ in primes]
+        for position, i in enumerate(chosen):
+            others = 0
+            for j in chosen:
+                if j != i:
+                    others |= rows[j]
+            missing = all_columns & ~others
+            shorter = [
+                j
+                for j, row in enumerate(rows)
+                if costs[j] < costs[i] and row & missing == missing
+            ]
+            if missing and shorter:
+                chosen[position] = min(shorter, key=lambda j: costs[j])
+        chosen.sort()
+
+        # An output need not use every chosen product it could: it takes the
+        # fewest of them that cover its own terms.
+        uses = []
+        for k, mask in enumerate(output_columns):
+            candidates = [i for i in chosen if (rows[i] & mask)]
+            weight = self.variables_count * len(candidates) + 1
+            output_solver = CoverSolver(
+                [rows[i] & mask for i in candidates],
+                [weight + costs[i] for i in candidates],
+                self.cover_time_budget,
+            )
+            uses.append(
+                [chosen.index(candidates[i]) for i in output_solver.solve(mask)]
+            )
+            self.cover_exact = self.cover_exact and output_solver.exact
+        return [primes[i][0] for i in chosen], uses
+
+    def minimize_jointly(self, *, is_pdnf: bool) -> Dict[str, str]:
+        # Like minimize_outputs, but the outputs share their products; the
+        # shared ones are left in shared_terms.
+        products, uses = self.get_joint_cover(is_pdnf)
+        # An output constant on its care rows is covered by the empty cube
+        # (written as 1, or 0 for a CNF) or needs no terms at all.
+        full, empty = ("1", "0") if is_pdnf else ("0", "1")
+        forms = [
+            self.convert_bin_to_var_form(
+                Minimizer.term_to_implicant(term, self.variables_count), is_pdnf
+            )
+            or full
+            for term in products
+        ]
+        names = [table.result_header for table in self.output_tables()]
+        self.shared_terms = {}
+        for i, form in enumerate(forms):
+            users = [name for name, used in zip(names, uses) if i in used]
+            if len(users) > 1:
+                self.shared_terms[form] = users
+        return {
+            name: ("|" if is_pdnf else "&").join(f"({forms[i]})" for i in used)
+            or empty
+            for name, used in zip(names, uses)
+        }
+
     # ------------------------------------------------------------
     # -------------------------- MATRIX --------------------------
     # ------------------------------------------------------------
@@ -182,35 +610,33 @@ class Minimizer:
     def computational_table_minimization(
         self, *, is_pdnf: bool, display_merging: bool = True, display_table: bool = True
     ) -> str:
-        result_groups = Minimizer.merge_groups(
-            self.truth_table.group_pdnf() if is_pdnf else self.truth_table.group_pcnf(),
-            display_merging,
-        )
-        constituents = (
-            self.truth_table.get_pdnf_constituents()
-            if is_pdnf
-            else self.truth_table.get_pcnf_constituents()
+        result_groups, chosen_implicants = self.get_minimal_implicants(
+            is_pdnf, display_merging
         )
 
-        implicant_matrix = Minimizer.create_implicant_matrix(
-            result_groups, constituents
-        )
-        unique_implicants = Minimizer.found_unique_implicant(implicant_matrix)
-
+        # The essential implicants alone leave cyclic cores uncovered; the
+        # minimum cover takes them and the fewest others.
         if is_pdnf:
             result = [
                 f"({self.convert_bin_to_var_form(result_groups[i], is_pdnf)})"
-                for i in unique_implicants
+                for i in chosen_implicants
             ]
             result = "|".join(result)
         else:
             result = [
                 f"({self.convert_bin_to_var_form(result_groups[i], is_pdnf)})"
-                for i in unique_implicants
+                for i in chosen_implicants
             ]
             result = "&".join(result)
 
         if display_table:
+            constituents = [
+                Minimizer.term_to_implicant(term, self.variables_count)
+                for term in self.iter_terms(is_pdnf)
+            ]
+            implicant_matrix = Minimizer.create_implicant_matrix(
+                result_groups, constituents
+            )
             column_headers = [""] + ["".join(map(str, comb)) for comb in constituents]
             print(
                 tabulate(
@@ -229,40 +655,12 @@ class Minimizer:
     def computational_minimization(
         self, *, is_pdnf: bool, display_merging: bool = True
     ) -> str:
-        group = (
-            self.truth_table.group_pdnf() if is_pdnf else self.truth_table.group_pcnf()
-        )
-        implicants = Minimizer.merge_groups(group, display_merging)
-        constituents = (
-            self.truth_table.get_pdnf_constituents()
-            if is_pdnf
-            else self.truth_table.get_pcnf_constituents()
+        # Implicants outside a minimum cover of the constituents are the
+        # redundant ones.
+        primes, chosen_implicants = self.get_minimal_implicants(
+            is_pdnf, display_merging
         )
-
-        changed = True
-        while changed:
-            changed = False
-            for current_implicant in implicants[:]:
-                covered_constituents = [
-                    c
-                    for c in constituents
-                    if Minimizer.correspon_to_bin(c, current_implicant)
-                ]
-                if not covered_constituents:
-                    continue
-
-                is_redundant = all(
-                    any(
-                        Minimizer.correspon_to_bin(c, other_implicant)
-                        for other_implicant in implicants
-                        if other_implicant != current_implicant
-                    )
-                    for c in covered_constituents
-                )
-                if is_redundant:
-                    implicants.remove(current_implicant)
-                    changed = True
-                    break
+        implicants = [primes[i] for i in chosen_implicants]
 
         if is_pdnf:
             result = [
@@ -277,6 +675,23 @@ class Minimizer:
 
         return result
 
+    # ------------------------------------------------------------
+    # ------------------ ESPRESSO-MINIMIZATION ------------------
+    # ------------------------------------------------------------
+    def espresso_minimization(self, *, is_pdnf: bool) -> str:
+        # Heuristic: no prime table and no cover search, so the result may
+        # be a little larger than the exact methods give.
+        terms = EspressoMinimizer(
+            self.iter_terms(is_pdnf), self.variables_count, self.iter_dont_care_terms()
+        ).minimize()
+        implicants = [
+            Minimizer.term_to_implicant(term, self.variables_count) for term in terms
+        ]
+        result = [
+            f"({self.convert_bin_to_var_form(imp, is_pdnf)})" for imp in implicants
+        ]
+        return ("|" if is_pdnf else "&").join(result)
+
     # ------------------------------------------------------------
     # ---------------- KARNAUGH-MAP-MINIMIZATION ----------------
     # ------------------------------------------------------------
@@ -296,21 +711,23 @@ class Minimizer:
         row_size = 2**row_var_num
         col_size = 2**col_var_num
 
-        row_seq = sorted(range(row_size), key=lambda x: x ^ (x >> 1))
-        col_seq = sorted(range(col_size), key=lambda x: x ^ (x >> 1))
+        # Axis k is the k-th Gray code, so the labels and the cells agree
+        # and neighbouring cells differ in one variable.
+        row_seq = gray_sequence(row_var_num)
+        col_seq = gray_sequence(col_var_num)
 
+        column = self.truth_table.result_column
         karnaugh_map = [[0 for _ in range(col_size)] for _ in range(row_size)]
         for i in range(row_size):
             for j in range(col_size):
                 index = (row_seq[i] << col_var_num) | col_seq[j]
-                karnaugh_map[i][j] = self.truth_table.table[index][-1]
+                if self.truth_table.is_dont_care(index):
+                    karnaugh_map[i][j] = DONT_CARE
+                else:
+                    karnaugh_map[i][j] = column[index]
 
-        row_labels = [
-            Minimizer.to_binary(k ^ (k >> 1), row_var_num) for k in range(row_size)
-        ]
-        col_labels = [
-            Minimizer.to_binary(k ^ (k >> 1), col_var_num) for k in range(col_size)
-        ]
+        row_labels = [Minimizer.to_binary(code, row_var_num) for code in row_seq]
+        col_labels = [Minimizer.to_binary(code, col_var_num) for code in col_seq]
         return (
             karnaugh_map,
             row_labels,
@@ -367,29 +784,30 @@ class Minimizer:
         if not positions_to_cover:
             return "Doesn't exist"
 
-        # Build all valid grouping assignments
-        possible_assignments = product([None, 0, 1], repeat=self.variables_count)
-        groups: List[Tuple[Tuple[Optional[int], ...], List[Tuple[int, int]]]] = []
-        for assignment in possible_assignments:
-            group = self.get_group(
-                assignment, row_seq, col_seq, row_var_num, col_var_num
+        # Build all valid grouping assignments; a group may take don't-cares
+        # in, but they are not among the positions to cover.
+        groups: List[Tuple[Tuple[Optional[int], ...], List[Tuple[int, int]]]] = [
+            (assignment, group)
+            for assignment, group in self.karnaugh_candidates(
+                row_seq, col_seq, row_var_num, col_var_num
             )
-            if group and all(karnaugh_map[i][j] == target_value for i, j in group):
-                groups.append((assignment, group))
+            if all(karnaugh_map[i][j] in (target_value, DONT_CARE) for i, j in group)
+        ]
 
         # Greedy select groups to cover all target positions
         selected_groups: List[Tuple[Tuple[Optional[int], ...], List[Tuple[int, int]]]] = []
-        covered: set = set()
-        while covered != set(positions_to_cover):
+        # Only target positions count: don't-care cells need no covering.
+        uncovered = set(positions_to_cover)
+        while uncovered:
             best_group = max(
                 groups,
-                key=lambda grp: len(set(grp[1]) - covered),
+                key=lambda grp: len(uncovered.intersection(grp[1])),
                 default=None,
             )
-            if not best_group or len(set(best_group[1]) - covered) == 0:
+            if not best_group or not uncovered.intersection(best_group[1]):
                 raise ValueError("Cannot cover all positions with Karnaugh grouping")
             selected_groups.append(best_group)
-            covered |= set(best_group[1])
+            uncovered -= set(best_group[1])
 
         # Remove redundant groups: if removing a group still covers all, drop it
         final_groups = selected_groups.copy()
@@ -414,6 +832,26 @@ class Minimizer:
             minimized_form = "(" + ")&(".join(terms) + ")"
         return minimized_form
 
+    def karnaugh_candidates(
+        self,
+        row_seq: List[int],
+        col_seq: List[int],
+        row_var_num: int,
+        col_var_num: int,
+    ) -> List[Tuple[Tuple[Optional[int], ...], List[Tuple[int, int]]]]:
+        # Every assignment with its cells: the same for all functions of
+        # these variables, so it is built once for all outputs.
+        if "karnaugh_candidates" not in self.shared:
+            candidates = []
+            for assignment in product([None, 0, 1], repeat=self.variables_count):
+                group = self.get_group(
+                    assignment, row_seq, col_seq, row_var_num, col_var_num
+                )
+                if group:
+                    candidates.append((assignment, group))
+            self.shared["karnaugh_candidates"] = candidates
+        return self.shared["karnaugh_candidates"]
+
     def get_group(
         self,
         assignment: Tuple[Optional[int], ...],
@@ -0,0 +1,120 @@
+from typing import List, Optional, TextIO
+
+from src.pnf_contructor.terms import Term
+from src.pnf_contructor.index_form import default_variables
+
+# Output characters of the supported .type values: "f" lists the on-set
+# only, "fd" (the default) the on-set and the don't-care set.
+PLA_TYPES = ("f", "fd")
+ON_CHARS = "14"
+DONT_CARE_CHARS = "-2"
+
+
+def parse_cube(text: str) -> Term:
+    # "01-1": the first character is the first variable, the most
+    # significant bit of the term.
+    count = len(text)
+    value = mask = 0
+    for k, char in enumerate(text):
+        bit = 1 << (count - 1 - k)
+        if char in "01":
+            mask |= bit
+            if char == "1":
+                value |= bit
+        elif char not in "-2~":
+            raise ValueError(f"Invalid PLA input character: {char}")
+    return value, mask
+
+
+def format_cube(term: Term, variables_count: int) -> str:
+    value, mask = term
+    chars = []
+    for k in range(variables_count):
+        bit = 1 << (variables_count - 1 - k)
+        chars.append("-" if not mask & bit else "1" if value & bit else "0")
+    return "".join(chars)
+
+
+class Pla:
+    # A two-level function in Berkeley PLA form: per output, the cubes of
+    # its on-set and of its don't-care set, as (value, mask) terms.
+    def __init__(
+        self,
+        inputs: List[str],
+        outputs: List[str],
+        on_sets: List[List[Term]],
+        dont_cares: Optional[List[List[Term]]] = None,
+    ):
+        if len(on_sets) != len(outputs):
+            raise ValueError("Every output needs an on-set")
+        self.inputs = inputs
+        self.outputs = outputs
+        self.on_sets = on_sets
+        self.dont_cares = [[] for _ in outputs] if dont_cares is None else dont_cares
+
+    @classmethod
+    def read(cls, stream: TextIO) -> "Pla":
+        inputs_count = outputs_count = None
+        inputs: Optional[List[str]] = None
+        outputs: Optional[List[str]] = None
+        pla_type = "fd"
+        cubes = []
+        for line in stream:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            if line.startswith("."):
+                keyword, *arguments = line.split()
+                if keyword == ".i":
+                    inputs_count = int(arguments[0])
+                elif keyword == ".o":
+                    outputs_count = int(arguments[0])
+                elif keyword == ".ilb":
+                    inputs = arguments
+                elif keyword == ".ob":
+                    outputs = arguments
+                elif keyword == ".type":
+                    pla_type = arguments[0]
+                    if pla_type not in PLA_TYPES:
+                        raise ValueError(f"Unsupported PLA type: {pla_type}")
+                elif keyword in (".e", ".end"):
+                    break
+                # .p and other keywords carry nothing needed here.
+                continue
+            cubes.append("".join(line.split()))
+
+        if inputs_count is None or outputs_count is None:
+            raise ValueError("PLA must declare .i and .o")
+        inputs = default_variables(inputs_count) if inputs is None else inputs
+        outputs = (
+            [f"f{k}" for k in range(outputs_count)] if outputs is None else outputs
+        )
+        if len(inputs) != inputs_count or len(outputs) != outputs_count:
+            raise ValueError("PLA labels do not match .i and .o")
+
+        on_sets: List[List[Term]] = [[] for _ in range(outputs_count)]
+        dont_cares: List[List[Term]] = [[] for _ in range(outputs_count)]
+        for cube in cubes:
+            if len(cube) != inputs_count + outputs_count:
+                raise ValueError(f"Invalid PLA cube: {cube}")
+            term = parse_cube(cube[:inputs_count])
+            for k, char in enumerate(cube[inputs_count:]):
+                if char in ON_CHARS:
+                    on_sets[k].append(term)
+                elif char in DONT_CARE_CHARS and pla_type == "fd":
+                    dont_cares[k].append(term)
+        return cls(inputs, outputs, on_sets, dont_cares)
+
+    def write(self, stream: TextIO) -> None:
+        # One line per cube and output, in "fd" form.
+        stream.write(f".i {len(self.inputs)}\n.o {len(self.outputs)}\n")
+        stream.write(f".ilb {' '.join(self.inputs)}\n.ob {' '.join(self.outputs)}\n")
+        lines = []
+        for k in range(len(self.outputs)):
+            for terms, char in ((self.on_sets[k], "1"), (self.dont_cares[k], "-")):
+                for term in terms:
+                    output = "0" * k + char + "0" * (len(self.outputs) - k - 1)
+                    lines.append(f"{format_cube(term, len(self.inputs))} {output}\n")
+        stream.write(f".p {len(lines)}\n")
+        stream.writelines(lines)
+        stream.write(".e\n")
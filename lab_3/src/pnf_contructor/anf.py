@@ -0,0 +1,111 @@
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List
+
+from src.pnf_contructor.bitwise import variable_column
+from src.pnf_contructor.packed import BitColumn
+from src.pnf_contructor.truth_table import TruthTable
+
+
+def mobius_transform(column: int, variables_count: int) -> int:
+    # Butterfly over the whole column at once: for every variable, each row
+    # where it is 1 takes the XOR of its partner row where it is 0. One shift,
+    # AND and XOR of 2**n-bit ints per variable, so O(n * 2**n / wordsize).
+    # The transform is its own inverse.
+    for weight in range(variables_count):
+        high_rows = variable_column(variables_count - 1 - weight, variables_count)
+        column ^= (column & ~high_rows) << (1 << weight)
+    return column
+
+
+class ZhegalkinPolynomial:
+    # Bit i of coefficients is the coefficient of the monomial made of the
+    # variables set in row index i (bit 0 is the constant 1).
+    def __init__(self, coefficients: int, variables: List[str]):
+        self.variables = list(variables)
+        self.rows_count = 2 ** len(self.variables)
+        if not 0 <= coefficients < 1 << self.rows_count:
+            raise ValueError("Coefficients do not fit the number of variables")
+        self.coefficients = coefficients
+
+    @classmethod
+    def from_column(cls, column: int, variables: List[str]) -> "ZhegalkinPolynomial":
+        return cls(mobius_transform(column, len(variables)), variables)
+
+    @classmethod
+    def from_truth_table(cls, truth_table: TruthTable) -> "ZhegalkinPolynomial":
+        return cls.from_column(
+            truth_table.result_column.to_int(), truth_table.variables
+        )
+
+    @classmethod
+    def from_monomials(
+        cls, monomials: Iterable[Iterable[str]], variables: List[str]
+    ) -> "ZhegalkinPolynomial":
+        # [["a", "b"], ["c"], []] is a&b ^ c ^ 1; a repeated monomial cancels.
+        count = len(variables)
+        weights = {var: 1 << (count - 1 - k) for k, var in enumerate(variables)}
+        coefficients = 0
+        for monomial in monomials:
+            index = 0
+            for var in monomial:
+                if var not in weights:
+                    raise ValueError(f"Unknown variable: {var}")
+                index |= weights[var]
+            coefficients ^= 1 << index
+        return cls(coefficients, variables)
+
+    def to_column(self) -> int:
+        return mobius_transform(self.coefficients, len(self.variables))
+
+    def to_truth_table(self) -> TruthTable:
+        column = BitColumn.from_int(self.to_column(), self.rows_count)
+        return TruthTable(variables=self.variables, column=column)
+
+    @cached_property
+    def monomials(self) -> List[int]:
+        return list(BitColumn.from_int(self.coefficients, self.rows_count).iter_ones())
+
+    def iter_monomials(self) -> Iterator[List[str]]:
+        count = len(self.variables)
+        for index in self.monomials:
+            yield [
+                var
+                for k, var in enumerate(self.variables)
+                if index >> (count - 1 - k) & 1
+            ]
+
+    def degree(self) -> int:
+        # Constants (including the zero function) have degree 0.
+        return max((index.bit_count() for index in self.monomials), default=0)
+
+    def is_linear(self) -> bool:
+        return self.degree() <= 1
+
+    def evaluate_index(self, index: int) -> int:
+        # A monomial is 1 exactly when all its variables are set in the row.
+        return sum(1 for monomial in self.monomials if monomial & ~index == 0) & 1
+
+    def evaluate(self, assignment: Dict[str, int]) -> int:
+        count = len(self.variables)
+        index = 0
+        for k, var in enumerate(self.variables):
+            if assignment[var]:
+                index |= 1 << (count - 1 - k)
+        return self.evaluate_index(index)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ZhegalkinPolynomial):
+            return NotImplemented
+        return (self.coefficients, self.variables) == (
+            other.coefficients,
+            other.variables,
+        )
+
+    def __str__(self) -> str:
+        # "a&b ^ c ^ 1": monomials by degree, the constant last.
+        terms = sorted(
+            self.iter_monomials(), key=lambda monomial: (-len(monomial), monomial)
+        )
+        if not terms:
+            return "0"
+        return " ^ ".join("&".join(monomial) if monomial else "1" for monomial in terms)
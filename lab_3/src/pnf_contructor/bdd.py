@@ -0,0 +1,359 @@
+import sys
+from functools import reduce
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.pnf_contructor.language import VARIABLE, CONST, NOT, AND, OR, IMP, EQU
+from src.pnf_contructor.language import XOR, NAND, NOR
+from src.pnf_contructor.nodes import ExpressionNode, iter_postorder
+from src.pnf_contructor.logical_function import LogicalFunction
+
+FALSE = 0
+TRUE = 1
+# Terminals sit below every variable level.
+TERMINAL_LEVEL = sys.maxsize
+
+
+class BDDManager:
+    # Node u is the triple (levels[u], lows[u], highs[u]): "if the variable at
+    # levels[u] then highs[u] else lows[u]". Nodes 0 and 1 are the terminals.
+    # The unique table keeps one node per (level, low, high), so two functions
+    # over the same manager are equal exactly when their nodes are.
+    bdd_opr = {
+        NOT: lambda manager, x: manager.ite(x, FALSE, TRUE),
+        AND: lambda manager, *xs: reduce(lambda x, y: manager.ite(x, y, FALSE), xs),
+        OR: lambda manager, *xs: reduce(lambda x, y: manager.ite(x, TRUE, y), xs),
+        IMP: lambda manager, x, y: manager.ite(x, y, TRUE),
+        EQU: lambda manager, x, y: manager.ite(x, y, manager.ite(y, FALSE, TRUE)),
+        XOR: lambda manager, *xs: reduce(
+            lambda x, y: manager.ite(x, manager.ite(y, FALSE, TRUE), y), xs
+        ),
+        NAND: lambda manager, x, y: manager.ite(x, manager.ite(y, FALSE, TRUE), TRUE),
+        NOR: lambda manager, x, y: manager.ite(x, FALSE, manager.ite(y, FALSE, TRUE)),
+    }
+
+    def __init__(self, variables: List[str]):
+        self.order: List[str] = []
+        self.level_of: Dict[str, int] = {}
+
+        self.levels = [TERMINAL_LEVEL, TERMINAL_LEVEL]
+        self.lows = [FALSE, TRUE]
+        self.highs = [FALSE, TRUE]
+        self.unique: List[Dict[Tuple[int, int], int]] = []
+        self.computed: Dict[Tuple[int, int, int], int] = {}
+
+        # Reference counts and free slots are only maintained while reordering.
+        self.refs = [0, 0]
+        self.free: List[int] = []
+        self.live = 0
+
+        for var in variables:
+            self.add_variable(var)
+
+    def add_variable(self, name: str) -> None:
+        # New variables go below all existing ones, so no node has to move.
+        if name in self.level_of:
+            raise ValueError(f"Variable {name} is already in the order")
+        self.level_of[name] = len(self.order)
+        self.order.append(name)
+        self.unique.append({})
+
+    def variable(self, name: str) -> int:
+        if name not in self.level_of:
+            self.add_variable(name)
+        return self.node(self.level_of[name], FALSE, TRUE)
+
+    def node(self, level: int, low: int, high: int) -> int:
+        if low == high:
+            return low
+        table = self.unique[level]
+        u = table.get((low, high))
+        if u is None:
+            if self.free:
+                u = self.free.pop()
+                self.levels[u], self.lows[u], self.highs[u] = level, low, high
+                self.refs[u] = 0
+            else:
+                u = len(self.levels)
+                self.levels.append(level)
+                self.lows.append(low)
+                self.highs.append(high)
+                self.refs.append(0)
+            table[(low, high)] = u
+        return u
+
+    def ite(self, f: int, g: int, h: int) -> int:
+        # if f then g else h; recursion depth is bounded by the number of levels.
+        if f == TRUE:
+            return g
+        if f == FALSE:
+            return h
+        if g == h:
+            return g
+        if g == TRUE and h == FALSE:
+            return f
+
+        key = (f, g, h)
+        result = self.computed.get(key)
+        if result is not None:
+            return result
+
+        levels = self.levels
+        top = min(levels[f], levels[g], levels[h])
+        f0, f1 = (self.lows[f], self.highs[f]) if levels[f] == top else (f, f)
+        g0, g1 = (self.lows[g], self.highs[g]) if levels[g] == top else (g, g)
+        h0, h1 = (self.lows[h], self.highs[h]) if levels[h] == top else (h, h)
+        result = self.node(top, self.ite(f0, g0, h0), self.ite(f1, g1, h1))
+        self.computed[key] = result
+        return result
+
+    def build(self, root: ExpressionNode) -> int:
+        values: Dict[int, int] = {}
+        for node in iter_postorder(root):
+            if node.operator == VARIABLE:
+                values[id(node)] = self.variable(node.name)
+            elif node.operator == CONST:
+                values[id(node)] = TRUE if node.value else FALSE
+            elif node.operator in self.bdd_opr:
+                values[id(node)] = self.bdd_opr[node.operator](
+                    self, *(values[id(operand)] for operand in node.operands)
+                )
+            else:
+                raise ValueError("Unknown operator")
+        return values[id(root)]
+
+    def transfer(self, manager: "BDDManager", root: int) -> int:
+        # Rebuilds a function of another manager (possibly with another
+        # variable order) inside this one.
+        values = {FALSE: FALSE, TRUE: TRUE}
+        for u in manager.iter_nodes([root]):
+            if u not in values:
+                values[u] = self.ite(
+                    self.variable(manager.order[manager.levels[u]]),
+                    values[manager.highs[u]],
+                    values[manager.lows[u]],
+                )
+        return values[root]
+
+    def iter_nodes(self, roots: List[int]) -> Iterator[int]:
+        # Reachable non-terminal nodes, children before parents.
+        visited = {FALSE, TRUE}
+        stack = [(root, False) for root in roots]
+        while stack:
+            u, expanded = stack.pop()
+            if expanded:
+                yield u
+                continue
+            if u in visited:
+                continue
+            visited.add(u)
+            stack.append((u, True))
+            stack.append((self.highs[u], False))
+            stack.append((self.lows[u], False))
+
+    def size(self, roots: List[int]) -> int:
+        return sum(1 for _ in self.iter_nodes(roots))
+
+    def count_models(self, root: int) -> int:
+        # Satisfying assignments over all variables of the manager.
+        levels_count = len(self.order)
+
+        def level(u: int) -> int:
+            return levels_count if u <= TRUE else self.levels[u]
+
+        counts = {FALSE: 0, TRUE: 1}
+        for u in self.iter_nodes([root]):
+            low, high = self.lows[u], self.highs[u]
+            counts[u] = (counts[low] << (level(low) - self.levels[u] - 1)) + (
+                counts[high] << (level(high) - self.levels[u] - 1)
+            )
+        return counts[root] << level(root)
+
+    # ---- REORDERING ----
+
+    def collect(self, roots: List[int]) -> None:
+        # Drops every node unreachable from roots and recounts references;
+        # cached ite results may name dropped nodes, so they go too.
+        reachable = set(self.iter_nodes(roots))
+        for table in self.unique:
+            for key, u in list(table.items()):
+                if u not in reachable:
+                    del table[key]
+                    self.free.append(u)
+        self.computed.clear()
+
+        self.refs = [0] * len(self.levels)
+        for u in reachable:
+            self.refs[self.lows[u]] += 1
+            self.refs[self.highs[u]] += 1
+        for root in roots:
+            self.refs[root] += 1
+        self.live = len(reachable)
+
+    def _counted_node(self, level: int, low: int, high: int) -> int:
+        if low == high:
+            return low
+        existing = len(self.unique[level])
+        u = self.node(level, low, high)
+        if len(self.unique[level]) != existing:
+            self.refs[low] += 1
+            self.refs[high] += 1
+            self.live += 1
+        return u
+
+    def _release(self, u: int) -> None:
+        stack = [u]
+        while stack:
+            u = stack.pop()
+            if u <= TRUE:
+                continue
+            self.refs[u] -= 1
+            if self.refs[u] == 0:
+                del self.unique[self.levels[u]][(self.lows[u], self.highs[u])]
+                self.free.append(u)
+                self.live -= 1
+                stack.append(self.lows[u])
+                stack.append(self.highs[u])
+
+    def swap(self, level: int) -> None:
+        # Exchanges the variables at level and level + 1 in place: every node
+        # keeps its number and its function, only the graph under it changes.
+        upper_nodes = list(self.unique[level].values())
+        lower_nodes = list(self.unique[level + 1].values())
+        upper_table: Dict[Tuple[int, int], int] = {}
+        lower_table: Dict[Tuple[int, int], int] = {}
+
+        for u in lower_nodes:
+            self.levels[u] = level
+            upper_table[(self.lows[u], self.highs[u])] = u
+
+        dependent = []
+        for u in upper_nodes:
+            low, high = self.lows[u], self.highs[u]
+            if self.levels[low] == level or self.levels[high] == level:
+                dependent.append(u)
+            else:
+                self.levels[u] = level + 1
+                lower_table[(low, high)] = u
+
+        self.unique[level], self.unique[level + 1] = upper_table, lower_table
+        upper, lower = self.order[level], self.order[level + 1]
+        self.order[level], self.order[level + 1] = lower, upper
+        self.level_of[lower], self.level_of[upper] = level, level + 1
+
+        for u in dependent:
+            low, high = self.lows[u], self.highs[u]
+            low0, low1 = (
+                (self.lows[low], self.highs[low])
+                if self.levels[low] == level
+                else (low, low)
+            )
+            high0, high1 = (
+                (self.lows[high], self.highs[high])
+                if self.levels[high] == level
+                else (high, high)
+            )
+            new_low = self._counted_node(level + 1, low0, high0)
+            new_high = self._counted_node(level + 1, low1, high1)
+            self.refs[new_low] += 1
+            self.refs[new_high] += 1
+            self.lows[u], self.highs[u] = new_low, new_high
+            upper_table[(new_low, new_high)] = u
+            self._release(low)
+            self._release(high)
+
+    def sift(self, roots: List[int]) -> None:
+        # Rudell's sifting: each variable in turn is moved through every level
+        # and left where the diagram was smallest.
+        self.collect(roots)
+        last = len(self.order) - 1
+        for name in sorted(
+            self.order, key=lambda v: -len(self.unique[self.level_of[v]])
+        ):
+            level = self.level_of[name]
+            best_size, best_level = self.live, level
+            while level < last:
+                self.swap(level)
+                level += 1
+                if self.live < best_size:
+                    best_size, best_level = self.live, level
+            while level > 0:
+                self.swap(level - 1)
+                level -= 1
+                if self.live < best_size:
+                    best_size, best_level = self.live, level
+            while level < best_level:
+                self.swap(level)
+                level += 1
+        self.collect(roots)
+
+
+class BinaryDecisionDiagram:
+    def __init__(
+        self,
+        logical_function: LogicalFunction,
+        order: Optional[List[str]] = None,
+        sifting: bool = False,
+    ):
+        self.logical_function = logical_function
+        self.variables = logical_function.variables
+        if order is None:
+            order = self.variables
+        elif sorted(order) != sorted(self.variables):
+            raise ValueError("Order must list every variable of the function once")
+
+        self.manager = BDDManager(order)
+        self.root = self.manager.build(logical_function.ast)
+        if sifting:
+            self.manager.sift([self.root])
+
+    @property
+    def order(self) -> List[str]:
+        return list(self.manager.order)
+
+    @property
+    def size(self) -> int:
+        return self.manager.size([self.root])
+
+    def is_tautology(self) -> bool:
+        return self.root == TRUE
+
+    def is_satisfiable(self) -> bool:
+        return self.root != FALSE
+
+    def count_models(self) -> int:
+        # Equals the number of PDNF constituents; variables the manager gained
+        # from equivalence checks are free and divided out.
+        extra = len(self.manager.order) - len(self.variables)
+        return self.manager.count_models(self.root) >> extra
+
+    def equivalent(self, other: "BinaryDecisionDiagram") -> bool:
+        if other.manager is self.manager:
+            return other.root == self.root
+        return self.manager.transfer(other.manager, other.root) == self.root
+
+    def iter_minterms(self) -> Iterator[int]:
+        # Truth-table row indices of the satisfying assignments (the PDNF
+        # constituents), produced lazily. With the default order they come
+        # in ascending order, like TruthTable.num_form_pdnf.
+        manager = self.manager
+        levels_count = len(manager.order)
+        weights = [0] * levels_count
+        for k, var in enumerate(self.variables):
+            weights[manager.level_of[var]] = 1 << (len(self.variables) - 1 - k)
+
+        stack = [(self.root, 0, 0)]
+        while stack:
+            u, level, index = stack.pop()
+            if u == FALSE:
+                continue
+            while level < levels_count and not weights[level]:
+                level += 1
+            if level == levels_count:
+                yield index
+                continue
+            if manager.levels[u] == level:
+                low, high = manager.lows[u], manager.highs[u]
+            else:
+                low = high = u
+            stack.append((high, level + 1, index | weights[level]))
+            stack.append((low, level + 1, index))
@@ -0,0 +1,112 @@
+from functools import reduce
+from operator import and_, or_, xor
+from typing import Dict, List
+
+from src.pnf_contructor.language import VARIABLE, CONST, NOT, AND, OR, IMP, EQU
+from src.pnf_contructor.language import XOR, NAND, NOR
+from src.pnf_contructor.nodes import ExpressionNode, iter_postorder
+
+# Column patterns for the three lowest row-index bits inside a single byte
+# (bit k of the byte is row k).
+LOW_BIT_PATTERNS = (0xAA, 0xCC, 0xF0)
+
+
+def variable_column(position: int, variables_count: int) -> int:
+    # Row i holds the variable at `position` in bit (variables_count - 1 - position)
+    # of i, the same order itertools.product produces.
+    weight = variables_count - 1 - position
+    rows_count = 2**variables_count
+    if weight < 3:
+        pattern = LOW_BIT_PATTERNS[weight]
+        if rows_count < 8:
+            return pattern & ((1 << rows_count) - 1)
+        return int.from_bytes(bytes([pattern]) * (rows_count // 8), "little")
+
+    block = b"\x00" * 2 ** (weight - 3) + b"\xff" * 2 ** (weight - 3)
+    return int.from_bytes(block * (rows_count // 2 ** (weight + 1)), "little")
+
+
+class BitwiseEvaluator:
+    # Every column is a Python int whose bit i is the value in row i.
+    bitwise_opr = {
+        NOT: lambda full, x: full ^ x,
+        # AND, OR and XOR take any number of operands (n-ary chains).
+        AND: lambda full, *xs: reduce(and_, xs),
+        OR: lambda full, *xs: reduce(or_, xs),
+        IMP: lambda full, x, y: (full ^ x) | y,
+        EQU: lambda full, x, y: full ^ x ^ y,
+        XOR: lambda full, *xs: reduce(xor, xs),
+        NAND: lambda full, x, y: full ^ (x & y),
+        NOR: lambda full, x, y: full ^ (x | y),
+    }
+
+    def __init__(self, ast: ExpressionNode, variables: List[str]):
+        self.ast = ast
+        self.variables = variables
+        self.rows_count = 2 ** len(variables)
+        self.full_mask = (1 << self.rows_count) - 1
+
+    def get_columns(self) -> Dict[str, int]:
+        count = len(self.variables)
+        return {var: variable_column(i, count) for i, var in enumerate(self.variables)}
+
+    def get_segment_columns(self, start: int, rows_count: int) -> Dict[str, int]:
+        # Columns for rows start .. start + rows_count - 1, where rows_count is a
+        # power of two and start a multiple of it: the low variables repeat
+        # their full-table pattern, the high ones are constant in the segment.
+        count = len(self.variables)
+        segment_count = rows_count.bit_length() - 1
+        full_mask = (1 << rows_count) - 1
+        columns = {}
+        for k, var in enumerate(self.variables):
+            weight = count - 1 - k
+            if weight < segment_count:
+                columns[var] = variable_column(
+                    segment_count - 1 - weight, segment_count
+                )
+            else:
+                columns[var] = full_mask if (start >> weight) & 1 else 0
+        return columns
+
+    def evaluate(self) -> int:
+        return self.evaluate_columns(self.get_columns(), self.full_mask)
+
+    def evaluate_segment(self, start: int, rows_count: int) -> int:
+        if rows_count & (rows_count - 1) or start % rows_count:
+            raise ValueError("Segment must be an aligned power of two")
+        return self.evaluate_columns(
+            self.get_segment_columns(start, rows_count), (1 << rows_count) - 1
+        )
+
+    def evaluate_columns(self, columns: Dict[str, int], full_mask: int) -> int:
+        nodes = list(iter_postorder(self.ast))
+
+        # Count the consumers of every node so intermediate columns can be
+        # released as soon as the last one has read them.
+        consumers: Dict[int, int] = {}
+        for node in nodes:
+            for operand in node.operands:
+                consumers[id(operand)] = consumers.get(id(operand), 0) + 1
+
+        values: Dict[int, int] = {}
+        for node in nodes:
+            if node.operator == VARIABLE:
+                values[id(node)] = columns[node.name]
+                continue
+            if node.operator == CONST:
+                values[id(node)] = full_mask if node.value else 0
+                continue
+            if node.operator not in self.bitwise_opr:
+                raise ValueError("Unknown operator")
+
+            operand_values = []
+            for operand in node.operands:
+                operand_values.append(values[id(operand)])
+                consumers[id(operand)] -= 1
+                if consumers[id(operand)] == 0:
+                    del values[id(operand)]
+            values[id(node)] = self.bitwise_opr[node.operator](
+                full_mask, *operand_values
+            )
+
+        return values[id(self.ast)]
@@ -0,0 +1,133 @@
+import sys
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from src.pnf_contructor.language import RegexLexer, VARIABLE, CONST, NOT, AND, OR, IMP, EQU
+from src.pnf_contructor.language import XOR, NAND, NOR, LEXEME_PATTERN
+from src.pnf_contructor.grammar import IterativeParser
+from src.pnf_contructor.nodes import ExpressionNode, iter_postorder
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.truth_table import TruthTable
+
+COMMUTATIVE_SYMBOLS = {AND: "&", OR: "|", EQU: "~", XOR: "^", NAND: "!&", NOR: "!|"}
+ORDERED_SYMBOLS = {IMP: ">"}
+
+
+def canonical_form(root: ExpressionNode) -> str:
+    # Whitespace-free text of the formula with the operands of commutative
+    # operators sorted, so "b & a" and "a&b" share a key.
+    forms: Dict[int, str] = {}
+    for node in iter_postorder(root):
+        operands = [forms[id(operand)] for operand in node.operands]
+        if node.operator == VARIABLE:
+            forms[id(node)] = node.name
+        elif node.operator == CONST:
+            forms[id(node)] = str(node.value)
+        elif node.operator == NOT:
+            forms[id(node)] = f"!{operands[0]}"
+        elif node.operator in COMMUTATIVE_SYMBOLS:
+            forms[id(node)] = (
+                "(" + COMMUTATIVE_SYMBOLS[node.operator].join(sorted(operands)) + ")"
+            )
+        elif node.operator in ORDERED_SYMBOLS:
+            forms[id(node)] = "(" + ORDERED_SYMBOLS[node.operator].join(operands) + ")"
+        else:
+            raise ValueError("Unknown operator")
+    return forms[id(root)]
+
+
+class CacheEntry:
+    def __init__(self, logical_function: LogicalFunction):
+        self.logical_function = logical_function
+        self.truth_table: Optional[TruthTable] = None
+        self.aliases: Set[str] = set()
+
+    @property
+    def size(self) -> int:
+        # Rough footprint: the formula text plus the packed result column.
+        size = sys.getsizeof(self.logical_function.formula)
+        if self.truth_table is not None:
+            size += self.truth_table.result_column.nbytes
+        return size
+
+
+class FormulaCache:
+    def __init__(self, max_entries: int = 256, max_memory: int = 64 * 2**20):
+        if max_entries < 1 or max_memory < 1:
+            raise ValueError("Cache limits must be positive")
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # Formula lexemes joined by single spaces -> canonical key, so repeated
+        # formulas are found without tokenizing and parsing them again.
+        self.aliases: Dict[str, str] = {}
+        self.memory = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_function(self, formula: str) -> LogicalFunction:
+        _, entry = self._lookup(formula)
+        return entry.logical_function
+
+    def get_table(self, formula: str) -> TruthTable:
+        key, entry = self._lookup(formula)
+        if entry.truth_table is None:
+            # The entry may already be gone if it alone exceeds max_memory.
+            cached = self.entries.get(key) is entry
+            if cached:
+                self.memory -= entry.size
+            entry.truth_table = TruthTable(entry.logical_function)
+            if cached:
+                self.memory += entry.size
+                self._evict()
+        return entry.truth_table
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "memory": self.memory,
+        }
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.aliases.clear()
+        self.memory = 0
+
+    def _lookup(self, formula: str) -> Tuple[str, CacheEntry]:
+        # Lexemes, not the stripped text: "x 1" and "x1" must not share an alias.
+        alias = " ".join(LEXEME_PATTERN.findall(formula))
+        key = self.aliases.get(alias)
+        if key is None:
+            key = canonical_form(IterativeParser(RegexLexer(formula)).parse())
+
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        else:
+            self.misses += 1
+            entry = CacheEntry(LogicalFunction(formula))
+            self.entries[key] = entry
+            self.memory += entry.size
+
+        if alias not in entry.aliases:
+            entry.aliases.add(alias)
+            self.aliases[alias] = key
+        self._evict()
+        return key, entry
+
+    def _evict(self) -> None:
+        while self.entries and (
+            len(self.entries) > self.max_entries or self.memory > self.max_memory
+        ):
+            _, entry = self.entries.popitem(last=False)
+            self.memory -= entry.size
+            for alias in entry.aliases:
+                del self.aliases[alias]
+            self.evictions += 1
@@ -1,10 +1,17 @@
-from src.pnf_contructor.language import Lexer, VARIABLE, NOT, AND, OR, LPAREN, RPAREN, IMP, EQU, EOF
-from src.pnf_contructor.nodes import VariableNode, UnaryOperationNode, BinaryOperationNode, ExpressionNode
+import gc
+from typing import Callable, List, Optional, Union
+
+from src.pnf_contructor.language import Token, Lexer, VARIABLE, CONST, NOT, AND, OR, LPAREN, RPAREN, IMP, EQU, EOF, XOR, NAND, NOR
+from src.pnf_contructor.nodes import ExpressionNode, NodeFactory
+
+# Associative operators: a whole chain of one of them becomes one n-ary node.
+CHAIN_OPERATORS = (AND, OR, XOR)
 
 
 class Parser:
-    def __init__(self, lexer: Lexer):
+    def __init__(self, lexer: Lexer, factory: NodeFactory = None):
         self.lexer = lexer
+        self.factory = NodeFactory() if factory is None else factory
         self.current_token = lexer.get_next_token()
 
     def error(self):
@@ -20,10 +27,13 @@ class Parser:
         token = self.current_token
         if token.type == VARIABLE:
             self.eat(VARIABLE)
-            return VariableNode(token)
+            return self.factory.variable(token)
+        elif token.type == CONST:
+            self.eat(CONST)
+            return self.factory.constant(token)
         elif token.type == NOT:
             self.eat(NOT)
-            return UnaryOperationNode(token, self.element())
+            return self.factory.unary(token, self.element())
         elif token.type == LPAREN:
             self.eat(LPAREN)
             node = self.equivalence()
@@ -31,40 +41,50 @@ class Parser:
             return node
         self.error()
 
+    def close_chain(
+        self, operator: Optional[Token], operands: List[ExpressionNode]
+    ) -> ExpressionNode:
+        if len(operands) == 1:
+            return operands[0]
+        return self.factory.nary(operator, tuple(operands))
+
+    def chain(
+        self,
+        operand: Callable[[], ExpressionNode],
+        chain_type: str,
+        binary_type: Optional[str] = None,
+    ) -> ExpressionNode:
+        # a & b & c is collected into one n-ary node; the non-associative
+        # operator of the same level (NAND, NOR) stays binary and
+        # left-associative: a & b !& c is (a & b) !& c.
+        operands = [operand()]
+        operator = None
+        while self.current_token.type in (chain_type, binary_type):
+            token = self.current_token
+            self.eat(token.type)
+            if token.type == chain_type:
+                operator = token
+                operands.append(operand())
+            else:
+                left = self.close_chain(operator, operands)
+                operands = [self.factory.binary(left, token, operand())]
+        return self.close_chain(operator, operands)
+
     def conjunction(self) -> ExpressionNode:
-        node = self.element()
-        while self.current_token.type == AND:
-            operator = self.current_token
-            self.eat(AND)
-            node = BinaryOperationNode(
-                left_operand=node,
-                operator=operator,
-                right_operand=self.element(),
-            )
-        return node
+        return self.chain(self.element, AND, NAND)
+
+    def exclusive_disjunction(self) -> ExpressionNode:
+        return self.chain(self.conjunction, XOR)
 
     def disjunction(self) -> ExpressionNode:
-        node = self.conjunction()
-        while self.current_token.type == OR:
-            operator = self.current_token
-            self.eat(OR)
-            node = BinaryOperationNode(
-                left_operand=node,
-                operator=operator,
-                right_operand=self.conjunction(),
-            )
-        return node
+        return self.chain(self.exclusive_disjunction, OR, NOR)
 
     def implication(self) -> ExpressionNode:
         node = self.disjunction()
         while self.current_token.type == IMP:
             operator = self.current_token
             self.eat(IMP)
-            node = BinaryOperationNode(
-                left_operand=node,
-                operator=operator,
-                right_operand=self.disjunction(),  # Сейчас левая ассоциация, чтобы сделать правую: right_operand=self.implication()
-            )
+            node = self.factory.binary(node, operator, self.disjunction())  # Сейчас левая ассоциация, чтобы сделать правую: right_operand=self.implication()
         return node
 
     def equivalence(self) -> ExpressionNode:
@@ -72,11 +92,7 @@ class Parser:
         while self.current_token.type == EQU:
             operator = self.current_token
             self.eat(EQU)
-            node = BinaryOperationNode(
-                left_operand=node,
-                operator=operator,
-                right_operand=self.implication(),
-            )
+            node = self.factory.binary(node, operator, self.implication())
         return node
 
     def parse(self) -> ExpressionNode:
@@ -84,3 +100,121 @@ class Parser:
         if self.current_token.type != EOF:
             self.error()
         return node
+
+
+class PendingChain:
+    # Operands of an AND/OR/XOR chain still being read; it becomes an n-ary
+    # node once something other than the same operator follows it.
+    __slots__ = ("operator", "operands")
+
+    def __init__(self, operator: Token, operands: List[ExpressionNode]):
+        self.operator = operator
+        self.operands = operands
+
+
+class IterativeParser:
+    # Shunting-yard parser with explicit operator/operand stacks. It builds the
+    # same trees as Parser (chains of AND/OR/XOR as n-ary nodes, the other
+    # binary operators left-associative) without recursion, so nesting depth
+    # is limited only by memory.
+    precedence = {AND: 5, NAND: 5, XOR: 4, OR: 3, NOR: 3, IMP: 2, EQU: 1}
+
+    def __init__(self, lexer: Lexer, factory: NodeFactory = None):
+        self.lexer = lexer
+        self.factory = NodeFactory() if factory is None else factory
+
+    def error(self):
+        raise Exception("Invalid syntax")
+
+    def close(self, operand: Union[ExpressionNode, PendingChain]) -> ExpressionNode:
+        if isinstance(operand, PendingChain):
+            return self.factory.nary(operand.operator, tuple(operand.operands))
+        return operand
+
+    def reduce(
+        self,
+        operators: List[Token],
+        operands: List[Union[ExpressionNode, PendingChain]],
+    ) -> None:
+        operator = operators.pop()
+        if operator.type == NOT:
+            operands.append(self.factory.unary(operator, self.close(operands.pop())))
+            return
+        right_operand = self.close(operands.pop())
+        left_operand = operands.pop()
+        if operator.type in CHAIN_OPERATORS:
+            # Appending keeps a chain of k operands linear to build.
+            if (
+                isinstance(left_operand, PendingChain)
+                and left_operand.operator.type == operator.type
+            ):
+                left_operand.operands.append(right_operand)
+                operands.append(left_operand)
+            else:
+                operands.append(
+                    PendingChain(operator, [self.close(left_operand), right_operand])
+                )
+        else:
+            operands.append(
+                self.factory.binary(self.close(left_operand), operator, right_operand)
+            )
+
+    def parse(self) -> ExpressionNode:
+        # Only acyclic nodes are allocated here, so the cyclic collector has
+        # nothing to free; pausing it avoids repeated full passes over the
+        # growing tree on large inputs.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self.build_tree()
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def build_tree(self) -> ExpressionNode:
+        operators: List[Token] = []
+        operands: List[Union[ExpressionNode, PendingChain]] = []
+        expect_operand = True
+
+        while True:
+            token = self.lexer.get_next_token()
+            if expect_operand:
+                if token.type == VARIABLE:
+                    operands.append(self.factory.variable(token))
+                    expect_operand = False
+                elif token.type == CONST:
+                    operands.append(self.factory.constant(token))
+                    expect_operand = False
+                elif token.type in (NOT, LPAREN):
+                    operators.append(token)
+                else:
+                    self.error()
+            elif token.type in self.precedence:
+                # NOT binds tighter than any binary operator, and equal
+                # precedence reduces first to keep left associativity.
+                while operators and (
+                    operators[-1].type == NOT
+                    or self.precedence.get(operators[-1].type, 0)
+                    >= self.precedence[token.type]
+                ):
+                    self.reduce(operators, operands)
+                operators.append(token)
+                expect_operand = True
+            elif token.type == RPAREN:
+                while operators and operators[-1].type != LPAREN:
+                    self.reduce(operators, operands)
+                if not operators:
+                    self.error()
+                operators.pop()
+                # A parenthesized chain is complete: (a & b) & c keeps it as
+                # an operand, as Parser does.
+                if operands:
+                    operands.append(self.close(operands.pop()))
+            elif token.type == EOF:
+                while operators:
+                    if operators[-1].type == LPAREN:
+                        self.error()
+                    self.reduce(operators, operands)
+                return self.close(operands.pop())
+            else:
+                self.error()
@@ -0,0 +1,112 @@
+from typing import Iterator, List, Tuple
+
+from src.pnf_contructor.language import VARIABLE, CONST, NOT, AND, OR, XOR
+from src.pnf_contructor.nodes import ExpressionNode, iter_postorder
+from src.pnf_contructor.bitwise import BitwiseEvaluator
+from src.pnf_contructor.packed import BitColumn
+
+
+def gray_code(k: int) -> int:
+    return k ^ (k >> 1)
+
+
+def gray_sequence(bits: int) -> List[int]:
+    # 0, 1, 3, 2, 6, 7, 5, 4, ...: neighbours differ in exactly one bit.
+    return [gray_code(k) for k in range(2**bits)]
+
+
+class GrayCodeEvaluator:
+    # Walks the rows in Gray-code order, so exactly one variable changes per
+    # step, and re-evaluates only nodes whose operands have just changed;
+    # everything else keeps its value from the previous row. AND and OR keep
+    # a count of their operands equal to 1, so a change costs O(1) however
+    # many operands they have.
+    def __init__(self, ast: ExpressionNode, variables: List[str]):
+        self.ast = ast
+        self.variables = variables
+        self.rows_count = 2 ** len(variables)
+
+        self.nodes = list(iter_postorder(ast))
+        positions = {id(node): i for i, node in enumerate(self.nodes)}
+        var_positions = {var: k for k, var in enumerate(variables)}
+        self.operands = [
+            tuple(positions[id(operand)] for operand in node.operands)
+            for node in self.nodes
+        ]
+        # Parents once per occurrence as an operand, so counts stay exact
+        # when a node is used twice by the same parent.
+        self.parents: List[List[int]] = [[] for _ in self.nodes]
+        for i, operands in enumerate(self.operands):
+            for j in operands:
+                self.parents[j].append(i)
+        # Variable leaves of every position: none if the optimizer dropped
+        # the variable, several in a tree built without interning.
+        self.leaves: List[List[int]] = [[] for _ in variables]
+        for i, node in enumerate(self.nodes):
+            if node.operator == VARIABLE:
+                self.leaves[var_positions[node.name]].append(i)
+            elif node.operator != CONST and (
+                node.operator not in BitwiseEvaluator.bitwise_opr
+            ):
+                raise ValueError("Unknown operator")
+
+    def initial_values(self) -> List[int]:
+        # Row 0: every variable is 0.
+        values = [0] * len(self.nodes)
+        for i, node in enumerate(self.nodes):
+            if node.operator == CONST:
+                values[i] = node.value
+            elif node.operator != VARIABLE:
+                values[i] = BitwiseEvaluator.bitwise_opr[node.operator](
+                    1, *(values[j] for j in self.operands[i])
+                )
+        return values
+
+    def iter_rows(self) -> Iterator[Tuple[int, int]]:
+        # (row index, result) in Gray-code order.
+        count = len(self.variables)
+        values = self.initial_values()
+        operators = [node.operator for node in self.nodes]
+        kernels = [BitwiseEvaluator.bitwise_opr.get(op) for op in operators]
+        operands, parents = self.operands, self.parents
+        sizes = [len(node_operands) for node_operands in operands]
+        ones = [sum(values[j] for j in node_operands) for node_operands in operands]
+        root = len(self.nodes) - 1
+
+        index = 0
+        yield index, values[root]
+        for k in range(1, self.rows_count):
+            weight = (k & -k).bit_length() - 1
+            index ^= 1 << weight
+            # (node, +1 or -1) for every flip, taken when it happens: a node
+            # may flip back before its first flip is propagated.
+            changed = []
+            for leaf in self.leaves[count - 1 - weight]:
+                values[leaf] ^= 1
+                changed.append((leaf, 1 if values[leaf] else -1))
+            while changed:
+                j, delta = changed.pop()
+                for i in parents[j]:
+                    ones[i] += delta
+                    operator = operators[i]
+                    if operator == AND:
+                        value = int(ones[i] == sizes[i])
+                    elif operator == OR:
+                        value = int(ones[i] > 0)
+                    elif operator == XOR or operator == NOT:
+                        value = values[i] ^ 1
+                    else:
+                        value = kernels[i](1, *[values[m] for m in operands[i]])
+                    if value != values[i]:
+                        values[i] = value
+                        changed.append((i, 1 if value else -1))
+            yield index, values[root]
+
+    def evaluate(self) -> BitColumn:
+        # The Gray-ordered results land in natural row order.
+        column = BitColumn.zeros(self.rows_count)
+        data = column.data
+        for index, value in self.iter_rows():
+            if value:
+                data[index >> 3] |= 1 << (index & 7)
+        return column
@@ -1,24 +1,60 @@
-from typing import Dict
+from functools import cached_property
+from typing import Callable, Dict, Optional
 
-from src.pnf_contructor.language import Lexer
-from src.pnf_contructor.grammar import Parser
+from src.pnf_contructor.language import RegexLexer
+from src.pnf_contructor.grammar import IterativeParser
+from src.pnf_contructor.nodes import InterningNodeFactory
+from src.pnf_contructor.compiler import FormulaCompiler
+from src.pnf_contructor.optimizer import FormulaOptimizer
 
 
 class LogicalFunction:
-    def __init__(self, formula: str):
+    def __init__(
+        self,
+        formula: str,
+        optimize: bool = True,
+        factory: Optional[InterningNodeFactory] = None,
+    ):
         self.formula = formula
 
-        lexer = Lexer(formula)
-        parser = Parser(lexer)
+        lexer = RegexLexer(formula)
+        # Repeated subformulas (every literal of a PCNF, for one) become a
+        # single shared node, so the evaluators work on each only once. A
+        # factory shared by several functions shares nodes between them too.
+        if factory is None:
+            factory = InterningNodeFactory()
+        parser = IterativeParser(lexer, factory)
 
         self.ast = parser.parse()
+        if optimize:
+            # Constants folded, redundant operands dropped and AND/OR chains
+            # flattened; the variables stay those of the formula text.
+            self.ast = FormulaOptimizer(factory).optimize(self.ast)
         self.variables = lexer.get_variables()
 
-        self.formula_expr = self.ast.to_python()
-        var_list = ", ".join(self.variables)
-        self.eval_formula = eval(f"lambda {var_list}: {self.formula_expr}")
+    # The Python forms are built on first use: the bitwise truth-table backend
+    # never needs them, and very deep formulas are beyond the Python compiler.
+    @cached_property
+    def formula_expr(self) -> str:
+        return self.ast.to_python()
+
+    @cached_property
+    def eval_formula(self) -> Callable[..., bool]:
+        # Takes the variable values positionally, in self.variables order.
+        return FormulaCompiler(self.ast, self.variables).compile()
+
+    @cached_property
+    def eval_index(self) -> Callable[[int], bool]:
+        # Takes a truth-table row index.
+        return FormulaCompiler(self.ast, self.variables).compile_index()
 
     def evaluate(self, assignment: Dict[str, bool]) -> bool:
         # if set(assignment.keys()) != set(self.variables):
         #     raise ValueError("Assignment must include all variables")
-        return self.eval_formula(**assignment)
+        return self.eval_formula(*(assignment[var] for var in self.variables))
+
+    def evaluate_values(self, *values: bool) -> bool:
+        return self.eval_formula(*values)
+
+    def evaluate_index(self, index: int) -> bool:
+        return self.eval_index(index)
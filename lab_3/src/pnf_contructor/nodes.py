@@ -1,27 +1,62 @@
 from abc import abstractmethod, ABC
+from typing import Dict, Iterator, Tuple
 
-from src.pnf_contructor.language import Token
+from src.pnf_contructor.language import Token, VARIABLE, CONST
 
 
 class ExpressionNode(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def to_python(self):
         pass
 
+    @property
+    @abstractmethod
+    def operator(self) -> str:
+        pass
+
+    @property
+    def operands(self) -> Tuple["ExpressionNode", ...]:
+        return ()
+
 
 class VariableNode(ExpressionNode):
+    __slots__ = ("name",)
+
     def __init__(self, variable: Token):
         self.name = variable.value
 
     def to_python(self) -> str:
         return self.name
 
+    @property
+    def operator(self) -> str:
+        return VARIABLE
+
+
+class ConstantNode(ExpressionNode):
+    __slots__ = ("value",)
+
+    def __init__(self, constant: Token):
+        self.value = int(constant.value)
+
+    def to_python(self) -> str:
+        return "True" if self.value else "False"
+
+    @property
+    def operator(self) -> str:
+        return CONST
+
 
 class UnaryOperationNode(ExpressionNode):
+    __slots__ = ("opd", "opr")
+
+    unary_opr = {"NOT": lambda x: f"(not {x})"}
+
     def __init__(self, operator: Token, operand: ExpressionNode):
         self.opd = operand
         self.opr = operator
-        self.unary_opr = {"NOT": lambda x: f"(not {x})"}
 
     def to_python(self) -> str:
         opd_value = self.opd.to_python()
@@ -30,8 +65,28 @@ class UnaryOperationNode(ExpressionNode):
         else:
             raise ValueError("Unknown unary operator")
 
+    @property
+    def operator(self) -> str:
+        return self.opr.type
+
+    @property
+    def operands(self) -> Tuple[ExpressionNode, ...]:
+        return (self.opd,)
+
 
 class BinaryOperationNode(ExpressionNode):
+    __slots__ = ("left_opd", "opr", "right_opd")
+
+    binary_opr = {
+        "AND": lambda x, y: f"({x} and {y})",
+        "OR": lambda x, y: f"({x} or {y})",
+        "IMP": lambda x, y: f"(not {x} or {y})",
+        "EQU": lambda x, y: f"({x} == {y})",
+        "XOR": lambda x, y: f"({x} ^ {y})",
+        "NAND": lambda x, y: f"(not ({x} and {y}))",
+        "NOR": lambda x, y: f"(not ({x} or {y}))",
+    }
+
     def __init__(
         self,
         *,
@@ -43,13 +98,6 @@ class BinaryOperationNode(ExpressionNode):
         self.opr = operator
         self.right_opd = right_operand
 
-        self.binary_opr = {
-            "AND": lambda x, y: f"({x} and {y})",
-            "OR": lambda x, y: f"({x} or {y})",
-            "IMP": lambda x, y: f"(not {x} or {y})",
-            "EQU": lambda x, y: f"({x} == {y})",
-        }
-
     def to_python(self) -> str:
         left_opd_value = self.left_opd.to_python()
         right_opd_value = self.right_opd.to_python()
@@ -57,3 +105,136 @@ class BinaryOperationNode(ExpressionNode):
             return self.binary_opr[self.opr.type](left_opd_value, right_opd_value)
         else:
             raise ValueError("Unknown binary operator")
+
+    @property
+    def operator(self) -> str:
+        return self.opr.type
+
+    @property
+    def operands(self) -> Tuple[ExpressionNode, ...]:
+        return (self.left_opd, self.right_opd)
+
+
+class NaryOperationNode(ExpressionNode):
+    # A flattened chain of one associative operator: a & b & c is a single
+    # node with three operands instead of two nested binary ones.
+    __slots__ = ("opds", "opr")
+
+    nary_opr = {
+        "AND": lambda *xs: "(" + " and ".join(xs) + ")",
+        "OR": lambda *xs: "(" + " or ".join(xs) + ")",
+        "XOR": lambda *xs: "(" + " ^ ".join(xs) + ")",
+    }
+
+    def __init__(self, operator: Token, operands: Tuple[ExpressionNode, ...]):
+        self.opds = tuple(operands)
+        self.opr = operator
+
+    def to_python(self) -> str:
+        opd_values = [opd.to_python() for opd in self.opds]
+        if self.opr.type in self.nary_opr:
+            return self.nary_opr[self.opr.type](*opd_values)
+        else:
+            raise ValueError("Unknown n-ary operator")
+
+    @property
+    def operator(self) -> str:
+        return self.opr.type
+
+    @property
+    def operands(self) -> Tuple[ExpressionNode, ...]:
+        return self.opds
+
+
+class NodeFactory:
+    # Plain construction; parsers call these instead of the node classes so a
+    # different factory can change how nodes are allocated.
+    def variable(self, token: Token) -> ExpressionNode:
+        return VariableNode(token)
+
+    def constant(self, token: Token) -> ExpressionNode:
+        return ConstantNode(token)
+
+    def unary(self, operator: Token, operand: ExpressionNode) -> ExpressionNode:
+        return UnaryOperationNode(operator, operand)
+
+    def binary(
+        self, left: ExpressionNode, operator: Token, right: ExpressionNode
+    ) -> ExpressionNode:
+        return BinaryOperationNode(
+            left_operand=left, operator=operator, right_operand=right
+        )
+
+    def nary(
+        self, operator: Token, operands: Tuple[ExpressionNode, ...]
+    ) -> ExpressionNode:
+        return NaryOperationNode(operator, operands)
+
+
+class InterningNodeFactory(NodeFactory):
+    # Hash-consing: structurally identical subtrees are built once and shared,
+    # so the parser produces a DAG. Operands are interned before their parent,
+    # which makes their identity a complete structural key.
+    def __init__(self):
+        self.nodes: Dict[tuple, ExpressionNode] = {}
+
+    def variable(self, token: Token) -> ExpressionNode:
+        key = (VARIABLE, token.value)
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = VariableNode(token)
+        return node
+
+    def constant(self, token: Token) -> ExpressionNode:
+        key = (CONST, int(token.value))
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = ConstantNode(token)
+        return node
+
+    def unary(self, operator: Token, operand: ExpressionNode) -> ExpressionNode:
+        key = (operator.type, id(operand))
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = UnaryOperationNode(operator, operand)
+        return node
+
+    def binary(
+        self, left: ExpressionNode, operator: Token, right: ExpressionNode
+    ) -> ExpressionNode:
+        key = (operator.type, id(left), id(right))
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = BinaryOperationNode(
+                left_operand=left, operator=operator, right_operand=right
+            )
+        return node
+
+    def nary(
+        self, operator: Token, operands: Tuple[ExpressionNode, ...]
+    ) -> ExpressionNode:
+        # The operand ids go in a nested tuple, apart from the binary keys.
+        key = (operator.type, tuple(map(id, operands)))
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = NaryOperationNode(operator, operands)
+        return node
+
+
+def iter_postorder(root: ExpressionNode) -> Iterator[ExpressionNode]:
+    # Iterative walk: every distinct node is yielded once, after its operands,
+    # so deep formulas don't hit the recursion limit.
+    visited = set()
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in visited:
+            continue
+        if expanded:
+            visited.add(id(node))
+            yield node
+            continue
+        stack.append((node, True))
+        for operand in reversed(node.operands):
+            if id(operand) not in visited:
+                stack.append((operand, False))
@@ -0,0 +1,82 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from functools import lru_cache
+from typing import Optional
+
+from src.pnf_contructor.logical_function import LogicalFunction
+from src.pnf_contructor.bitwise import BitwiseEvaluator
+from src.pnf_contructor.packed import BitColumn
+
+# Segments are whole bytes of the packed column, so they can be copied into
+# place without shifting.
+MIN_CHUNK_SIZE = 8
+# Enough segments per worker that a slow one doesn't hold up the rest.
+CHUNKS_PER_WORKER = 4
+
+
+@lru_cache(maxsize=8)
+def load_function(formula: str) -> LogicalFunction:
+    # Each worker parses (and compiles) the formula once, not once per segment.
+    return LogicalFunction(formula)
+
+
+def evaluate_segment(formula: str, backend: str, start: int, stop: int) -> bytes:
+    function = load_function(formula)
+    if backend == "bitwise":
+        column = BitwiseEvaluator(function.ast, function.variables).evaluate_segment(
+            start, stop - start
+        )
+        return column.to_bytes((stop - start + 7) // 8, "little")
+
+    segment = BitColumn.zeros(stop - start)
+    evaluate_index = function.evaluate_index
+    for i in range(start, stop):
+        if evaluate_index(i):
+            segment[i - start] = 1
+    return bytes(segment.data)
+
+
+def default_chunk_size(rows_count: int, workers: int) -> int:
+    chunk_size = 1 << max(
+        0, (rows_count // (workers * CHUNKS_PER_WORKER)).bit_length() - 1
+    )
+    return max(chunk_size, MIN_CHUNK_SIZE)
+
+
+def generate_column(
+    logical_function: LogicalFunction,
+    backend: str = "bitwise",
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> BitColumn:
+    # The rows are split into contiguous ranges of chunk_size; every worker
+    # sends back the packed bytes of its range, which are written straight
+    # into the result column.
+    workers = os.cpu_count() if workers is None else workers
+    if workers < 1:
+        raise ValueError("Workers count must be positive")
+    rows_count = 2 ** len(logical_function.variables)
+    if chunk_size is None:
+        chunk_size = default_chunk_size(rows_count, workers)
+    elif chunk_size < MIN_CHUNK_SIZE or chunk_size & (chunk_size - 1):
+        raise ValueError("Chunk size must be a power of two, at least 8")
+
+    column = BitColumn.zeros(rows_count)
+    starts = range(0, rows_count, chunk_size)
+    formula = logical_function.formula
+    # Workers are spawned rather than forked: forking a process that already
+    # runs threads (an earlier pool's, for one) can deadlock the child.
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=get_context("spawn")
+    ) as executor:
+        segments = executor.map(
+            evaluate_segment,
+            [formula] * len(starts),
+            [backend] * len(starts),
+            starts,
+            [min(start + chunk_size, rows_count) for start in starts],
+        )
+        for start, segment in zip(starts, segments):
+            column.data[start >> 3 : (start >> 3) + len(segment)] = segment
+    return column
@@ -0,0 +1,80 @@
+from typing import Dict, Iterable, List, Tuple
+
+from src.pnf_contructor.bitwise import variable_column
+from src.pnf_contructor.index_form import IndexForm
+from src.pnf_contructor.anf import ZhegalkinPolynomial
+from src.pnf_contructor.truth_table import TruthTable
+
+POST_CLASSES = ("T0", "T1", "S", "M", "L")
+
+
+class PostClassAnalyzer:
+    # Every check works on the result column as a single int (bit i = row i):
+    # a handful of shifts and masks per variable instead of loops over rows.
+    def __init__(self, truth_table: TruthTable):
+        self.truth_table = truth_table
+        self.variables = truth_table.variables
+        self.variables_count = len(self.variables)
+        self.rows_count = truth_table.rows_count
+        self.full_mask = (1 << self.rows_count) - 1
+        self.column = truth_table.result_column.to_int()
+
+    def cofactors(self, position: int) -> Tuple[int, int]:
+        # (f with the variable at 0, f with it at 1), both aligned on the rows
+        # where the variable is 0.
+        high_rows = variable_column(position, self.variables_count)
+        shift = 1 << (self.variables_count - 1 - position)
+        return self.column & ~high_rows, (self.column & high_rows) >> shift
+
+    def preserves_zero(self) -> bool:
+        return self.column & 1 == 0
+
+    def preserves_one(self) -> bool:
+        return (self.column >> (self.rows_count - 1)) & 1 == 1
+
+    def is_self_dual(self) -> bool:
+        # f(!x) is row 2**n - 1 - i, so the dual is the reversed column
+        # complemented; the index number is exactly the reversed column.
+        reversed_column = IndexForm.from_column(self.truth_table.result_column).number
+        return reversed_column == self.full_mask ^ self.column
+
+    def is_monotone(self) -> bool:
+        for position in range(self.variables_count):
+            low, high = self.cofactors(position)
+            if low & ~high:
+                return False
+        return True
+
+    def is_linear(self) -> bool:
+        return ZhegalkinPolynomial.from_column(self.column, self.variables).is_linear()
+
+    def essential_variables(self) -> List[str]:
+        essential = []
+        for position, var in enumerate(self.variables):
+            low, high = self.cofactors(position)
+            if low != high:
+                essential.append(var)
+        return essential
+
+    def fictitious_variables(self) -> List[str]:
+        essential = set(self.essential_variables())
+        return [var for var in self.variables if var not in essential]
+
+    def post_classes(self) -> Dict[str, bool]:
+        # Membership in each of Post's five closed classes.
+        return {
+            "T0": self.preserves_zero(),
+            "T1": self.preserves_one(),
+            "S": self.is_self_dual(),
+            "M": self.is_monotone(),
+            "L": self.is_linear(),
+        }
+
+
+def is_functionally_complete(truth_tables: Iterable[TruthTable]) -> bool:
+    # Post's criterion: for every class some function of the system is outside it.
+    outside = set()
+    for truth_table in truth_tables:
+        membership = PostClassAnalyzer(truth_table).post_classes()
+        outside.update(name for name, inside in membership.items() if not inside)
+    return outside == set(POST_CLASSES)
@@ -0,0 +1,87 @@
+import pytest
+from itertools import product
+from pnf_contructor.anf import ZhegalkinPolynomial, mobius_transform
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+
+FORMULAS = [
+    "a",
+    "!a",
+    "a & b",
+    "a | b",
+    "a > b",
+    "a ~ b",
+    "(a & b) | (!a & c)",
+    "!(a > (b ~ !c)) | (d & !e)",
+    "((a | b) & (c > d)) ~ !(e | a)",
+]
+
+
+def naive_coefficients(table):
+    # a_i = XOR of f(j) over all rows j whose set variables are a subset of i.
+    coefficients = 0
+    for i in range(table.rows_count):
+        value = 0
+        for j in range(table.rows_count):
+            if j & ~i == 0:
+                value ^= table.get_result(j)
+        coefficients |= value << i
+    return coefficients
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_transform_matches_naive(formula):
+    table = TruthTable(LogicalFunction(formula))
+    polynomial = ZhegalkinPolynomial.from_truth_table(table)
+    assert polynomial.coefficients == naive_coefficients(table)
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_round_trip_and_evaluation(formula):
+    table = TruthTable(LogicalFunction(formula))
+    polynomial = ZhegalkinPolynomial.from_truth_table(table)
+    assert polynomial.to_truth_table().table == list(table.table)
+    for i, values in enumerate(product([0, 1], repeat=len(table.variables))):
+        assert polynomial.evaluate_index(i) == table.get_result(i)
+        assert polynomial.evaluate(dict(zip(table.variables, values))) == (
+            table.get_result(i)
+        )
+
+
+def test_transform_is_involution():
+    for count in range(6):
+        for column in (0, 1, 0b1011, (1 << 2**count) - 1):
+            column &= (1 << 2**count) - 1
+            assert mobius_transform(mobius_transform(column, count), count) == column
+
+
+@pytest.mark.parametrize(
+    "formula, text, degree",
+    [
+        ("a & b", "a&b", 2),
+        ("a | b", "a&b ^ a ^ b", 2),
+        ("a > b", "a&b ^ a ^ 1", 2),
+        ("a ~ b", "a ^ b ^ 1", 1),
+        ("a & !a", "0", 0),
+        ("a | !a", "1", 0),
+        ("a & b & c | !a & !b & !c", "a&b ^ a&c ^ b&c ^ a ^ b ^ c ^ 1", 2),
+    ],
+)
+def test_polynomial_text_and_degree(formula, text, degree):
+    polynomial = ZhegalkinPolynomial.from_truth_table(
+        TruthTable(LogicalFunction(formula))
+    )
+    assert str(polynomial) == text
+    assert polynomial.degree() == degree
+    assert polynomial.is_linear() == (degree <= 1)
+
+
+def test_from_monomials():
+    polynomial = ZhegalkinPolynomial.from_monomials(
+        [["a", "b"], ["c"], [], ["c"], ["a"]], ["a", "b", "c"]
+    )
+    assert str(polynomial) == "a&b ^ a ^ 1"
+    assert list(polynomial.iter_monomials()) == [[], ["a"], ["a", "b"]]
+    assert polynomial.to_truth_table().num_form_pdnf == [0, 1, 2, 3, 6, 7]
+    with pytest.raises(ValueError):
+        ZhegalkinPolynomial.from_monomials([["d"]], ["a", "b", "c"])
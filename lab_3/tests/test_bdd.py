@@ -0,0 +1,88 @@
+import pytest
+from pnf_contructor.bdd import BinaryDecisionDiagram, BDDManager, FALSE, TRUE
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+
+FORMULAS = [
+    "a",
+    "!a",
+    "a & !a",
+    "a | !a",
+    "a > b",
+    "a ~ b ~ c",
+    "!(a > (b ~ !c)) | (d & !e)",
+    "(a | b) & (!a | c) & (b > d) ~ 1",
+    "(x0 & y0) | (x1 & y1) | (x2 & y2)",
+]
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_models_match_truth_table(formula):
+    function = LogicalFunction(formula)
+    table = TruthTable(function)
+    bdd = BinaryDecisionDiagram(function)
+    assert list(bdd.iter_minterms()) == table.num_form_pdnf
+    assert bdd.count_models() == len(table.num_form_pdnf)
+    assert bdd.is_satisfiable() == bool(table.num_form_pdnf)
+    assert bdd.is_tautology() == (not table.num_form_pcnf)
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_order_changes_shape_not_function(formula):
+    function = LogicalFunction(formula)
+    default = BinaryDecisionDiagram(function)
+    reversed_order = BinaryDecisionDiagram(function, order=function.variables[::-1])
+    sifted = BinaryDecisionDiagram(function, sifting=True)
+    for bdd in (reversed_order, sifted):
+        assert bdd.equivalent(default)
+        assert default.equivalent(bdd)
+        assert sorted(bdd.iter_minterms()) == list(default.iter_minterms())
+        assert bdd.count_models() == default.count_models()
+
+
+def test_sifting_finds_interleaved_order():
+    pairs = [(f"x{i}", f"y{i}") for i in range(6)]
+    function = LogicalFunction(" | ".join(f"{x} & {y}" for x, y in pairs))
+    default = BinaryDecisionDiagram(function)
+    sifted = BinaryDecisionDiagram(function, sifting=True)
+    # x0..x5 before y0..y5 is exponential, interleaving is linear.
+    assert default.size == 2**7 - 2
+    assert sifted.size == 12
+    for x, y in pairs:
+        assert abs(sifted.order.index(x) - sifted.order.index(y)) == 1
+
+
+def test_reduced_diagram_is_canonical():
+    manager = BDDManager(["a", "b"])
+    first = manager.build(LogicalFunction("!(a & b)").ast)
+    second = manager.build(LogicalFunction("!a | !b").ast)
+    assert first == second
+    assert manager.build(LogicalFunction("a & !a").ast) == FALSE
+    assert manager.build(LogicalFunction("b > b").ast) == TRUE
+
+
+def test_equivalent_across_different_variables():
+    function = BinaryDecisionDiagram(LogicalFunction("a | b"))
+    assert function.equivalent(BinaryDecisionDiagram(LogicalFunction("a | b | c & !c")))
+    assert not function.equivalent(BinaryDecisionDiagram(LogicalFunction("a | c")))
+    # The first diagram now knows c, but still counts over its own variables.
+    assert function.count_models() == 3
+
+
+def test_many_variables_without_truth_table():
+    count = 40
+    equal = " & ".join(f"(x{i} ~ y{i})" for i in range(count))
+    differ = " | ".join(f"(x{i} & !y{i} | !x{i} & y{i})" for i in range(count))
+    # Sorted names put every x before every y, which is exponential here.
+    order = [var for i in range(count) for var in (f"x{i}", f"y{i}")]
+    equal_bdd = BinaryDecisionDiagram(LogicalFunction(equal), order=order)
+    differ_bdd = BinaryDecisionDiagram(LogicalFunction(f"!({differ})"), order=order)
+    assert equal_bdd.size == 3 * count
+    assert equal_bdd.count_models() == 2**count
+    assert equal_bdd.equivalent(differ_bdd)
+    assert next(equal_bdd.iter_minterms()) == 0
+
+
+def test_order_must_cover_variables():
+    with pytest.raises(ValueError):
+        BinaryDecisionDiagram(LogicalFunction("a & b"), order=["a"])
@@ -0,0 +1,95 @@
+import pytest
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+from pnf_contructor.bitwise import BitwiseEvaluator, variable_column
+
+FORMULAS = [
+    "a",
+    "!a",
+    "a & b",
+    "a | b",
+    "a > b",
+    "a ~ b",
+    "(a & b) | (!a & c)",
+    "!(a > (b ~ !c)) | (d & !e)",
+    "((a | b) & (c > d)) ~ !(e | a)",
+    "a ^ b ^ c",
+    "a !& b",
+    "a !| b",
+    "(a !& b) ^ (c !| !d) | e & a ^ b",
+]
+
+
+def column_from_rows(function: LogicalFunction) -> int:
+    table = TruthTable(function, backend="rows")
+    return sum(1 << i for i in table.num_form_pdnf)
+
+
+def test_variable_column_small():
+    assert variable_column(0, 1) == 0b10
+    assert variable_column(0, 2) == 0b1100
+    assert variable_column(1, 2) == 0b1010
+
+
+def test_variable_column_matches_row_index():
+    count = 5
+    for position in range(count):
+        column = variable_column(position, count)
+        for i in range(2**count):
+            assert (column >> i) & 1 == (i >> (count - 1 - position)) & 1
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_bitwise_evaluator_matches_rows(formula):
+    function = LogicalFunction(formula)
+    evaluator = BitwiseEvaluator(function.ast, function.variables)
+    assert evaluator.evaluate() == column_from_rows(function)
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_truth_table_backends_agree(formula):
+    function = LogicalFunction(formula)
+    by_rows = TruthTable(function, backend="rows")
+    by_bits = TruthTable(function, backend="bitwise")
+    assert by_bits.table == by_rows.table
+    assert by_bits.num_form_pdnf == by_rows.num_form_pdnf
+    assert by_bits.num_form_pcnf == by_rows.num_form_pcnf
+
+
+def test_bitwise_evaluator_negation_chain():
+    function = LogicalFunction("!" * 91 + "a")
+    evaluator = BitwiseEvaluator(function.ast, function.variables)
+    assert evaluator.evaluate() == 0b01
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        TruthTable(LogicalFunction("a"), backend="gpu")
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+@pytest.mark.parametrize("rows_count", [1, 2, 8])
+def test_segments_cover_the_column(formula, rows_count):
+    function = LogicalFunction(formula)
+    evaluator = BitwiseEvaluator(function.ast, function.variables)
+    full = evaluator.evaluate()
+    rows_count = min(rows_count, evaluator.rows_count)
+    for start in range(0, evaluator.rows_count, rows_count):
+        segment = evaluator.evaluate_segment(start, rows_count)
+        assert segment == (full >> start) & ((1 << rows_count) - 1)
+
+
+def test_unaligned_segment():
+    function = LogicalFunction("a & b & c")
+    evaluator = BitwiseEvaluator(function.ast, function.variables)
+    with pytest.raises(ValueError):
+        evaluator.evaluate_segment(2, 4)
+    with pytest.raises(ValueError):
+        evaluator.evaluate_segment(0, 3)
+
+
+def test_full_adder_with_xor():
+    # lab_4's one-bit adder: sum and carry straight from the formulas.
+    assert TruthTable(LogicalFunction("A ^ B ^ C")).num_form_pdnf == [1, 2, 4, 7]
+    carry = LogicalFunction("A & B | C & (A ^ B)")
+    assert TruthTable(carry).num_form_pdnf == [3, 5, 6, 7]
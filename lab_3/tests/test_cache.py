@@ -0,0 +1,77 @@
+import pytest
+from pnf_contructor.cache import FormulaCache, canonical_form
+from pnf_contructor.logical_function import LogicalFunction
+
+
+def test_canonical_form_ignores_whitespace_and_operand_order():
+    first = LogicalFunction("(a & b) | !c")
+    second = LogicalFunction("!c|(b&a)")
+    assert canonical_form(first.ast) == canonical_form(second.ast)
+
+
+def test_canonical_form_keeps_implication_order():
+    assert canonical_form(LogicalFunction("a > b").ast) != canonical_form(
+        LogicalFunction("b > a").ast
+    )
+
+
+def test_hit_on_equivalent_spelling():
+    cache = FormulaCache()
+    table = cache.get_table("a & b | c")
+    assert cache.get_table("  c | b&a ") is table
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.parametrize(
+    "cached, invalid", [("x1 & y", "x 1 & y"), ("a!&b", "a ! & b"), ("ab", "a b")]
+)
+def test_alias_keeps_syntax_errors(cached, invalid):
+    cache = FormulaCache()
+    cache.get_function(cached)
+    with pytest.raises(Exception, match="Invalid syntax"):
+        cache.get_function(invalid)
+    assert cache.stats()["entries"] == 1
+
+
+def test_function_and_table_share_entry():
+    cache = FormulaCache()
+    function = cache.get_function("a > b")
+    table = cache.get_table("a>b")
+    assert table.logical_function is function
+    assert cache.stats()["entries"] == 1
+
+
+def test_lru_eviction_by_entries():
+    cache = FormulaCache(max_entries=2)
+    cache.get_function("a")
+    cache.get_function("b")
+    cache.get_function("a")
+    cache.get_function("c")
+    assert cache.stats()["evictions"] == 1
+    cache.get_function("a")
+    assert cache.stats()["hits"] == 2
+    cache.get_function("b")
+    assert cache.stats()["misses"] == 4
+
+
+def test_eviction_by_memory():
+    cache = FormulaCache(max_memory=3000)
+    cache.get_table("a & b & c & d & e & f & g & h & i & j & k & l & m & n & o & p")
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["memory"] == 0
+
+
+def test_memory_accounting():
+    cache = FormulaCache()
+    cache.get_table("a & b & c & d & e & f & g & h & i & j & k & l")
+    assert cache.stats()["memory"] >= 2**12 // 8
+    cache.clear()
+    assert cache.stats()["memory"] == 0
+    assert cache.stats()["entries"] == 0
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        FormulaCache(max_entries=0)
@@ -0,0 +1,66 @@
+import pytest
+from itertools import product
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.compiler import FormulaCompiler
+from pnf_contructor.truth_table import TruthTable
+
+FORMULAS = [
+    "a",
+    "!a",
+    "a & b",
+    "a | b",
+    "a > b",
+    "a ~ b",
+    "!(a > (b ~ !c)) | (d & !e)",
+]
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_positional_evaluator_matches_evaluate(formula):
+    function = LogicalFunction(formula)
+    for values in product([False, True], repeat=len(function.variables)):
+        assignment = dict(zip(function.variables, values))
+        assert function.evaluate_values(*values) is function.evaluate(assignment)
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_evaluate_index_matches_rows(formula):
+    function = LogicalFunction(formula)
+    for i, values in enumerate(product([False, True], repeat=len(function.variables))):
+        assert function.evaluate_index(i) is function.evaluate_values(*values)
+
+
+def test_evaluate_keeps_keyword_assignment():
+    function = LogicalFunction("a > b")
+    assert function.evaluate({"a": True, "b": False}) is False
+    assert function.evaluate({"b": True, "a": True}) is True
+
+
+def test_compiled_functions_have_no_builtins():
+    function = LogicalFunction("a & b")
+    assert function.eval_formula.__globals__["__builtins__"] == {}
+
+
+def test_index_argument_does_not_shadow_variables():
+    function = LogicalFunction("a & b")
+    compiler = FormulaCompiler(function.ast, ["index", "a", "b"])
+    evaluate_index = compiler.compile_index()
+    assert evaluate_index(0b011) is True
+    assert evaluate_index(0b101) is False
+
+
+@pytest.mark.parametrize("formula", ["True & a", "None | b", "a & __debug__"])
+def test_python_reserved_variable_names(formula):
+    function = LogicalFunction(formula)
+    for values in product([False, True], repeat=len(function.variables)):
+        assignment = dict(zip(function.variables, values))
+        assert function.evaluate_values(*values) is function.evaluate(assignment)
+    rows = TruthTable(LogicalFunction(formula), backend="rows")
+    bitwise = TruthTable(LogicalFunction(formula), backend="bitwise")
+    assert rows.table == bitwise.table
+
+
+def test_python_reserved_variable_values():
+    function = LogicalFunction("None | b")
+    assert function.evaluate_values(True, False) is True
+    assert function.evaluate_values(False, False) is False
@@ -1,6 +1,8 @@
 import pytest
+import random
 from pnf_contructor.truth_table import TruthTable
 from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.index_form import default_variables
 from corno.minimizer import Minimizer
 
 
@@ -80,3 +82,89 @@ def test_merge():
 def test_asterisks_position_check():
     assert Minimizer.asterisks_position_check([1, "*", 0], [1, "*", 1])
     assert not Minimizer.asterisks_position_check([1, "*", 0], [1, 0, "*"])
+
+
+def test_term_implicant_round_trip():
+    assert Minimizer.term_to_implicant((0b100, 0b101), 3) == [1, "*", 0]
+    assert Minimizer.implicant_to_term([1, "*", 0]) == (0b100, 0b101)
+    assert Minimizer.implicant_to_term(["*", "*"]) == (0, 0)
+
+
+def test_prime_implicants():
+    # Minterms 0, 1, 2, 5, 6, 7: the classic cyclic function has six primes.
+    terms = [(i, 0b111) for i in (0, 1, 2, 5, 6, 7)]
+    primes = Minimizer.prime_implicants(terms, 3)
+    assert primes == [
+        (0b000, 0b110),
+        (0b000, 0b101),
+        (0b001, 0b011),
+        (0b010, 0b011),
+        (0b110, 0b110),
+        (0b101, 0b101),
+    ]
+    assert Minimizer.prime_implicants([], 3) == []
+    assert Minimizer.prime_implicants([(i, 0b11) for i in range(4)], 2) == [(0, 0)]
+
+
+@pytest.mark.parametrize("variables_count", [1, 2, 3, 4, 5, 6])
+def test_prime_implicants_match_merge_groups(variables_count):
+    rng = random.Random(variables_count)
+    for _ in range(10):
+        table = TruthTable(
+            variables=default_variables(variables_count),
+            column=rng.getrandbits(2**variables_count),
+        )
+        for is_pdnf in (True, False):
+            group = table.group_pdnf() if is_pdnf else table.group_pcnf()
+            expected = Minimizer.merge_groups(group, display_merging=False)
+            primes = Minimizer(table).get_prime_implicants(is_pdnf, False)
+            assert sorted(map(str, primes)) == sorted(map(str, expected))
+            assert len(primes) == len(expected)
+
+
+def test_prime_implicants_display(capsys):
+    Minimizer.prime_implicants([(i, 0b11) for i in (1, 3)], 2, display_merging=True)
+    assert capsys.readouterr().out == "Group 1: 01\nGroup 2: 11\n\nGroup 1: *1\n\n"
+
+
+def test_prime_implicants_with_dont_cares():
+    # Minterm 1 with 3 and 5 free: !b & c and !a & c, but not a & c, which
+    # holds don't-cares only.
+    terms = [(0b001, 0b111)]
+    dont_cares = [(0b011, 0b111), (0b101, 0b111), (0b111, 0b111)]
+    primes = Minimizer.prime_implicants(terms, 3, dont_cares=dont_cares)
+    assert primes == [(0b001, 0b001)]
+    # 6 stays alone and is dropped.
+    dont_cares = [(0b011, 0b111), (0b110, 0b111)]
+    primes = Minimizer.prime_implicants(terms, 3, dont_cares=dont_cares)
+    assert primes == [(0b001, 0b101)]
+
+
+def test_computational_minimization_with_dont_cares():
+    # BCD digits: rows 10 to 15 never occur.
+    rows = [
+        [
+            (i >> 3) & 1,
+            (i >> 2) & 1,
+            (i >> 1) & 1,
+            i & 1,
+            int(i >= 8) if i < 10 else "-",
+        ]
+        for i in range(16)
+    ]
+    table = TruthTable(table=rows, variables=["a", "b", "c", "d"])
+    minimizer = Minimizer(table)
+    assert (
+        minimizer.computational_minimization(is_pdnf=True, display_merging=False)
+        == "(a)"
+    )
+    assert (
+        minimizer.computational_table_minimization(
+            is_pdnf=True, display_merging=False, display_table=False
+        )
+        == "(a)"
+    )
+    assert (
+        minimizer.computational_minimization(is_pdnf=False, display_merging=False)
+        == "(a)"
+    )
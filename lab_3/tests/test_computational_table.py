@@ -81,3 +81,31 @@ def test_convert_bin_to_var_form(minimizer_simple):
     cnf_result = minimizer_simple.convert_bin_to_var_form(implicant, is_pdnf=False)
     assert dnf_result == "a&!b"
     assert cnf_result == "!a|b"
+
+
+def test_cyclic_core_is_covered():
+    # Minterms 0, 1, 2, 5, 6, 7: no implicant is essential, and the essential
+    # implicants alone used to give an empty form.
+    table = TruthTable(variables=["a", "b", "c"], column=0b11100111)
+    minimizer = Minimizer(table)
+    results = [
+        minimizer.computational_table_minimization(
+            is_pdnf=True, display_merging=False, display_table=False
+        ),
+        minimizer.computational_minimization(is_pdnf=True, display_merging=False),
+    ]
+    for result in results:
+        assert result.count("|") == 2
+        assert TruthTable(LogicalFunction(result)).num_form_pdnf == table.num_form_pdnf
+    assert minimizer.cover_exact
+
+
+def test_minimal_cover_of_random_functions():
+    for column in (0x6BF1, 0x35C0, 0xF00D, 0x9669):
+        table = TruthTable(variables=["a", "b", "c", "d"], column=column)
+        for is_pdnf in (True, False):
+            result = Minimizer(table).computational_table_minimization(
+                is_pdnf=is_pdnf, display_merging=False, display_table=False
+            )
+            expected = table.num_form_pdnf
+            assert TruthTable(LogicalFunction(result)).num_form_pdnf == expected
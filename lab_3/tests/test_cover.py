@@ -0,0 +1,63 @@
+import itertools
+import random
+import pytest
+from corno.cover import CoverSolver, iter_bits
+
+
+def union(rows, chosen):
+    result = 0
+    for i in chosen:
+        result |= rows[i]
+    return result
+
+
+def test_iter_bits():
+    assert list(iter_bits(0b101001)) == [0, 3, 5]
+    assert list(iter_bits(0)) == []
+
+
+def test_cyclic_chart():
+    # Six implicants around a cycle of six minterms: three are needed.
+    rows = [0b000011, 0b000110, 0b001100, 0b011000, 0b110000, 0b100001]
+    solver = CoverSolver(rows)
+    chosen = solver.solve()
+    assert len(chosen) == 3
+    assert union(rows, chosen) == 0b111111
+    assert solver.exact
+
+
+def test_essential_and_dominated_rows():
+    rows = [0b0001, 0b0011, 0b0110, 0b1100, 0b0100]
+    assert CoverSolver(rows).solve() == [1, 3]
+    # The cheaper of two equal rows is taken.
+    assert CoverSolver([0b11, 0b11], [2, 1]).solve() == [1]
+
+
+def test_minimum_cost_of_random_charts():
+    rng = random.Random(0)
+    for _ in range(200):
+        rows = [rng.getrandbits(10) for _ in range(rng.randint(1, 8))]
+        costs = [rng.randint(1, 4) for _ in rows]
+        columns = union(rows, range(len(rows)))
+        chosen = CoverSolver(rows, costs).solve()
+        assert union(rows, chosen) == columns
+        assert sum(costs[i] for i in chosen) == min(
+            sum(costs[i] for i in subset)
+            for count in range(len(rows) + 1)
+            for subset in itertools.combinations(range(len(rows)), count)
+            if union(rows, subset) == columns
+        )
+
+
+def test_time_budget_falls_back_to_greedy():
+    rng = random.Random(1)
+    rows = [rng.getrandbits(200) | (1 << i) for i in range(200)]
+    solver = CoverSolver(rows, time_budget=0)
+    chosen = solver.solve()
+    assert union(rows, chosen) == (1 << 200) - 1
+    assert not solver.exact
+
+
+def test_uncoverable_columns():
+    with pytest.raises(ValueError):
+        CoverSolver([0b01]).solve(0b11)
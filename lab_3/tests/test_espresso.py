@@ -0,0 +1,148 @@
+import io
+import random
+import pytest
+from pnf_contructor.truth_table import TruthTable
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.terms import terms_to_column
+from pnf_contructor.index_form import default_variables
+from corno.minimizer import Minimizer
+from corno.espresso import EspressoMinimizer
+from corno.pla import Pla, format_cube, parse_cube
+
+PLA_TEXT = """\
+# a two-output example
+.i 3
+.o 2
+.ilb a b c
+.ob f g
+.type fd
+.p 4
+11- 10
+0-1 1-
+111 01
+000 0-
+.e
+"""
+
+
+def test_cube_round_trip():
+    espresso = EspressoMinimizer([], 4)
+    for term in [(0b1010, 0b1110), (0, 0), (0b1111, 0b1111)]:
+        assert espresso.to_term(espresso.to_cube(term)) == term
+    assert espresso.literals(espresso.to_cube((0b1010, 0b1110))) == 3
+    assert espresso.is_empty(espresso.to_cube((0b1, 0b1)) & espresso.to_cube((0, 1)))
+
+
+def test_tautology_and_complement_supercube():
+    espresso = EspressoMinimizer([], 3)
+    a, not_a = espresso.to_cube((0b100, 0b100)), espresso.to_cube((0, 0b100))
+    b = espresso.to_cube((0b010, 0b010))
+    assert espresso.tautology([a, not_a])
+    assert not espresso.tautology([a, b])
+    assert espresso.complement_supercube([a, not_a]) == 0
+    # The complement of a | b is !a & !b.
+    assert espresso.to_term(espresso.complement_supercube([a, b])) == (0, 0b110)
+
+
+def test_simple_function():
+    minimizer = Minimizer(TruthTable(LogicalFunction("(a & b) | (!a & c)")))
+    assert minimizer.espresso_minimization(is_pdnf=True) == "(!a&c)|(a&b)"
+    assert minimizer.espresso_minimization(is_pdnf=False) == "(a|c)&(!a|b)"
+    results = minimizer.minimize_outputs("espresso", is_pdnf=True)
+    assert list(results.values()) == ["(!a&c)|(a&b)"]
+
+
+def test_random_functions_give_prime_covers():
+    # Heuristic: a few terms over the exact minimum, in total.
+    rng = random.Random(0)
+    exact_total = espresso_total = 0
+    for count in range(1, 8):
+        for _ in range(15):
+            column = rng.getrandbits(2**count)
+            table = TruthTable(variables=default_variables(count), column=column)
+            terms = EspressoMinimizer(table.iter_pdnf_terms(), count).minimize()
+            assert terms_to_column(terms, count) == column
+            primes = set(Minimizer.prime_implicants(table.iter_pdnf_terms(), count))
+            assert set(terms) <= primes
+            _, chosen = Minimizer(table).get_minimal_implicants(True, False)
+            exact_total += len(chosen)
+            espresso_total += len(terms)
+    assert espresso_total <= exact_total * 1.05
+
+
+def test_dont_cares_are_used_but_not_required():
+    rng = random.Random(1)
+    full = (1 << 6) - 1
+    for _ in range(30):
+        on = rng.getrandbits(64)
+        dont_cares = rng.getrandbits(64) & ~on
+        terms = EspressoMinimizer(
+            [(i, full) for i in range(64) if (on >> i) & 1],
+            6,
+            [(i, full) for i in range(64) if (dont_cares >> i) & 1],
+        ).minimize()
+        column = terms_to_column(terms, 6)
+        assert column & on == on
+        assert column & ~(on | dont_cares) == 0
+    # x1 & x2 with x1 & !x2 free: x1 alone.
+    assert EspressoMinimizer([(0b11, 0b11)], 2, [(0b10, 0b11)]).minimize() == [
+        (0b10, 0b10)
+    ]
+
+
+def test_large_cube_list():
+    # Forty inputs, far past any truth table: 8 seed cubes, each cut into 8.
+    rng = random.Random(2)
+    count = 40
+    cubes = []
+    for _ in range(8):
+        positions = rng.sample(range(count), 15)
+        mask = sum(1 << p for p in positions[:12])
+        value = rng.getrandbits(count) & mask
+        split = positions[12:]
+        for k in range(8):
+            extra = sum(1 << p for j, p in enumerate(split) if (k >> j) & 1)
+            cubes.append((value | extra, mask | sum(1 << p for p in split)))
+    terms = EspressoMinimizer(cubes, count).minimize()
+    assert len(terms) <= 8
+    espresso = EspressoMinimizer(terms, count)
+    cover = [espresso.to_cube(term) for term in terms]
+    for cube in cubes:
+        assert espresso.covers(cover, espresso.to_cube(cube))
+
+
+def test_read_pla():
+    pla = Pla.read(io.StringIO(PLA_TEXT))
+    assert pla.inputs == ["a", "b", "c"]
+    assert pla.outputs == ["f", "g"]
+    assert pla.on_sets == [[(0b110, 0b110), (0b001, 0b101)], [(0b111, 0b111)]]
+    assert pla.dont_cares == [[], [(0b001, 0b101), (0, 0b111)]]
+    terms = EspressoMinimizer(pla.on_sets[0], 3, pla.dont_cares[0]).minimize()
+    assert terms == [(0b001, 0b101), (0b110, 0b110)]
+
+
+def test_pla_round_trip():
+    pla = Pla.read(io.StringIO(PLA_TEXT))
+    stream = io.StringIO()
+    pla.write(stream)
+    stream.seek(0)
+    loaded = Pla.read(stream)
+    assert loaded.on_sets == pla.on_sets
+    assert loaded.dont_cares == pla.dont_cares
+    assert parse_cube(format_cube((0b0101, 0b0111), 4)) == (0b0101, 0b0111)
+    assert format_cube((0b0101, 0b0111), 4) == "-101"
+
+
+def test_pla_defaults_and_errors():
+    pla = Pla.read(io.StringIO(".i 2\n.o 1\n.type f\n1- 1\n01 -\n"))
+    assert pla.inputs == ["x1", "x2"]
+    assert pla.outputs == ["f0"]
+    assert pla.dont_cares == [[]]
+    with pytest.raises(ValueError):
+        Pla.read(io.StringIO("1- 1\n"))
+    with pytest.raises(ValueError):
+        Pla.read(io.StringIO(".i 2\n.o 1\n1-- 1\n"))
+    with pytest.raises(ValueError):
+        Pla.read(io.StringIO(".i 2\n.o 1\n1x 1\n"))
+    with pytest.raises(ValueError):
+        Pla.read(io.StringIO(".i 2\n.o 1\n.type fr\n"))
@@ -0,0 +1,107 @@
+import pytest
+from pnf_contructor.language import Lexer, RegexLexer
+from pnf_contructor.grammar import Parser, IterativeParser
+from pnf_contructor.nodes import iter_postorder
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+
+
+def shape(root):
+    # Operators and leaves in post-order fully determine the tree.
+    return [
+        (node.operator, getattr(node, "name", getattr(node, "value", None)))
+        for node in iter_postorder(root)
+    ]
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "a",
+        "!a",
+        "!!a",
+        "a & b & c",
+        "a | b & c",
+        "a > b > c",
+        "a ~ b > c | d & !e",
+        "!(a | b) & c",
+        "((a))",
+        "(a > (b ~ !c)) | !(d & e) ~ f",
+        "1 & (a | 0)",
+        "(a & b) & c",
+        "a & (b & c) & d",
+        "a ^ b ^ c",
+        "a !& b !& c",
+        "a & b !& c & d",
+        "a | b !| c | d",
+        "!a ^ b & c | d !| e ~ f",
+    ],
+)
+def test_same_tree_as_recursive_parser(formula):
+    recursive = Parser(RegexLexer(formula)).parse()
+    iterative = IterativeParser(RegexLexer(formula)).parse()
+    assert shape(iterative) == shape(recursive)
+
+
+def test_chains_are_single_nodes():
+    ast = IterativeParser(RegexLexer("a & b & c | d | e")).parse()
+    assert shape(ast) == [
+        ("VARIABLE", "a"),
+        ("VARIABLE", "b"),
+        ("VARIABLE", "c"),
+        ("AND", None),
+        ("VARIABLE", "d"),
+        ("VARIABLE", "e"),
+        ("OR", None),
+    ]
+    assert [len(node.operands) for node in iter_postorder(ast)][-4:] == [3, 0, 0, 3]
+
+
+def test_precedence_of_new_operators():
+    # NOT > AND, NAND > XOR > OR, NOR > IMP > EQU.
+    ast = IterativeParser(RegexLexer("a | b ^ c & d")).parse()
+    assert [node.operator for node in iter_postorder(ast)][-3:] == ["AND", "XOR", "OR"]
+    ast = IterativeParser(RegexLexer("a !| b ^ c !& d")).parse()
+    assert [node.operator for node in iter_postorder(ast)][-3:] == [
+        "NAND",
+        "XOR",
+        "NOR",
+    ]
+
+
+def test_long_chain_is_flat():
+    formula = " | ".join(f"(x{i} & !y{i})" for i in range(5000))
+    ast = IterativeParser(RegexLexer(formula)).parse()
+    assert ast.operator == "OR"
+    assert len(ast.operands) == 5000
+
+
+def test_works_with_char_lexer():
+    formula = "!(a & b) | c ^ d !& e !| f"
+    assert shape(IterativeParser(Lexer(formula)).parse()) == shape(
+        Parser(Lexer(formula)).parse()
+    )
+
+
+@pytest.mark.parametrize(
+    "formula", ["", "a &", "& a", "(a", "a)", "a b", "()", "!", "a ! b", "(a | b))"]
+)
+def test_invalid_syntax(formula):
+    with pytest.raises(Exception) as exc_info:
+        IterativeParser(RegexLexer(formula)).parse()
+    assert str(exc_info.value) == "Invalid syntax"
+
+
+def test_deep_parentheses():
+    depth = 100_000
+    formula = "(" * depth + "a & b" + ")" * depth
+    ast = IterativeParser(RegexLexer(formula)).parse()
+    assert shape(ast) == [("VARIABLE", "a"), ("VARIABLE", "b"), ("AND", None)]
+
+
+def test_long_negation_chain():
+    depth = 100_000
+    function = LogicalFunction("!" * depth + "(a | b)")
+    assert TruthTable(function).num_form_pdnf == [1, 2, 3]
+    function = LogicalFunction("!" * (depth + 1) + "(a | b)")
+    assert TruthTable(function).num_form_pdnf == [0]
@@ -0,0 +1,72 @@
+import pytest
+from pnf_contructor.language import RegexLexer
+from pnf_contructor.grammar import IterativeParser
+from pnf_contructor.nodes import NodeFactory
+from pnf_contructor.gray import gray_code, gray_sequence, GrayCodeEvaluator
+from pnf_contructor.bitwise import BitwiseEvaluator
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+from corno.minimizer import Minimizer
+
+FORMULAS = [
+    "a",
+    "!a",
+    "a & b & c",
+    "(a & b) | (!a & c)",
+    "!(a > (b ~ !c)) | (d & !e)",
+    "a ^ b ^ c ^ d",
+    "(a !& b) ^ (c !| !d) | e & a ^ b",
+    "(a | !a) & b",
+    "1 & (a | 0) ~ c",
+]
+
+
+def test_gray_sequence_changes_one_bit_per_step():
+    sequence = gray_sequence(5)
+    assert sequence[:8] == [0, 1, 3, 2, 6, 7, 5, 4]
+    assert sorted(sequence) == list(range(32))
+    for previous, current in zip(sequence, sequence[1:]):
+        assert (previous ^ current).bit_count() == 1
+    assert gray_code(0b1011) == 0b1110
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_matches_bitwise_evaluator(formula):
+    function = LogicalFunction(formula)
+    column = GrayCodeEvaluator(function.ast, function.variables).evaluate()
+    expected = BitwiseEvaluator(function.ast, function.variables).evaluate()
+    assert column.to_int() == expected
+
+
+def test_repeated_operands_of_a_tree():
+    # Without interning or the optimizer, "a & a" has the same leaf twice
+    # under one parent.
+    lexer = RegexLexer("(a & a) | (b > b) & !(c ^ c ^ c)")
+    root = IterativeParser(lexer, NodeFactory()).parse()
+    variables = lexer.get_variables()
+    column = GrayCodeEvaluator(root, variables).evaluate()
+    assert column.to_int() == BitwiseEvaluator(root, variables).evaluate()
+
+
+def test_rows_come_in_gray_order():
+    function = LogicalFunction("a & !b | c")
+    rows = list(GrayCodeEvaluator(function.ast, function.variables).iter_rows())
+    assert [index for index, _ in rows] == gray_sequence(3)
+    for index, value in rows:
+        assert value == int(function.evaluate_index(index))
+
+
+def test_truth_table_backend():
+    function = LogicalFunction("(a > b) & (c ~ d) | !e")
+    table = TruthTable(function, backend="gray")
+    assert table.num_form_pdnf == TruthTable(function).num_form_pdnf
+
+
+def test_karnaugh_axes_follow_gray_code():
+    table = TruthTable(LogicalFunction("a & !b | c ^ d & e"))
+    karnaugh_map, row_labels, col_labels, *_ = Minimizer(table).generate_karnaugh_map()
+    assert col_labels == ["000", "001", "011", "010", "110", "111", "101", "100"]
+    for i, row_label in enumerate(row_labels):
+        for j, col_label in enumerate(col_labels):
+            index = int(row_label + col_label, 2)
+            assert karnaugh_map[i][j] == table.result_column[index]
@@ -0,0 +1,72 @@
+import pytest
+from pnf_contructor.incremental import IncrementalSession
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+
+EDITS = [
+    "(a & b) | (c > d) | (e ~ f)",
+    "(a & b) | (c > !d) | (e ~ f)",
+    "(a & b) | (c > !d) | (e ^ f)",
+    "(a & b) | (c > d) | (e ~ f)",
+    "(a & b) | (c > d) | (e ~ f) | (a !& f)",
+    "a | b",
+    "(a | b) & !(c | d) & (e > 0)",
+]
+
+
+def test_tables_match_full_rebuild():
+    session = IncrementalSession()
+    for formula in EDITS:
+        table = session.update(formula)
+        expected = TruthTable(LogicalFunction(formula))
+        assert table.variables == expected.variables
+        assert table.result_column.to_int() == expected.result_column.to_int()
+        assert table.result_header == formula
+
+
+def test_only_the_edited_path_is_evaluated():
+    session = IncrementalSession()
+    session.update("(a & b) | (c > d) | (e ~ f)")
+    assert session.reused == 0
+    # !d, (c > !d) and the root are new; everything else is cached.
+    session.update("(a & b) | (c > !d) | (e ~ f)")
+    assert session.evaluated == 3
+    assert session.reused == 8
+    # Going back needs only the old implication and the root again.
+    session.update("(a & b) | (c > d) | (e ~ f)")
+    assert session.evaluated == 2
+
+
+def test_unchanged_formula_is_not_evaluated():
+    session = IncrementalSession()
+    session.update("(a > b) ~ (c | !d)")
+    table = session.update("(a>b) ~ (c|!d)")
+    assert session.evaluated == 0
+    assert (
+        table.num_form_pdnf
+        == TruthTable(LogicalFunction("(a > b) ~ (c | !d)")).num_form_pdnf
+    )
+
+
+def test_new_variables_start_over():
+    session = IncrementalSession()
+    session.update("a & b")
+    table = session.update("a & b & c")
+    assert session.reused == 0
+    assert table.num_form_pdnf == [7]
+
+
+def test_cache_keeps_only_the_current_formula():
+    session = IncrementalSession()
+    session.update("(a | b) & (c | d) & (a > d)")
+    session.update("(a | c) & (b ~ d)")
+    assert len(session.columns) == 7
+    assert len(session.factory.nodes) <= 9
+
+
+def test_invalid_formula_keeps_the_session():
+    session = IncrementalSession()
+    session.update("a & b")
+    with pytest.raises(Exception):
+        session.update("a & (b")
+    assert session.update("a | b").num_form_pdnf == [1, 2, 3]
@@ -0,0 +1,85 @@
+import sys
+import pytest
+from pnf_contructor.index_form import IndexForm, int_to_decimal, decimal_to_int
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+
+FORMULAS = ["a", "!a", "a & b", "a | b", "a > b", "!(a > (b ~ !c)) | (d & !e)"]
+
+
+def old_index_form(table):
+    result = ["0"] * table.rows_count
+    for i in table.num_form_pdnf:
+        result[i] = "1"
+    return "".join(result)
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_index_form_matches_joined_string(formula):
+    table = TruthTable(LogicalFunction(formula))
+    index_form = table.index_form
+    assert table.get_index_form() == old_index_form(table)
+    assert str(index_form) == old_index_form(table)
+    assert int(index_form) == int(old_index_form(table), 2)
+    assert int(index_form.to_hex(), 16) == int(index_form)
+    assert index_form.to_decimal() == str(int(index_form))
+
+
+def test_small_index_numbers():
+    assert TruthTable(LogicalFunction("a & b")).index_form.number == 1
+    assert TruthTable(LogicalFunction("a | b")).index_form.number == 7
+    assert TruthTable(LogicalFunction("!a")).index_form.to_binary() == "10"
+    assert IndexForm(0b0111, 2).to_hex() == "7"
+    assert IndexForm(0b0111, 2).to_bytes() == b"\x07"
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_table_from_index_form(formula):
+    table = TruthTable(LogicalFunction(formula))
+    loaded = TruthTable.from_index_form(table.index_form, table.variables)
+    assert loaded.logical_function is None
+    assert loaded.table == table.table
+    assert loaded.get_pdnf() == table.get_pdnf()
+
+
+def test_table_from_index_form_default_variables():
+    table = TruthTable.from_index_form(IndexForm.from_binary("0110"))
+    assert table.variables == ["x1", "x2"]
+    assert table.num_form_pdnf == [1, 2]
+    with pytest.raises(ValueError):
+        TruthTable.from_index_form(IndexForm(1, 2), ["a"])
+
+
+def test_parsing_index_forms():
+    assert IndexForm.from_binary("00010111") == IndexForm(23, 3)
+    assert IndexForm.from_hex("17", 3) == IndexForm(23, 3)
+    assert IndexForm.from_decimal("23", 3) == IndexForm(23, 3)
+    with pytest.raises(ValueError):
+        IndexForm.from_binary("011")
+    with pytest.raises(ValueError):
+        IndexForm(16, 2)
+
+
+def test_decimal_past_int_max_str_digits():
+    variables = "abcdefghijklmnop"
+    table = TruthTable(LogicalFunction(" | ".join(variables)))
+    index_form = table.index_form
+    # 2**65536 - 2: every row but the first is 1.
+    assert index_form.number == (1 << 2**16 - 1) - 1
+    decimal = index_form.to_decimal()
+    assert len(decimal) > sys.get_int_max_str_digits()
+    assert decimal_to_int(decimal) == index_form.number
+    assert IndexForm.from_decimal(decimal, 16).to_column() == table.result_column
+
+
+@pytest.mark.parametrize("exponent", [0, 1, 1023, 1024, 5000, 9000])
+def test_decimal_round_trip(exponent):
+    value = 3**exponent + exponent
+    text = int_to_decimal(value)
+    assert decimal_to_int(text) == value
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        assert text == str(value)
+    finally:
+        sys.set_int_max_str_digits(limit)
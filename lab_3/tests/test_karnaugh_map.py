@@ -100,3 +100,17 @@ def test_too_many_variables():
     function = LogicalFunction("a & b & c & d & e & f")
     with pytest.raises(ValueError):
         Minimizer(TruthTable(function)).generate_karnaugh_map()
+
+
+def test_karnaugh_map_minimization_with_dont_cares(capsys):
+    # a & b with the row a & !b free: a alone.
+    table = TruthTable(
+        table=[[0, 0, 0], [0, 1, 0], [1, 0, "-"], [1, 1, 1]], variables=["a", "b"]
+    )
+    minimizer = Minimizer(table)
+    assert minimizer.karnaugh_map_minimization(is_pdnf=True) == "(a)"
+    assert "-" in capsys.readouterr().out
+    assert (
+        minimizer.karnaugh_map_minimization(is_pdnf=False, display_karnaugh_map=False)
+        == "(a)"
+    )
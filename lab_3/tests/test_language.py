@@ -0,0 +1,118 @@
+import pytest
+from pnf_contructor.language import (
+    Lexer,
+    RegexLexer,
+    VARIABLE,
+    CONST,
+    AND,
+    OR,
+    NOT,
+    LPAREN,
+    RPAREN,
+    EOF,
+)
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+
+
+def token_pairs(lexer):
+    pairs = []
+    while True:
+        token = lexer.get_next_token()
+        pairs.append((token.type, token.value))
+        if token.type == EOF:
+            return pairs
+
+
+def test_regex_lexer_matches_char_lexer():
+    formula = "!(a & b) | (c > d) ~ (e|!f) ^ g !& h !| !i"
+    assert token_pairs(RegexLexer(formula)) == token_pairs(Lexer(formula))
+
+
+def test_multi_character_identifiers():
+    lexer = RegexLexer("q4 & !x_10 | V")
+    assert token_pairs(lexer) == [
+        (VARIABLE, "q4"),
+        (AND, "&"),
+        (NOT, "!"),
+        (VARIABLE, "x_10"),
+        (OR, "|"),
+        (VARIABLE, "V"),
+        (EOF, None),
+    ]
+    assert lexer.get_variables() == ["V", "q4", "x_10"]
+
+
+def test_non_ascii_identifiers():
+    lexer = RegexLexer("а & б | é1")
+    assert token_pairs(lexer) == [
+        (VARIABLE, "а"),
+        (AND, "&"),
+        (VARIABLE, "б"),
+        (OR, "|"),
+        (VARIABLE, "é1"),
+        (EOF, None),
+    ]
+    assert token_pairs(RegexLexer("а & б")) == token_pairs(Lexer("а & б"))
+
+    function = LogicalFunction("а & б")
+    assert function.variables == ["а", "б"]
+    assert TruthTable(function, backend="rows").num_form_pdnf == [3]
+    assert function.evaluate_values(True, True) is True
+
+
+def test_constants():
+    assert token_pairs(RegexLexer("(1 & a) | 0")) == [
+        (LPAREN, "("),
+        (CONST, 1),
+        (AND, "&"),
+        (VARIABLE, "a"),
+        (RPAREN, ")"),
+        (OR, "|"),
+        (CONST, 0),
+        (EOF, None),
+    ]
+
+
+def test_eof_is_repeated():
+    lexer = RegexLexer("a")
+    lexer.get_next_token()
+    assert lexer.get_next_token().type == EOF
+    assert lexer.get_next_token().type == EOF
+
+
+@pytest.mark.parametrize(
+    "formula, message",
+    [
+        ("a & $", "Invalid character '$' at position 4"),
+        ("a | 10", "Invalid character '1' at position 4"),
+        ("2a", "Invalid character '2' at position 0"),
+    ],
+)
+def test_error_position(formula, message):
+    with pytest.raises(Exception) as exc_info:
+        RegexLexer(formula)
+    assert str(exc_info.value) == message
+
+
+def test_logical_function_with_identifiers_and_constants():
+    function = LogicalFunction("(q4 & q3) | 0")
+    assert function.variables == ["q3", "q4"]
+    assert TruthTable(function).num_form_pdnf == [3]
+
+    function = LogicalFunction("x_1 > 1")
+    assert TruthTable(function).num_form_pcnf == []
+
+
+def test_nand_and_nor_tokens():
+    assert token_pairs(RegexLexer("a !& b !| !c ^ d")) == [
+        (VARIABLE, "a"),
+        ("NAND", "!&"),
+        (VARIABLE, "b"),
+        ("NOR", "!|"),
+        (NOT, "!"),
+        (VARIABLE, "c"),
+        ("XOR", "^"),
+        (VARIABLE, "d"),
+        (EOF, None),
+    ]
@@ -0,0 +1,200 @@
+import random
+import pytest
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+from pnf_contructor.multi_output import MultiOutputTruthTable
+from pnf_contructor.table_file import TableFile
+from pnf_contructor.terms import terms_to_column
+from pnf_contructor.index_form import default_variables
+from corno.minimizer import Minimizer
+
+FULL_ADDER = [
+    # a, b, c, s, p
+    [0, 0, 0, 0, 0],
+    [0, 0, 1, 1, 0],
+    [0, 1, 0, 1, 0],
+    [0, 1, 1, 0, 1],
+    [1, 0, 0, 1, 0],
+    [1, 0, 1, 0, 1],
+    [1, 1, 0, 0, 1],
+    [1, 1, 1, 1, 1],
+]
+
+
+@pytest.fixture
+def adder():
+    return MultiOutputTruthTable.from_rows(FULL_ADDER, ["a", "b", "c"], ["s", "p"])
+
+
+def test_from_rows(adder):
+    assert len(adder) == 2
+    assert adder.columns[0].to_int() == 0b10010110
+    assert adder.columns[1].to_int() == 0b11101000
+    assert adder.table == FULL_ADDER
+    assert adder.get_row(6) == [1, 1, 0, 0, 1]
+
+
+def test_output_views_share_columns(adder):
+    carry = adder["p"]
+    assert carry.result_column is adder.columns[1]
+    assert carry.result_header == "p"
+    assert carry.num_form_pdnf == [3, 5, 6, 7]
+    assert [view.output_name for view in adder] == ["s", "p"]
+    sliced = TruthTable(
+        table=[row[:3] + [row[4]] for row in FULL_ADDER], variables=["a", "b", "c"]
+    )
+    assert carry.get_pcnf() == sliced.get_pcnf()
+
+
+def test_from_functions():
+    table = MultiOutputTruthTable.from_functions(
+        [LogicalFunction("a ^ c"), LogicalFunction("b & c")]
+    )
+    assert table.variables == ["a", "b", "c"]
+    assert table.outputs == ["a ^ c", "b & c"]
+    assert table[0].num_form_pdnf == [1, 3, 4, 6]
+    assert table[1].num_form_pdnf == [3, 7]
+
+
+def test_file_round_trip(adder, tmp_path):
+    path = tmp_path / "adder.ttbl"
+    adder.save(path)
+    loaded = MultiOutputTruthTable.from_file(TableFile(path))
+    assert loaded.outputs == ["s", "p"]
+    assert loaded.table == FULL_ADDER
+
+
+def test_invalid_tables(adder):
+    with pytest.raises(ValueError):
+        MultiOutputTruthTable(["a"], [0b01, 0b10], ["f", "f"])
+    with pytest.raises(ValueError):
+        MultiOutputTruthTable(["a"], [0b01], ["f", "g"])
+    with pytest.raises(ValueError):
+        MultiOutputTruthTable.from_rows(FULL_ADDER[:4], ["a", "b", "c"])
+    with pytest.raises(ValueError):
+        adder.output("overflow")
+    with pytest.raises(IndexError):
+        adder.output(2)
+
+
+def test_minimizer_accepts_multi_output_table(adder):
+    minimizer = Minimizer(adder)
+    assert minimizer.multi_output_table is adder
+    results = minimizer.minimize_outputs(is_pdnf=True, display_karnaugh_map=False)
+    for name in ("s", "p"):
+        expected = Minimizer(adder[name]).karnaugh_map_minimization(
+            is_pdnf=True, display_karnaugh_map=False
+        )
+        assert results[name] == expected
+    assert "karnaugh_candidates" in minimizer.shared
+
+    results = minimizer.minimize_outputs(
+        "computational", is_pdnf=False, display_merging=False
+    )
+    assert results["p"] == "(a|b)&(a|c)&(b|c)"
+    with pytest.raises(ValueError):
+        minimizer.minimize_outputs("petrick", is_pdnf=True)
+
+
+def test_dont_care_outputs(tmp_path):
+    # 8421 + 9 over the BCD digits: inputs 10 to 15 never occur.
+    rows = []
+    for i in range(16):
+        digit = (i + 9) % 10
+        outputs = [(digit >> (3 - k)) & 1 for k in range(4)] if i < 10 else ["-"] * 4
+        rows.append([(i >> (3 - k)) & 1 for k in range(4)] + outputs)
+    table = MultiOutputTruthTable.from_rows(
+        rows, ["a", "b", "c", "d"], ["w", "x", "y", "z"]
+    )
+    assert table.get_row(12) == [1, 1, 0, 0, "-", "-", "-", "-"]
+    assert table["z"].num_form_dont_cares == list(range(10, 16))
+    for method, options in (
+        ("karnaugh", {"display_karnaugh_map": False}),
+        ("computational", {"display_merging": False}),
+        ("espresso", {}),
+    ):
+        results = Minimizer(table).minimize_outputs(method, is_pdnf=True, **options)
+        assert results["z"] == "(!d)"
+        assert results["w"] in ("(!a&!b&!c&!d)|(a&d)", "(a&d)|(!a&!b&!c&!d)")
+    with pytest.raises(ValueError):
+        table.save(tmp_path / "table.ttbl")
+
+
+def test_multi_output_prime_implicants():
+    # f = a & b, g = a & b & c: a & b serves f only, a & b & c both.
+    primes = Minimizer.multi_output_prime_implicants(
+        [[(0b110, 0b111), (0b111, 0b111)], [(0b111, 0b111)]], 3
+    )
+    assert primes == [((0b110, 0b110), 0b01), ((0b111, 0b111), 0b11)]
+    # A cube of don't-cares alone is no prime.
+    primes = Minimizer.multi_output_prime_implicants(
+        [[(0b001, 0b111)]], 3, [[(0b011, 0b111), (0b110, 0b111)]]
+    )
+    assert primes == [((0b001, 0b101), 0b1)]
+
+
+def test_minimize_jointly(adder):
+    minimizer = Minimizer(adder)
+    results = minimizer.minimize_jointly(is_pdnf=True)
+    assert results["p"] == "(a&b)|(a&c)|(b&c)"
+    assert minimizer.shared_terms == {}
+    assert minimizer.cover_exact
+
+    # f = b & c, g = !b | c: separately three distinct products, together
+    # two, as g can reuse b & c instead of c.
+    table = MultiOutputTruthTable.from_functions(
+        [LogicalFunction("b & c"), LogicalFunction("!b | c")], ["f", "g"]
+    )
+    minimizer = Minimizer(table)
+    assert minimizer.minimize_jointly(is_pdnf=True) == {
+        "f": "(b&c)",
+        "g": "(!b)|(b&c)",
+    }
+    assert minimizer.shared_terms == {"b&c": ["f", "g"]}
+
+
+def test_minimize_jointly_constant_outputs():
+    # f is 1 on its care rows, g is always 0, h = a.
+    table = MultiOutputTruthTable.from_rows(
+        [[0, 0, "-", 0, 0], [0, 1, 1, 0, 0], [1, 0, 1, 0, 1], [1, 1, "-", 0, 1]],
+        ["a", "b"],
+        ["f", "g", "h"],
+    )
+    assert Minimizer(table).minimize_jointly(is_pdnf=True) == {
+        "f": "(1)",
+        "g": "0",
+        "h": "(a)",
+    }
+    assert Minimizer(table).minimize_jointly(is_pdnf=False) == {
+        "f": "1",
+        "g": "(0)",
+        "h": "(a)",
+    }
+
+
+def test_minimize_jointly_random_tables():
+    rng = random.Random(0)
+    for count in range(1, 6):
+        for _ in range(10):
+            columns = [rng.getrandbits(2**count) for _ in range(3)]
+            dont_cares = [rng.getrandbits(2**count) & ~column for column in columns]
+            table = MultiOutputTruthTable(
+                default_variables(count), columns, dont_cares=dont_cares
+            )
+            for is_pdnf in (True, False):
+                products, uses = Minimizer(table).get_joint_cover(is_pdnf)
+                separate = set()
+                for k, column in enumerate(columns):
+                    full = (1 << 2**count) - 1
+                    target = column if is_pdnf else ~(column | dont_cares[k]) & full
+                    result = terms_to_column([products[i] for i in uses[k]], count)
+                    assert result & target == target
+                    assert result & ~(target | dont_cares[k]) == 0
+                    primes, chosen = Minimizer(table[k]).get_minimal_implicants(
+                        is_pdnf, False
+                    )
+                    separate |= {tuple(primes[i]) for i in chosen}
+                assert len(products) <= len(separate)
+                results = Minimizer(table).minimize_jointly(is_pdnf=is_pdnf)
+                for form in results.values():
+                    LogicalFunction(form)
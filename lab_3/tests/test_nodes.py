@@ -0,0 +1,100 @@
+import pytest
+from itertools import product
+from pnf_contructor.language import RegexLexer
+from pnf_contructor.grammar import IterativeParser
+from pnf_contructor.nodes import (
+    NodeFactory,
+    InterningNodeFactory,
+    VariableNode,
+    BinaryOperationNode,
+    iter_postorder,
+)
+from pnf_contructor.bitwise import BitwiseEvaluator
+from pnf_contructor.compiler import FormulaCompiler
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+
+
+def parse(formula, factory):
+    lexer = RegexLexer(formula)
+    return IterativeParser(lexer, factory).parse(), lexer.get_variables()
+
+
+def test_nodes_have_no_instance_dict():
+    root, _ = parse("!a & (b | 1)", NodeFactory())
+    for node in iter_postorder(root):
+        assert not hasattr(node, "__dict__")
+
+
+def test_operator_tables_are_shared_by_the_class():
+    left, right = parse("a > b", NodeFactory())[0], parse("c ~ d", NodeFactory())[0]
+    assert "binary_opr" not in BinaryOperationNode.__slots__
+    assert left.binary_opr is right.binary_opr is BinaryOperationNode.binary_opr
+
+
+def test_interning_shares_identical_subtrees():
+    root, _ = parse("(a | !b) & (a | !b) & (!b > c)", InterningNodeFactory())
+    first, second, third = root.operands
+    assert first is second
+    assert third.operands[0] is first.operands[1]
+    assert len(list(iter_postorder(root))) == 7
+
+
+def test_plain_factory_builds_a_tree():
+    root, _ = parse("(a | !b) & (a | !b)", NodeFactory())
+    assert root.operands[0] is not root.operands[1]
+    assert len(list(iter_postorder(root))) == 9
+
+
+def test_interning_distinguishes_operand_order():
+    factory = InterningNodeFactory()
+    first, _ = parse("a > b", factory)
+    second, _ = parse("b > a", factory)
+    again, _ = parse("a > b", factory)
+    assert first is not second
+    assert first is again
+    assert isinstance(first.operands[0], VariableNode)
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "(a | !b) & (a | !b) & (!b > c)",
+        "((a ~ b) | c) & ((a ~ b) | !c) & !(a ~ b)",
+        "(a & b) > (a & b) ~ (a & b)",
+        "1 & (a | 0) & (a | 0)",
+    ],
+)
+def test_dag_evaluation_matches_tree_evaluation(formula):
+    tree, variables = parse(formula, NodeFactory())
+    dag, _ = parse(formula, InterningNodeFactory())
+
+    assert (
+        BitwiseEvaluator(dag, variables).evaluate()
+        == BitwiseEvaluator(tree, variables).evaluate()
+    )
+
+    tree_function = FormulaCompiler(tree, variables).compile()
+    dag_function = FormulaCompiler(dag, variables).compile()
+    dag_index = FormulaCompiler(dag, variables).compile_index()
+    for i, values in enumerate(product([False, True], repeat=len(variables))):
+        assert dag_function(*values) is tree_function(*values)
+        assert dag_index(i) is tree_function(*values)
+
+
+def test_shared_names_avoid_variable_collisions():
+    function = LogicalFunction("(shared0 | shared1) & (shared0 | shared1) | !shared0")
+    for values in product([False, True], repeat=2):
+        expected = (values[0] or values[1]) or not values[0]
+        assert function.evaluate_values(*values) is expected
+
+
+def test_pcnf_round_trip_is_interned():
+    table = TruthTable(LogicalFunction("(a > b) & (c ~ d) | !e"))
+    function = LogicalFunction(table.get_pcnf())
+    assert TruthTable(function).result_column == table.result_column
+    # Each variable and each negated literal exists once however many clauses
+    # use it.
+    nodes = list(iter_postorder(function.ast))
+    assert sum(node.operator == "VARIABLE" for node in nodes) == 5
+    assert sum(node.operator == "NOT" for node in nodes) == 5
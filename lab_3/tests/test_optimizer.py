@@ -0,0 +1,125 @@
+import pytest
+from itertools import product
+from pnf_contructor.language import RegexLexer
+from pnf_contructor.grammar import IterativeParser
+from pnf_contructor.nodes import NodeFactory, InterningNodeFactory, iter_postorder
+from pnf_contructor.optimizer import FormulaOptimizer
+from pnf_contructor.bitwise import BitwiseEvaluator
+from pnf_contructor.bdd import BDDManager
+from pnf_contructor.compiler import FormulaCompiler
+from pnf_contructor.cache import canonical_form
+from pnf_contructor.logical_function import LogicalFunction
+
+
+def parse(formula, factory=None):
+    lexer = RegexLexer(formula)
+    parser = IterativeParser(lexer, NodeFactory() if factory is None else factory)
+    return parser.parse(), lexer.get_variables()
+
+
+def optimized(formula):
+    root, _ = parse(formula)
+    return canonical_form(FormulaOptimizer().optimize(root))
+
+
+@pytest.mark.parametrize(
+    "formula, expected",
+    [
+        ("!!a", "a"),
+        ("!!!a", "!a"),
+        ("a & 1", "a"),
+        ("a & 0", "0"),
+        ("a | 1", "1"),
+        ("!0 & a", "a"),
+        ("a & a", "a"),
+        ("a | !a", "1"),
+        ("(a | !a) & b", "b"),
+        ("a & (a | b)", "a"),
+        ("a | (a & b)", "a"),
+        ("(a | b) & c & (a | b)", "((a|b)&c)"),
+        ("a & (b & (c & d))", "(a&b&c&d)"),
+        ("(a | b) | (c | (d | a))", "(a|b|c|d)"),
+        ("1 > a", "a"),
+        ("a > 0", "!a"),
+        ("a > a", "1"),
+        ("0 > a", "1"),
+        ("a ~ a", "1"),
+        ("a ~ !a", "0"),
+        ("0 ~ a", "!a"),
+        ("a ~ 1", "a"),
+        ("!(a & !a) > b", "b"),
+        ("a ^ a", "0"),
+        ("a ^ !a", "1"),
+        ("a ^ 1", "!a"),
+        ("a ^ b ^ a ^ 0", "b"),
+        ("!a ^ !b", "(a^b)"),
+        ("(a ^ b) ^ (c ^ a)", "(b^c)"),
+        ("a !& 1", "!a"),
+        ("a !| a", "!a"),
+        ("a !& !a", "1"),
+    ],
+)
+def test_rewrites(formula, expected):
+    assert optimized(formula) == expected
+
+
+def test_untouched_operators_keep_their_order():
+    assert optimized("(c > b) ~ a") == "((c>b)~a)"
+
+
+def test_shared_chains_are_not_flattened():
+    root, _ = parse("(a & b) & c | (a & b) & d", InterningNodeFactory())
+    result = FormulaOptimizer().optimize(root)
+    left, right = result.operands
+    assert left.operands[0] is right.operands[0]
+    assert canonical_form(left.operands[0]) == "(a&b)"
+
+
+def test_flattening_builds_one_node_per_chain():
+    root, _ = parse(" & ".join(f"(x{i} | y{i})" for i in range(50)))
+    result = FormulaOptimizer().optimize(root)
+    assert result.operator == "AND"
+    assert len(result.operands) == 50
+    assert all(len(operand.operands) == 2 for operand in result.operands)
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "(a | !b) & (a | !b) & (!b > c)",
+        "((a ~ b) | c) & ((a ~ b) | !c) & !(a ~ b)",
+        "!!(a & (a | c)) | (b & 1) > (0 ~ c)",
+        "(a > b) & (b > c) & (c > a) | !(a & b & c) & (a | b | c)",
+        "((a | b) & (a | b | c)) ~ !(!(b & (c | !c)))",
+        "(a ^ !b ^ 1) !& (c !| (a ^ a)) | b ^ c ^ !a",
+    ],
+)
+def test_optimized_formula_is_equivalent(formula):
+    root, variables = parse(formula)
+    result = FormulaOptimizer().optimize(root)
+
+    assert (
+        BitwiseEvaluator(result, variables).evaluate()
+        == BitwiseEvaluator(root, variables).evaluate()
+    )
+    manager = BDDManager(variables)
+    assert manager.build(result) == manager.build(root)
+
+    expected = FormulaCompiler(root, variables).compile()
+    actual = FormulaCompiler(result, variables).compile()
+    for values in product([False, True], repeat=len(variables)):
+        assert actual(*values) is expected(*values)
+        assert eval(result.to_python(), dict(zip(variables, values))) is expected(
+            *values
+        )
+
+
+def test_logical_function_optimizes_unless_asked_not_to():
+    function = LogicalFunction("!!a & (b | 0) & (a | c)")
+    assert canonical_form(function.ast) == "(a&b)"
+    assert function.variables == ["a", "b", "c"]
+    assert function.evaluate_values(True, True, False) is True
+
+    raw = LogicalFunction("!!a & (b | 0) & (a | c)", optimize=False)
+    nodes = list(iter_postorder(raw.ast))
+    assert sum(node.operator == "NOT" for node in nodes) == 2
@@ -0,0 +1,54 @@
+import pytest
+from pnf_contructor.packed import BitColumn
+
+
+def test_zeros():
+    column = BitColumn.zeros(10)
+    assert len(column) == 10
+    assert column.nbytes == 2
+    assert list(column) == [0] * 10
+
+
+def test_set_and_get():
+    column = BitColumn.zeros(12)
+    column[0] = 1
+    column[9] = 1
+    column[-1] = 1
+    assert column[0] == 1
+    assert column[9] == 1
+    assert column[11] == 1
+    column[9] = 0
+    assert column[9] == 0
+    assert column.count() == 2
+
+
+def test_int_round_trip():
+    value = 0b1011_0000_0110_1
+    column = BitColumn.from_int(value, 13)
+    assert column.to_int() == value
+    assert [i for i in range(13) if (value >> i) & 1] == list(column.iter_ones())
+
+
+def test_iter_ones_and_zeros():
+    column = BitColumn.from_int(0b10010110, 8)
+    assert list(column.iter_ones()) == [1, 2, 4, 7]
+    assert list(column.iter_zeros()) == [0, 3, 5, 6]
+    assert list(column.iter_ones(2, 5)) == [2, 4]
+
+
+def test_iter_zeros_ignores_padding():
+    column = BitColumn.from_int(0b101, 3)
+    assert list(column.iter_zeros()) == [1]
+
+
+def test_index_out_of_range():
+    column = BitColumn.zeros(4)
+    with pytest.raises(IndexError):
+        column[4]
+    with pytest.raises(IndexError):
+        column[-5] = 1
+
+
+def test_buffer_too_small():
+    with pytest.raises(ValueError):
+        BitColumn(bytearray(1), 9)
@@ -0,0 +1,46 @@
+import pytest
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+from pnf_contructor.parallel import generate_column, default_chunk_size
+
+FORMULA = "!(a > (b ~ !c)) | (d & !e) ~ (f | g & h) > !i"
+
+
+@pytest.mark.parametrize("backend", ["rows", "bitwise"])
+@pytest.mark.parametrize("chunk_size", [8, 64, 512, 4096])
+def test_parallel_table_matches_serial(backend, chunk_size):
+    function = LogicalFunction(FORMULA)
+    serial = TruthTable(function)
+    parallel = TruthTable(function, backend=backend, workers=2, chunk_size=chunk_size)
+    assert parallel.result_column == serial.result_column
+    assert parallel.num_form_pdnf == serial.num_form_pdnf
+    assert parallel.num_form_pcnf == serial.num_form_pcnf
+
+
+@pytest.mark.parametrize("formula", ["a", "a & b", "a | b > c"])
+def test_parallel_table_smaller_than_chunk(formula):
+    function = LogicalFunction(formula)
+    parallel = TruthTable(function, workers=2)
+    assert parallel.table == TruthTable(function).table
+
+
+def test_lazy_parallel_table():
+    table = TruthTable(LogicalFunction(FORMULA), lazy=True, workers=2, chunk_size=64)
+    assert table._result_column is None
+    assert table.num_form_pdnf == TruthTable(LogicalFunction(FORMULA)).num_form_pdnf
+
+
+def test_default_chunk_size():
+    assert default_chunk_size(2**24, 4) == 2**20
+    assert default_chunk_size(2**24, 3) == 2**20
+    assert default_chunk_size(4, 8) == 8
+
+
+def test_invalid_parallel_settings():
+    function = LogicalFunction("a & b")
+    with pytest.raises(ValueError):
+        TruthTable(function, workers=0)
+    with pytest.raises(ValueError):
+        generate_column(function, workers=2, chunk_size=12)
+    with pytest.raises(ValueError):
+        generate_column(function, workers=2, chunk_size=4)
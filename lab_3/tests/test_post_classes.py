@@ -0,0 +1,94 @@
+import pytest
+from itertools import product
+from pnf_contructor.post_classes import PostClassAnalyzer, is_functionally_complete
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+
+FORMULAS = [
+    "a",
+    "!a",
+    "a & b",
+    "a | b",
+    "a > b",
+    "a ~ b",
+    "!(a ~ b)",
+    "a & b | b & c | a & c",
+    "(a & b) | (!a & c)",
+    "a & !a",
+    "a | !a",
+    "a & (b | !b)",
+    "!(a > (b ~ !c)) | (d & !e)",
+    "!(a ~ b) ~ c",
+]
+
+
+def naive_classes(table):
+    count = len(table.variables)
+    values = [table.get_result(i) for i in range(table.rows_count)]
+    full = table.rows_count - 1
+    monotone = all(
+        values[i] <= values[j]
+        for i in range(table.rows_count)
+        for j in range(table.rows_count)
+        if i & ~j == 0
+    )
+    # Linear: f equals c0 ^ XOR of some variables; try all of them.
+    linear = any(
+        all(
+            values[i] == (c0 ^ (bin(i & selection).count("1") & 1))
+            for i in range(table.rows_count)
+        )
+        for c0 in (0, 1)
+        for selection in range(table.rows_count)
+    )
+    essential = [
+        var
+        for k, var in enumerate(table.variables)
+        if any(
+            values[i] != values[i | 1 << (count - 1 - k)]
+            for i in range(table.rows_count)
+        )
+    ]
+    return {
+        "T0": values[0] == 0,
+        "T1": values[full] == 1,
+        "S": all(values[i] != values[full - i] for i in range(table.rows_count)),
+        "M": monotone,
+        "L": linear,
+    }, essential
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_matches_row_loops(formula):
+    table = TruthTable(LogicalFunction(formula))
+    analyzer = PostClassAnalyzer(table)
+    classes, essential = naive_classes(table)
+    assert analyzer.post_classes() == classes
+    assert analyzer.essential_variables() == essential
+    assert analyzer.fictitious_variables() == [
+        var for var in table.variables if var not in essential
+    ]
+
+
+def test_known_classes():
+    majority = PostClassAnalyzer(TruthTable(LogicalFunction("a & b | b & c | a & c")))
+    assert majority.post_classes() == {
+        "T0": True,
+        "T1": True,
+        "S": True,
+        "M": True,
+        "L": False,
+    }
+    fictitious = PostClassAnalyzer(TruthTable(LogicalFunction("a & (b | !b) | c & !c")))
+    assert fictitious.essential_variables() == ["a"]
+    assert fictitious.fictitious_variables() == ["b", "c"]
+
+
+def test_functional_completeness():
+    def tables(*formulas):
+        return [TruthTable(LogicalFunction(formula)) for formula in formulas]
+
+    assert is_functionally_complete(tables("!(a & b)"))
+    assert is_functionally_complete(tables("!a", "a & b"))
+    assert not is_functionally_complete(tables("a & b", "a | b"))
+    assert not is_functionally_complete(tables("a ~ b", "!a"))
@@ -0,0 +1,128 @@
+import io
+import pytest
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+from pnf_contructor.packed import BitColumn
+from pnf_contructor.table_file import (
+    TableFile,
+    write_columns,
+    write_table_file,
+    HEADER,
+    MAGIC,
+    NAME_LENGTH,
+    VERSION,
+)
+
+
+def test_round_trip(tmp_path):
+    table = TruthTable(LogicalFunction("(a > b) & (c ~ d) | !e"))
+    path = tmp_path / "table.ttbl"
+    table.save(path)
+
+    with TableFile(path) as table_file:
+        assert table_file.variables == ["a", "b", "c", "d", "e"]
+        assert table_file.outputs == ["(a > b) & (c ~ d) | !e"]
+        assert table_file.rows_count == 32
+        column = table_file.column()
+        assert column == table.result_column
+        del column
+
+
+def test_truth_table_from_file(tmp_path):
+    function = LogicalFunction("a & !b | c ^ d")
+    path = tmp_path / "table.ttbl"
+    TruthTable(function).save(path)
+
+    loaded = TruthTable(table_file=TableFile(path))
+    assert loaded.variables == function.variables
+    assert loaded.result_header == function.formula
+    assert loaded.num_form_pdnf == TruthTable(function).num_form_pdnf
+    assert loaded.get_pdnf() == TruthTable(function).get_pdnf()
+    assert loaded.table[5] == TruthTable(function).table[5]
+
+
+def test_column_is_a_view_of_the_file(tmp_path):
+    path = tmp_path / "table.ttbl"
+    TruthTable(LogicalFunction("a | b")).save(path)
+    table_file = TableFile(path)
+    column = table_file.column()
+    assert isinstance(column.data, memoryview)
+    assert column.data.readonly
+    with pytest.raises(BufferError):
+        table_file.close()
+    del column
+    table_file.close()
+
+
+def test_several_outputs(tmp_path):
+    variables = ["a", "b", "c"]
+    columns = [0b10010110, BitColumn.from_int(0b11101000, 8), 0]
+    path = tmp_path / "adder.ttbl"
+    write_table_file(path, variables, columns, ["sum", "carry", "zero"])
+
+    table_file = TableFile(path)
+    assert len(table_file) == 3
+    assert table_file.column("carry").to_int() == 0b11101000
+    assert table_file.column(0).to_int() == 0b10010110
+    carry = TruthTable(table_file=table_file, output="carry")
+    assert carry.result_header == "carry"
+    assert carry.num_form_pdnf == [3, 5, 6, 7]
+    with pytest.raises(ValueError):
+        table_file.column("overflow")
+    with pytest.raises(IndexError):
+        table_file.column(3)
+
+
+def test_columns_are_aligned():
+    stream = io.BytesIO()
+    written = write_columns(stream, ["x1", "x2", "x3", "x4"], [0xBEEF, 0x1234])
+    data = stream.getvalue()
+    assert written == len(data)
+    assert (len(data) - 4) % 8 == 0
+    assert data[-4:] == bytes([0xEF, 0xBE, 0x34, 0x12])
+
+
+def test_invalid_files(tmp_path):
+    path = tmp_path / "table.ttbl"
+    path.write_bytes(b"not a table at all, surely")
+    with pytest.raises(ValueError):
+        TableFile(path)
+
+    stream = io.BytesIO()
+    write_columns(stream, ["a", "b"], [0b0110])
+    path.write_bytes(stream.getvalue()[:-1])
+    with pytest.raises(ValueError):
+        TableFile(path)
+
+    with pytest.raises(ValueError):
+        write_columns(io.BytesIO(), ["a", "b"], [BitColumn.zeros(8)])
+    with pytest.raises(ValueError):
+        write_columns(io.BytesIO(), ["a"], [0, 1], ["f"])
+    assert HEADER.size == 20
+
+    # A name running past the end of the file.
+    header = HEADER.pack(MAGIC, VERSION, 1, 1, 0, 2)
+    path.write_bytes(header + NAME_LENGTH.pack(100) + b"a" + bytes(16))
+    with pytest.raises(ValueError):
+        TableFile(path)
+
+
+def test_long_output_name(tmp_path):
+    # The formula is the output name, and large tables have long formulas.
+    name = "a & b | " * 10_000 + "a"
+    path = tmp_path / "table.ttbl"
+    write_table_file(path, ["a", "b"], [0b1110], [name])
+    with TableFile(path) as table_file:
+        assert table_file.outputs == [name]
+
+
+def test_truth_table_in_with_block(tmp_path):
+    # Dropping the table frees its column, so the file closes on exit.
+    path = tmp_path / "table.ttbl"
+    TruthTable(LogicalFunction("a & !b | c")).save(path)
+    with TableFile(path) as table_file:
+        table = TruthTable(table_file=table_file)
+        assert table.num_form_pdnf == [1, 3, 4, 5, 7]
+        assert table.table[4] == [1, 0, 0, 1]
+        del table
+    assert table_file.mmap.closed
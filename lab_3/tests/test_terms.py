@@ -0,0 +1,99 @@
+import io
+import pytest
+from pnf_contructor.terms import (
+    format_term,
+    iter_term_rows,
+    terms_to_column,
+    write_terms,
+)
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+from pnf_contructor.packed import BitColumn
+from corno.minimizer import Minimizer
+
+
+def test_format_term():
+    variables = ["a", "b", "c"]
+    assert format_term((0b101, 0b111), variables, True) == "(a&!b&c)"
+    assert format_term((0b101, 0b111), variables, False) == "(!a|b|!c)"
+    assert format_term((0b100, 0b101), variables, True) == "(a&!c)"
+
+
+def test_iter_term_rows():
+    assert list(iter_term_rows((0b100, 0b101), 3)) == [0b100, 0b110]
+    assert list(iter_term_rows((0b0010, 0b0010), 4)) == [2, 3, 6, 7, 10, 11, 14, 15]
+    assert list(iter_term_rows((5, 0b111), 3)) == [5]
+    assert list(iter_term_rows((0, 0), 2)) == [0, 1, 2, 3]
+
+
+def test_terms_to_column():
+    assert terms_to_column([(0b11, 0b11)], 2) == 0b1000
+    assert terms_to_column([(0b10, 0b10), (0b01, 0b01)], 2) == 0b1110
+    assert terms_to_column([(0b00, 0b11)], 2, is_pdnf=False) == 0b1110
+
+
+def test_write_terms():
+    stream = io.StringIO()
+    written = write_terms(stream, [(0b01, 0b11), (0b10, 0b11)], ["a", "b"], True)
+    assert written == 2
+    assert stream.getvalue() == "(!a&b)|(a&!b)"
+
+
+@pytest.mark.parametrize(
+    "formula", ["a", "a & b", "(a & b) | (!a & c)", "!(a > (b ~ !c)) | (d & !e)"]
+)
+def test_streamed_forms_match_strings(formula):
+    table = TruthTable(LogicalFunction(formula))
+    pdnf, pcnf = io.StringIO(), io.StringIO()
+    assert table.write_pdnf(pdnf) == len(table.num_form_pdnf)
+    assert table.write_pcnf(pcnf) == len(table.num_form_pcnf)
+    assert pdnf.getvalue() == table.get_pdnf()
+    assert pcnf.getvalue() == table.get_pcnf()
+    assert TruthTable(LogicalFunction(table.get_pdnf())).table == table.table
+
+
+def test_terms_round_trip_without_parsing():
+    table = TruthTable(LogicalFunction("!(a > (b ~ !c)) | (d & !e)"))
+    pdnf = TruthTable(
+        variables=table.variables,
+        column=terms_to_column(table.iter_pdnf_terms(), len(table.variables)),
+    )
+    pcnf = TruthTable(
+        variables=table.variables,
+        column=terms_to_column(table.iter_pcnf_terms(), len(table.variables), False),
+    )
+    assert pdnf.logical_function is None
+    assert pdnf.table == table.table
+    assert pcnf.table == table.table
+
+
+def test_table_from_rows_and_column():
+    rows = [[0, 0, 0], [0, 1, 1], [1, 0, 1], [1, 1, 0]]
+    from_rows = TruthTable(table=rows, variables=["a", "b"])
+    from_column = TruthTable(variables=["a", "b"], column=BitColumn.from_int(6, 4))
+    assert from_rows.table == rows
+    assert from_column.table == rows
+    assert from_rows.get_pdnf() == "(!a&b)|(a&!b)"
+    with pytest.raises(ValueError):
+        TruthTable(variables=["a", "b"], column=BitColumn.zeros(8))
+    with pytest.raises(ValueError):
+        TruthTable(table=rows[:3], variables=["a", "b"])
+    with pytest.raises(ValueError):
+        TruthTable(variables=["a", "b"])
+
+
+def test_minimizer_from_terms():
+    table = TruthTable(LogicalFunction("(a & b) | (!a & c)"))
+    expected = Minimizer(table).computational_minimization(
+        is_pdnf=True, display_merging=False
+    )
+    for terms, is_pdnf in (
+        (table.iter_pdnf_terms(), True),
+        (table.iter_pcnf_terms(), False),
+        ([(0b110, 0b110), (0b001, 0b101)], True),
+    ):
+        minimizer = Minimizer.from_terms(terms, table.variables, is_pdnf)
+        result = minimizer.computational_minimization(
+            is_pdnf=True, display_merging=False
+        )
+        assert result == expected
@@ -0,0 +1,133 @@
+import io
+import sys
+import pytest
+from pnf_contructor.logical_function import LogicalFunction
+from pnf_contructor.truth_table import TruthTable
+from pnf_contructor.packed import BitColumn
+
+
+@pytest.fixture
+def table():
+    return TruthTable(LogicalFunction("!(x & y) | z"))
+
+
+def test_rows_view(table):
+    assert len(table.table) == 8
+    assert table.table[0] == [0, 0, 0, 1]
+    assert table.table[6] == [1, 1, 0, 0]
+    assert table.table[-1] == [1, 1, 1, 1]
+    assert table.table[5:7] == [[1, 0, 1, 1], [1, 1, 0, 0]]
+    with pytest.raises(IndexError):
+        table.table[8]
+
+
+def test_rows_view_equals_list(table):
+    expected = [
+        [0, 0, 0, 1],
+        [0, 0, 1, 1],
+        [0, 1, 0, 1],
+        [0, 1, 1, 1],
+        [1, 0, 0, 1],
+        [1, 0, 1, 1],
+        [1, 1, 0, 0],
+        [1, 1, 1, 1],
+    ]
+    assert table.table == expected
+    assert list(table.table) == expected
+
+
+def test_num_forms(table):
+    assert table.num_form_pdnf == [0, 1, 2, 3, 4, 5, 7]
+    assert table.num_form_pcnf == [6]
+    assert table.get_result(6) == 0
+
+
+def test_groups_and_constituents():
+    table = TruthTable(LogicalFunction("a & b | c"))
+    assert table.group_pdnf() == {
+        1: [[0, 0, 1]],
+        2: [[0, 1, 1], [1, 0, 1], [1, 1, 0]],
+        3: [[1, 1, 1]],
+    }
+    assert table.get_pcnf_constituents() == [[0, 0, 0], [0, 1, 0], [1, 0, 0]]
+
+
+def test_display(table, capsys):
+    table.display()
+    captured = capsys.readouterr()
+    assert "!(x & y) | z" in captured.out
+    assert captured.out.count("\n") > 8
+
+
+def test_packed_storage_is_small():
+    table = TruthTable(
+        LogicalFunction("(a & b) | (c > d) | (e ~ f) | (g & h) | (i | j)")
+    )
+    rows_count = 2**10
+    packed_size = sys.getsizeof(table.result_column.data)
+    row = table.table[0]
+    list_size = rows_count * (sys.getsizeof(row) + 8)
+    assert packed_size * 10 < list_size
+
+
+def test_lazy_table_does_not_build_column():
+    table = TruthTable(LogicalFunction("a & b | c"), lazy=True)
+    assert table.get_row(6) == [1, 1, 0, 1]
+    assert table._result_column is None
+    assert table.num_form_pcnf == [0, 2, 4]
+    assert table._result_column is not None
+
+
+def test_iter_rows(table):
+    rows = list(table.iter_rows(5, 7))
+    assert rows == [(5, {"x": 1, "y": 0, "z": 1}, 1), (6, {"x": 1, "y": 1, "z": 0}, 0)]
+    assert [i for i, _, _ in table.iter_rows(-2)] == [6, 7]
+
+
+def test_iter_rows_large_lazy_table():
+    variables = "abcdefghijklmnopqrstuvwxy"
+    table = TruthTable(LogicalFunction(" & ".join(variables)), lazy=True)
+    last = list(table.iter_rows(-2))
+    assert last[-1][0] == 2**25 - 1
+    assert [result for _, _, result in last] == [0, 1]
+    assert table._result_column is None
+
+
+def test_display_range(table, capsys):
+    table.display(6, 8)
+    captured = capsys.readouterr()
+    lines = [line for line in captured.out.splitlines() if "│" in line]
+    assert len(lines) == 3
+    assert lines[1].split("│")[1].strip() == "6"
+
+
+def test_write(table):
+    stream = io.StringIO()
+    table.write(stream, start=6)
+    assert stream.getvalue().splitlines() == [
+        "x y z !(x & y) | z",
+        "1 1 0            0",
+        "1 1 1            1",
+    ]
+
+
+def test_dont_care_rows():
+    rows = [[0, 0, 1], [0, 1, "-"], [1, 0, 0], [1, 1, "-"]]
+    table = TruthTable(table=rows, variables=["a", "b"])
+    assert table.num_form_pdnf == [0]
+    assert table.num_form_pcnf == [2]
+    assert table.num_form_dont_cares == [1, 3]
+    assert list(table.iter_dont_care_terms()) == [(1, 0b11), (3, 0b11)]
+    assert table.table == rows
+    assert table.get_pdnf() == "(!a&!b)"
+    assert table.get_pcnf() == "(!a|b)"
+
+
+def test_dont_care_column(tmp_path):
+    table = TruthTable(variables=["a", "b"], column=0b0001, dont_cares=0b1010)
+    assert table.num_form_pcnf == [2]
+    assert [result for _, _, result in table.iter_rows()] == [1, "-", 0, "-"]
+    with pytest.raises(ValueError):
+        table.save(tmp_path / "table.ttbl")
+    with pytest.raises(ValueError):
+        TruthTable(variables=["a"], column=0b01, dont_cares=BitColumn.zeros(4))
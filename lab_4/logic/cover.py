@@ -0,0 +1,214 @@
+import time
+from functools import reduce
+from heapq import heapify, heappop, heappush
+from operator import or_
+from typing import Dict, List, Optional, Sequence
+
+# Rows (implicants) and columns (minterms) are both bitsets: a row is the
+# int whose bit j is set when it covers column j, and the rows covering a
+# column are the int whose bit i is set for row i.
+Rows = Dict[int, int]
+
+
+def iter_bits(bits: int):
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class CoverSolver:
+    # Minimum-cost cover of an implicant chart. Essential rows are taken and
+    # dominated rows and columns dropped until nothing changes, then the
+    # search branches on the column with the fewest rows and prunes with a
+    # lower bound from columns that share no row. It starts from the greedy
+    # cover, so when the time budget runs out the best cover found so far is
+    # returned and `exact` is False.
+    def __init__(
+        self,
+        rows: Sequence[int],
+        costs: Optional[Sequence[int]] = None,
+        time_budget: Optional[float] = None,
+    ):
+        self.rows = list(rows)
+        self.costs = [1] * len(self.rows) if costs is None else list(costs)
+        if len(self.costs) != len(self.rows):
+            raise ValueError("Every row needs a cost")
+        self.time_budget = time_budget
+        self.exact = True
+        self.nodes = 0
+
+    def solve(self, columns: Optional[int] = None) -> List[int]:
+        # Indices of the chosen rows, in increasing order. Columns default to
+        # every column some row covers.
+        if columns is None:
+            columns = reduce(or_, self.rows, 0)
+        if reduce(or_, self.rows, 0) & columns != columns:
+            raise ValueError("Some columns are not covered by any row")
+        self.deadline = (
+            None if self.time_budget is None else time.perf_counter() + self.time_budget
+        )
+        self.exact = True
+        self.nodes = 0
+
+        rows = {i: row & columns for i, row in enumerate(self.rows) if row & columns}
+        self.best = self.greedy(rows, columns)
+        self.best_cost = self.cost(self.best)
+        self.search(rows, columns, [], 0)
+        return sorted(self.best)
+
+    def cost(self, chosen: List[int]) -> int:
+        return sum(self.costs[i] for i in chosen)
+
+    def greedy(self, rows: Rows, columns: int) -> List[int]:
+        # Most newly covered columns per unit of cost first. A row's gain
+        # only shrinks as columns get covered, so the gains in the heap are
+        # upper bounds and a row is re-scored only when it comes out on top.
+        heap = [
+            (-(row & columns).bit_count() / self.costs[i], i) for i, row in rows.items()
+        ]
+        heapify(heap)
+        chosen = []
+        while columns:
+            _, i = heappop(heap)
+            gain = (-(rows[i] & columns).bit_count() / self.costs[i], i)
+            if heap and gain > heap[0]:
+                heappush(heap, gain)
+                continue
+            chosen.append(i)
+            columns &= ~rows[i]
+        return self.drop_redundant(rows, chosen)
+
+    def drop_redundant(self, rows: Rows, chosen: List[int]) -> List[int]:
+        # A row whose every column is covered twice goes, the costliest first.
+        chosen = list(chosen)
+        twice = None
+        for i in sorted(chosen, key=lambda i: -self.costs[i]):
+            if twice is None:
+                once = twice = 0
+                for j in chosen:
+                    twice |= once & rows[j]
+                    once |= rows[j]
+            if rows[i] & ~twice == 0:
+                chosen.remove(i)
+                twice = None
+        return chosen
+
+    def column_rows(self, rows: Rows, columns: int) -> Dict[int, int]:
+        result = {j: 0 for j in iter_bits(columns)}
+        for i, row in rows.items():
+            for j in iter_bits(row):
+                result[j] |= 1 << i
+        return result
+
+    def reduce(self, rows: Rows, columns: int, chosen: List[int], cost: int):
+        # Returns the reduced (rows, columns, chosen, cost) with the rows of
+        # every remaining column, or None when a column is left with no row.
+        while True:
+            column_rows = self.column_rows(rows, columns)
+            if not all(column_rows.values()):
+                return None
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                return rows, columns, chosen, cost, column_rows
+
+            essential = next(
+                (
+                    covering
+                    for covering in column_rows.values()
+                    if covering.bit_count() == 1
+                ),
+                None,
+            )
+            if essential is not None:
+                i = essential.bit_length() - 1
+                chosen = chosen + [i]
+                cost += self.costs[i]
+                columns &= ~rows[i]
+                rows = {j: row & columns for j, row in rows.items() if row & columns}
+                continue
+
+            # Column d is dropped when every row covering another column c
+            # covers d too: covering c covers d.
+            dominated = 0
+            for c, covering in column_rows.items():
+                if (dominated >> c) & 1:
+                    continue
+                first = (covering & -covering).bit_length() - 1
+                for d in iter_bits(rows[first] & ~dominated):
+                    if d != c and covering & ~column_rows[d] == 0:
+                        dominated |= 1 << d
+            # Row i is dropped when another row covers all of its columns at
+            # no higher cost; of two equal rows the later one goes.
+            dropped = set()
+            for i, row in rows.items():
+                first = (row & -row).bit_length() - 1
+                for j in iter_bits(column_rows[first]):
+                    if j == i or j in dropped:
+                        continue
+                    if row & ~rows[j] == 0 and (
+                        self.costs[j] < self.costs[i]
+                        or (
+                            self.costs[j] == self.costs[i] and (rows[j] != row or j < i)
+                        )
+                    ):
+                        dropped.add(i)
+                        break
+
+            if not dominated and not dropped:
+                return rows, columns, chosen, cost, column_rows
+            columns &= ~dominated
+            rows = {
+                i: row & columns
+                for i, row in rows.items()
+                if i not in dropped and row & columns
+            }
+
+    def lower_bound(self, column_rows: Dict[int, int]) -> int:
+        # Columns that share no row each need a row of their own.
+        bound = 0
+        used = 0
+        for covering in sorted(column_rows.values(), key=int.bit_count):
+            if covering & used:
+                continue
+            used |= covering
+            bound += min(self.costs[i] for i in iter_bits(covering))
+        return bound
+
+    def search(self, rows: Rows, columns: int, chosen: List[int], cost: int) -> None:
+        if not self.exact:
+            # Out of time: the rest of the tree is left unexplored.
+            return
+        self.nodes += 1
+        reduced = self.reduce(rows, columns, chosen, cost)
+        if reduced is None:
+            return
+        rows, columns, chosen, cost, column_rows = reduced
+        if cost >= self.best_cost:
+            return
+        if not columns:
+            self.best, self.best_cost = chosen, cost
+            return
+        if cost + self.lower_bound(column_rows) >= self.best_cost:
+            return
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            self.exact = False
+            rest = self.greedy(rows, columns)
+            if cost + self.cost(rest) < self.best_cost:
+                self.best, self.best_cost = chosen + rest, cost + self.cost(rest)
+            return
+
+        # Some row covering the scarcest column must be taken: try each one,
+        # leaving out those already tried.
+        covering = min(column_rows.values(), key=int.bit_count)
+        candidates = sorted(
+            iter_bits(covering), key=lambda i: (-rows[i].bit_count(), self.costs[i])
+        )
+        for i in candidates:
+            taken = rows[i]
+            self.search(
+                {j: row & ~taken for j, row in rows.items() if j != i and row & ~taken},
+                columns & ~taken,
+                chosen + [i],
+                cost + self.costs[i],
+            )
+            rows = {j: row for j, row in rows.items() if j != i}
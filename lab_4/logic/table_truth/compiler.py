@@ -0,0 +1,139 @@
+import ast
+from functools import reduce
+from typing import Callable, Dict, List
+
+from logic.table_truth.language import VARIABLE, CONST, NOT, AND, OR, IMP, EQU
+from logic.table_truth.language import XOR, NAND, NOR
+from logic.table_truth.nodes import ExpressionNode, iter_postorder
+
+
+class FormulaCompiler:
+    # Builds Python AST nodes for the formula directly, so no source string is
+    # generated or parsed on the way to the code object.
+    python_opr = {
+        NOT: lambda x: ast.UnaryOp(op=ast.Not(), operand=x),
+        AND: lambda *xs: ast.BoolOp(op=ast.And(), values=list(xs)),
+        OR: lambda *xs: ast.BoolOp(op=ast.Or(), values=list(xs)),
+        IMP: lambda x, y: ast.BoolOp(
+            op=ast.Or(), values=[ast.UnaryOp(op=ast.Not(), operand=x), y]
+        ),
+        EQU: lambda x, y: ast.Compare(left=x, ops=[ast.Eq()], comparators=[y]),
+        # ^ of two bools is a bool.
+        XOR: lambda *xs: reduce(
+            lambda x, y: ast.BinOp(left=x, op=ast.BitXor(), right=y), xs
+        ),
+        NAND: lambda x, y: ast.UnaryOp(
+            op=ast.Not(), operand=ast.BoolOp(op=ast.And(), values=[x, y])
+        ),
+        NOR: lambda x, y: ast.UnaryOp(
+            op=ast.Not(), operand=ast.BoolOp(op=ast.Or(), values=[x, y])
+        ),
+    }
+
+    def __init__(self, formula_ast: ExpressionNode, variables: List[str]):
+        self.formula_ast = formula_ast
+        self.variables = variables
+        # Variables are compiled under generated names: formula names such as
+        # True, None or __debug__ are valid identifiers but not Python names.
+        self.names = {var: f"v{k}" for k, var in enumerate(variables)}
+
+    def build_expression(self) -> ast.expr:
+        body = self.build_body()
+        return body.pop().value
+
+    def build_body(self) -> List[ast.stmt]:
+        # Operations shared by several parents (the parser interns identical
+        # subtrees) are computed once into a local and read by name afterwards.
+        nodes = list(iter_postorder(self.formula_ast))
+        consumers: Dict[int, int] = {}
+        for node in nodes:
+            for operand in node.operands:
+                consumers[id(operand)] = consumers.get(id(operand), 0) + 1
+
+        body: List[ast.stmt] = []
+        values: Dict[int, ast.expr] = {}
+        for node in nodes:
+            if node.operator == VARIABLE:
+                values[id(node)] = ast.Name(id=self.names[node.name], ctx=ast.Load())
+                continue
+            if node.operator == CONST:
+                values[id(node)] = ast.Constant(value=bool(node.value))
+                continue
+            if node.operator not in self.python_opr:
+                raise ValueError("Unknown operator")
+
+            value = self.python_opr[node.operator](
+                *(values[id(operand)] for operand in node.operands)
+            )
+            if consumers.get(id(node), 0) > 1:
+                name = f"shared{len(body)}"
+                body.append(
+                    ast.Assign(
+                        targets=[ast.Name(id=name, ctx=ast.Store())], value=value
+                    )
+                )
+                value = ast.Name(id=name, ctx=ast.Load())
+            values[id(node)] = value
+
+        body.append(ast.Return(value=values[id(self.formula_ast)]))
+        return body
+
+    def compile(self) -> Callable[..., bool]:
+        # def evaluate(v0, v1, v2):
+        #     shared0 = <subformula used more than once>
+        #     return <formula>
+        return self.build_function(
+            "evaluate", list(self.names.values()), self.build_body()
+        )
+
+    def compile_index(self) -> Callable[[int], bool]:
+        # def evaluate_index(index):
+        #     v0 = index >> 2 & 1 == 1
+        #     ...
+        #     return <formula>
+        count = len(self.variables)
+        index_argument = "index"
+
+        body: List[ast.stmt] = [
+            ast.Assign(
+                targets=[ast.Name(id=name, ctx=ast.Store())],
+                value=ast.Compare(
+                    left=ast.BinOp(
+                        left=ast.BinOp(
+                            left=ast.Name(id=index_argument, ctx=ast.Load()),
+                            op=ast.RShift(),
+                            right=ast.Constant(value=count - 1 - k),
+                        ),
+                        op=ast.BitAnd(),
+                        right=ast.Constant(value=1),
+                    ),
+                    ops=[ast.Eq()],
+                    comparators=[ast.Constant(value=1)],
+                ),
+            )
+            for k, name in enumerate(self.names.values())
+        ]
+        body.extend(self.build_body())
+        return self.build_function("evaluate_index", [index_argument], body)
+
+    def build_function(
+        self, name: str, arguments: List[str], body: List[ast.stmt]
+    ) -> Callable[..., bool]:
+        function = ast.FunctionDef(
+            name=name,
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg=argument) for argument in arguments],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=body,
+            decorator_list=[],
+            type_params=[],
+        )
+        module = ast.Module(body=[function], type_ignores=[])
+        code = compile(ast.fix_missing_locations(module), "<formula>", "exec")
+        namespace: Dict[str, object] = {"__builtins__": {}}
+        exec(code, namespace)
+        return namespace[name]
@@ -1,57 +1,312 @@
-from typing import List, Dict
-from itertools import product
+import sys
+from typing import List, Dict, Iterator, Optional, TextIO, Tuple, Union
+from collections.abc import Sequence
 from tabulate import tabulate
 
 from logic.table_truth.logical_function import LogicalFunction
+from logic.table_truth.bitwise import BitwiseEvaluator
+from logic.table_truth.gray import GrayCodeEvaluator
+from logic.table_truth.packed import BitColumn
+from logic.table_truth.parallel import generate_column
+from logic.table_truth.terms import Term, iter_formatted_terms, write_terms
+from logic.table_truth.index_form import IndexForm, default_variables
+from logic.table_truth.table_file import TableFile, write_table_file
+
+BACKENDS = ("rows", "bitwise", "gray")
+# The result of a row whose value does not matter, in rows and tables.
+DONT_CARE = "-"
+
+
+class TruthTableRows(Sequence):
+    # Read-only list-of-rows view: each row is built from its index and the
+    # packed result column on access, nothing is stored per row. The tables
+    # hand out a new view on every access instead of keeping one, so there
+    # is no reference cycle and a table dropped is freed at once, along with
+    # any file mapping its column is a view of.
+    def __init__(self, truth_table: "TruthTable"):
+        self.truth_table = truth_table
+
+    def __len__(self) -> int:
+        return self.truth_table.rows_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                self.truth_table.get_row(i) for i in range(*index.indices(len(self)))
+            ]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Row index out of range")
+        return self.truth_table.get_row(index)
+
+    def __iter__(self) -> Iterator[List[int]]:
+        for i in range(len(self)):
+            yield self.truth_table.get_row(i)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, TruthTableRows)):
+            return len(self) == len(other) and all(
+                row == other_row for row, other_row in zip(self, other)
+            )
+        return NotImplemented
 
 
 class TruthTable:
     def __init__(
         self,
+        logical_function: Optional[LogicalFunction] = None,
+        backend: str = "bitwise",
+        lazy: bool = False,
+        workers: int = 1,
+        chunk_size: Optional[int] = None,
         *,
-        logical_function: LogicalFunction = None,
-        table: List[List[int]] = None,
-        variables: List[str] = None,
+        table: Optional[List[List[int]]] = None,
+        variables: Optional[List[str]] = None,
+        column: Optional[Union[BitColumn, int]] = None,
+        table_file: Optional[TableFile] = None,
+        output: Union[int, str] = 0,
+        dont_cares: Optional[Union[BitColumn, int]] = None,
     ):
-        self.num_form_pcnf = []
-        self.num_form_pdnf = []
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        if workers < 1:
+            raise ValueError("Workers count must be positive")
+
+        self.logical_function = logical_function
+        self.backend = backend
+        # With several workers the rows are evaluated in separate processes,
+        # chunk_size rows at a time.
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._result_column: Optional[BitColumn] = None
+        self.output_name: Optional[str] = None
+        # Rows marked here are neither in the PDNF nor in the PCNF: the
+        # minimizers may merge them but never have to cover them.
+        self.dont_care_column: Optional[BitColumn] = None
 
         if logical_function is not None:
-            self.logical_function = logical_function
             self.variables = logical_function.variables
-            self.table = []
-            self._generate_table()
-        elif table is not None and variables is not None:
-            self.logical_function = None
-            self.variables = variables
-            self.table = table
-            self._calculate_forms()
-
-    def _calculate_forms(self) -> None:
-        for i, row in enumerate(self.table):
-            result = row[-1]
-            if result == 1:
-                self.num_form_pdnf.append(i)
+            self.rows_count = 2 ** len(self.variables)
+            # In lazy mode the result column is only built when something
+            # needs the whole table; row access evaluates the formula row by row.
+            # A column already computed for the function is taken as it is.
+            if column is not None:
+                self._set_result_column(column)
+            elif not lazy:
+                self._build_result_column()
+        elif variables is not None and (table is not None or column is not None):
+            # A ready result column (or the rows it comes from): nothing is
+            # parsed or evaluated.
+            self.variables = list(variables)
+            self.rows_count = 2 ** len(self.variables)
+            if column is None:
+                self._calculate_forms(table)
             else:
-                self.num_form_pcnf.append(i)
+                self._set_result_column(column)
+        elif table_file is not None:
+            # The column stays a view of the mapped file: nothing is read
+            # until a row is queried.
+            self.variables = list(table_file.variables)
+            self.rows_count = table_file.rows_count
+            self.output_name = table_file.outputs[table_file.output_index(output)]
+            self._set_result_column(table_file.column(output))
+        else:
+            raise ValueError(
+                "Either a logical function, variables with a table or column, "
+                "or a table file are required"
+            )
+        if dont_cares is not None:
+            self._set_dont_care_column(dont_cares)
+
+    @classmethod
+    def from_index_form(
+        cls, index_form: IndexForm, variables: Optional[List[str]] = None
+    ) -> "TruthTable":
+        # The column comes straight from the index number; without names the
+        # variables are x1 .. xn.
+        if variables is None:
+            variables = default_variables(index_form.variables_count)
+        elif len(variables) != index_form.variables_count:
+            raise ValueError("Index form does not match the number of variables")
+        return cls(variables=variables, column=index_form.to_column())
+
+    def _set_result_column(self, column: Union[BitColumn, int]) -> None:
+        if isinstance(column, int):
+            column = BitColumn.from_int(column, self.rows_count)
+        if len(column) != self.rows_count:
+            raise ValueError("Column length must be 2 ** len(variables)")
+        self._result_column = column
+
+    def _set_dont_care_column(self, column: Union[BitColumn, int]) -> None:
+        if isinstance(column, int):
+            column = BitColumn.from_int(column, self.rows_count)
+        if len(column) != self.rows_count:
+            raise ValueError("Don't-care column length must be 2 ** len(variables)")
+        self.dont_care_column = column
+
+    def _calculate_forms(self, table: List[List[int]]) -> None:
+        if len(table) != self.rows_count:
+            raise ValueError("Table must have 2 ** len(variables) rows")
+        self._result_column = BitColumn.zeros(self.rows_count)
+        for i, row in enumerate(table):
+            if row[-1] == 1:
+                self._result_column[i] = 1
+            elif row[-1] == DONT_CARE:
+                if self.dont_care_column is None:
+                    self.dont_care_column = BitColumn.zeros(self.rows_count)
+                self.dont_care_column[i] = 1
+
+    @property
+    def table(self) -> TruthTableRows:
+        return TruthTableRows(self)
+
+    @property
+    def result_header(self) -> str:
+        if self.logical_function is not None:
+            return self.logical_function.formula
+        if self.output_name is not None:
+            return self.output_name
+        return "Result"
+
+    def _build_result_column(self) -> None:
+        if self.workers > 1:
+            self._generate_table_parallel()
+        elif self.backend == "bitwise":
+            self._generate_table_bitwise()
+        elif self.backend == "gray":
+            self._generate_table_gray()
+        else:
+            self._generate_table()
+
+    def _generate_table(self) -> None:
+        self._result_column = BitColumn.zeros(self.rows_count)
+        evaluate_index = self.logical_function.evaluate_index
+        for i in range(self.rows_count):
+            if evaluate_index(i):
+                self._result_column[i] = 1
+
+    def _generate_table_bitwise(self) -> None:
+        column = BitwiseEvaluator(self.logical_function.ast, self.variables).evaluate()
+        self._result_column = BitColumn.from_int(column, self.rows_count)
+
+    def _generate_table_gray(self) -> None:
+        self._result_column = GrayCodeEvaluator(
+            self.logical_function.ast, self.variables
+        ).evaluate()
+
+    def _generate_table_parallel(self) -> None:
+        self._result_column = generate_column(
+            self.logical_function, self.backend, self.workers, self.chunk_size
+        )
 
-    def _generate_table(self) -> List[List[int]]:
-        combinations = product([0, 1], repeat=len(self.variables))
-        for i, combination in enumerate(combinations):
-            assignment = dict(zip(self.variables, combination))
-            result = int(self.logical_function.evaluate(assignment))
+    @property
+    def result_column(self) -> BitColumn:
+        if self._result_column is None:
+            self._build_result_column()
+        return self._result_column
 
-            if result == 1:
-                self.num_form_pdnf.append(i)
+    def is_dont_care(self, index: int) -> bool:
+        return self.dont_care_column is not None and self.dont_care_column[index] == 1
+
+    def iter_ones(self) -> Iterator[int]:
+        if self.dont_care_column is None:
+            return self.result_column.iter_ones()
+        return (i for i in self.result_column.iter_ones() if not self.is_dont_care(i))
+
+    def iter_zeros(self) -> Iterator[int]:
+        if self.dont_care_column is None:
+            return self.result_column.iter_zeros()
+        return (i for i in self.result_column.iter_zeros() if not self.is_dont_care(i))
+
+    @property
+    def num_form_pdnf(self) -> List[int]:
+        return list(self.iter_ones())
+
+    @property
+    def num_form_pcnf(self) -> List[int]:
+        return list(self.iter_zeros())
+
+    @property
+    def num_form_dont_cares(self) -> List[int]:
+        if self.dont_care_column is None:
+            return []
+        return list(self.dont_care_column.iter_ones())
+
+    def get_assignment(self, index: int) -> Dict[str, int]:
+        count = len(self.variables)
+        return {
+            var: (index >> (count - 1 - k)) & 1 for k, var in enumerate(self.variables)
+        }
+
+    def get_result(self, index: int) -> Union[int, str]:
+        if self.is_dont_care(index):
+            return DONT_CARE
+        if self._result_column is not None:
+            return self._result_column[index]
+        if not 0 <= index < self.rows_count:
+            raise IndexError("Row index out of range")
+        return int(self.logical_function.evaluate_index(index))
+
+    def get_row(self, index: int) -> List[int]:
+        count = len(self.variables)
+        row = [(index >> (count - 1 - k)) & 1 for k in range(count)]
+        row.append(self.get_result(index))
+        return row
+
+    def iter_rows(
+        self, start: Optional[int] = None, stop: Optional[int] = None
+    ) -> Iterator[Tuple[int, Dict[str, int], Union[int, str]]]:
+        # Slice semantics, so iter_rows(-5) yields the last five rows.
+        for i in range(self.rows_count)[start:stop]:
+            assignment = self.get_assignment(i)
+            if self.is_dont_care(i):
+                result = DONT_CARE
+            elif self._result_column is not None:
+                result = self._result_column[i]
             else:
-                self.num_form_pcnf.append(i)
+                result = int(self.logical_function.evaluate_index(i))
+            yield i, assignment, result
+
+    def display(self, start: Optional[int] = None, stop: Optional[int] = None) -> str:
+        headers = self.variables + [self.result_header]
+        if start is None and stop is None:
+            print(tabulate(self.table, headers=headers, tablefmt="simple_grid"))
+            return
+
+        indexes, rows = [], []
+        for i, assignment, result in self.iter_rows(start, stop):
+            indexes.append(i)
+            rows.append(list(assignment.values()) + [result])
+        print(
+            tabulate(rows, headers=headers, showindex=indexes, tablefmt="simple_grid")
+        )
 
-            row = list(combination) + [result]
-            self.table.append(row)
+    def write(
+        self,
+        stream: Optional[TextIO] = None,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> None:
+        # Plain-text rows written one at a time, so the output never has to
+        # fit in memory the way a tabulate grid does.
+        stream = sys.stdout if stream is None else stream
+        headers = self.variables + [self.result_header]
+        widths = [len(header) for header in headers]
+        stream.write(" ".join(headers) + "\n")
+        for _, assignment, result in self.iter_rows(start, stop):
+            cells = list(assignment.values()) + [result]
+            stream.write(
+                " ".join(str(cell).rjust(width) for cell, width in zip(cells, widths))
+                + "\n"
+            )
 
-    def display(self) -> str:
-        headers = self.variables + ["Result"]
-        print(tabulate(self.table, headers=headers, tablefmt="simple_grid"))
+    def save(self, path: str) -> int:
+        if self.dont_care_column is not None:
+            raise ValueError("Table files do not store don't-cares")
+        return write_table_file(
+            path, self.variables, [self.result_column], [self.result_header]
+        )
 
     def get_num_form_pdnf(self) -> str:
         str_num_form_pdnf = map(lambda x: str(x), self.num_form_pdnf)
@@ -61,33 +316,47 @@ class TruthTable:
         str_num_form_pdnf = map(lambda x: str(x), self.num_form_pcnf)
         return f"({", ".join(str_num_form_pdnf)}) &"
 
+    @property
+    def index_form(self) -> IndexForm:
+        return IndexForm.from_column(self.result_column)
+
     def get_index_form(self) -> str:
-        result = ["0"] * 2 ** len(self.variables)
-        for i in self.num_form_pdnf:
-            result[i] = "1"
-        return "".join(result)
+        return self.index_form.to_binary()
+
+    def iter_pdnf_terms(self) -> Iterator[Term]:
+        full_mask = self.rows_count - 1
+        for i in self.iter_ones():
+            yield i, full_mask
+
+    def iter_pcnf_terms(self) -> Iterator[Term]:
+        full_mask = self.rows_count - 1
+        for i in self.iter_zeros():
+            yield i, full_mask
+
+    def iter_dont_care_terms(self) -> Iterator[Term]:
+        full_mask = self.rows_count - 1
+        for i in self.num_form_dont_cares:
+            yield i, full_mask
+
+    def iter_pdnf(self) -> Iterator[str]:
+        return iter_formatted_terms(self.iter_pdnf_terms(), self.variables, True)
+
+    def iter_pcnf(self) -> Iterator[str]:
+        return iter_formatted_terms(self.iter_pcnf_terms(), self.variables, False)
+
+    def write_pdnf(self, stream: Optional[TextIO] = None) -> int:
+        stream = sys.stdout if stream is None else stream
+        return write_terms(stream, self.iter_pdnf_terms(), self.variables, True)
+
+    def write_pcnf(self, stream: Optional[TextIO] = None) -> int:
+        stream = sys.stdout if stream is None else stream
+        return write_terms(stream, self.iter_pcnf_terms(), self.variables, False)
 
     def get_pcnf(self) -> str:
-        maxterms = []
-        for j in self.num_form_pcnf:
-            terms = [
-                f"!{var}" if self.table[j][i] else var
-                for i, var in enumerate(self.variables)
-            ]
-            maxterm = "(" + "|".join(terms) + ")"
-            maxterms.append(maxterm)
-        return "&".join(maxterms)
+        return "&".join(self.iter_pcnf())
 
     def get_pdnf(self) -> str:
-        minterms = []
-        for j in self.num_form_pdnf:
-            terms = [
-                var if self.table[j][i] else f"!{var}"
-                for i, var in enumerate(self.variables)
-            ]
-            minterm = "(" + "&".join(terms) + ")"
-            minterms.append(minterm)
-        return "|".join(minterms)
+        return "|".join(self.iter_pdnf())
 
     def group_pdnf(self) -> Dict[int, List[List[int]]]:
         groups = {}
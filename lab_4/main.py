@@ -1,29 +1,17 @@
-from logic.table_truth.truth_table import TruthTable
-from logic.table_truth.logical_function import LogicalFunction
+from logic.table_truth.multi_output import MultiOutputTruthTable
+from logic.table_truth.truth_table import DONT_CARE
 from logic.minimizer import Minimizer
 
-ODS_SUM_TRUTH_TABLE = [
-    # A, B, C, S
-    [0, 0, 0, 0],
-    [0, 0, 1, 1],
-    [0, 1, 0, 1],
-    [0, 1, 1, 0],
-    [1, 0, 0, 1],
-    [1, 0, 1, 0],
-    [1, 1, 0, 0],
-    [1, 1, 1, 1],
-]
-
-ODS_CARRY_OUT_TRUTH_TABLE = [
-    # A, B, C, P
-    [0, 0, 0, 0],
-    [0, 0, 1, 0],
-    [0, 1, 0, 0],
-    [0, 1, 1, 1],
-    [1, 0, 0, 0],
-    [1, 0, 1, 1],
-    [1, 1, 0, 1],
-    [1, 1, 1, 1],
+ODS_TRUTH_TABLE = [
+    # A, B, C, S, P
+    [0, 0, 0, 0, 0],
+    [0, 0, 1, 1, 0],
+    [0, 1, 0, 1, 0],
+    [0, 1, 1, 0, 1],
+    [1, 0, 0, 1, 0],
+    [1, 0, 1, 0, 1],
+    [1, 1, 0, 0, 1],
+    [1, 1, 1, 1, 1],
 ]
 
 D8421_PLUS_9_TRUTH_TABLE = [
@@ -38,75 +26,48 @@ D8421_PLUS_9_TRUTH_TABLE = [
     [0, 1, 1, 1, 0, 1, 1, 0],
     [1, 0, 0, 0, 0, 1, 1, 1],
     [1, 0, 0, 1, 1, 0, 0, 0],
-    [1, 0, 1, 0, 0, 0, 0, 0],  
-    [1, 0, 1, 1, 0, 0, 0, 0],
-    [1, 1, 0, 0, 0, 0, 0, 0],
-    [1, 1, 0, 1, 0, 0, 0, 0],
-    [1, 1, 1, 0, 0, 0, 0, 0],
-    [1, 1, 1, 1, 0, 0, 0, 0]
+    # Not a BCD digit: these inputs never occur.
+    [1, 0, 1, 0, DONT_CARE, DONT_CARE, DONT_CARE, DONT_CARE],
+    [1, 0, 1, 1, DONT_CARE, DONT_CARE, DONT_CARE, DONT_CARE],
+    [1, 1, 0, 0, DONT_CARE, DONT_CARE, DONT_CARE, DONT_CARE],
+    [1, 1, 0, 1, DONT_CARE, DONT_CARE, DONT_CARE, DONT_CARE],
+    [1, 1, 1, 0, DONT_CARE, DONT_CARE, DONT_CARE, DONT_CARE],
+    [1, 1, 1, 1, DONT_CARE, DONT_CARE, DONT_CARE, DONT_CARE],
 ]
 
-def main():
-    sum_truth_table = TruthTable(table=ODS_SUM_TRUTH_TABLE, variables=["A", "B", "C"])
-    print("Sum Truth Table:")
-    sum_truth_table.display()
-    sum_pcnf = sum_truth_table.get_pcnf()
-    print("Sum PCNF: ", sum_pcnf)
-
-    sum_pcnf_logical_function = LogicalFunction(sum_pcnf)
-    sum_pcnf_truth_table = TruthTable(logical_function=sum_pcnf_logical_function)
-    minimized_sum_pcnf = Minimizer(sum_pcnf_truth_table).karnaugh_map_minimization(
-        is_pdnf=False, display_karnaugh_map=False
-    )
-    print("Minimized Sum PCNF: ", minimized_sum_pcnf)
-
-    print("------------------------------------------------------")
-
-    carry_out_truth_table = TruthTable(
-        table=ODS_CARRY_OUT_TRUTH_TABLE, variables=["A", "B", "C"]
-    )
-    print("Carry Out Truth Table:")
-    carry_out_truth_table.display()
-    carry_out_pcnf = carry_out_truth_table.get_pcnf()
-    print("Carry Out PCNF: ", carry_out_pcnf)
-
-    carry_out_pcnf_logical_function = LogicalFunction(carry_out_pcnf)
-    carry_out_pcnf_truth_table = TruthTable(
-        logical_function=carry_out_pcnf_logical_function
-    )
-    minimized_carry_out_pcnf = Minimizer(
-        carry_out_pcnf_truth_table
-    ).karnaugh_map_minimization(is_pdnf=False, display_karnaugh_map=False)
-    print("Minimized Carry Out PCNF: ", minimized_carry_out_pcnf)
-
-    print("------------------------------------------------------")
-
-    d8421_plus_9_truth_table_a = TruthTable(
-        table=list(map(lambda x: x[:4] + [x[4]], D8421_PLUS_9_TRUTH_TABLE)), variables=["A", "B", "C", "D"]
-    )
-    minimized_d8421_plus_9_pcnf_a = Minimizer(d8421_plus_9_truth_table_a).karnaugh_map_minimization(is_pdnf=False, display_karnaugh_map=False)
-    print("Minimized D8421 Plus 9 PCNF A: ", minimized_d8421_plus_9_pcnf_a, end="\n\n")
-    
-
-    d8421_plus_9_truth_table_b = TruthTable(
-        table=list(map(lambda x: x[:4] + [x[5]], D8421_PLUS_9_TRUTH_TABLE)), variables=["A", "B", "C", "D"]
-    )   
-    minimized_d8421_plus_9_pcnf_b = Minimizer(d8421_plus_9_truth_table_b).karnaugh_map_minimization(is_pdnf=False, display_karnaugh_map=False)
-    print("Minimized D8421 Plus 9 PCNF B: ", minimized_d8421_plus_9_pcnf_b, end="\n\n")
 
-
-    d8421_plus_9_truth_table_c = TruthTable(
-        table=list(map(lambda x: x[:4] + [x[6]], D8421_PLUS_9_TRUTH_TABLE)), variables=["A", "B", "C", "D"]
+def main():
+    # One table per circuit; every output is a view of its column.
+    ods_truth_table = MultiOutputTruthTable.from_rows(
+        ODS_TRUTH_TABLE, variables=["A", "B", "C"], outputs=["S", "P"]
     )
-    minimized_d8421_plus_9_pcnf_c = Minimizer(d8421_plus_9_truth_table_c).karnaugh_map_minimization(is_pdnf=False, display_karnaugh_map=False)
-    print("Minimized D8421 Plus 9 PCNF C: ", minimized_d8421_plus_9_pcnf_c, end="\n\n")
-
-
-    d8421_plus_9_truth_table_d = TruthTable(
-        table=list(map(lambda x: x[:4] + [x[7]], D8421_PLUS_9_TRUTH_TABLE)), variables=["A", "B", "C", "D"]
+    ods_minimizer = Minimizer(ods_truth_table)
+    for output, name in (("S", "Sum"), ("P", "Carry Out")):
+        truth_table = ods_truth_table[output]
+        print(f"{name} Truth Table:")
+        truth_table.display()
+        print(f"{name} PCNF: ", truth_table.get_pcnf())
+
+        minimized_pcnf = ods_minimizer.for_output(output).karnaugh_map_minimization(
+            is_pdnf=False, display_karnaugh_map=False
+        )
+        print(f"Minimized {name} PCNF: ", minimized_pcnf)
+
+        print("------------------------------------------------------")
+
+    d8421_plus_9_truth_table = MultiOutputTruthTable.from_rows(
+        D8421_PLUS_9_TRUTH_TABLE,
+        variables=["A", "B", "C", "D"],
+        outputs=["A'", "B'", "C'", "D'"],
     )
-    minimized_d8421_plus_9_pcnf_d = Minimizer(d8421_plus_9_truth_table_d).karnaugh_map_minimization(is_pdnf=False, display_karnaugh_map=False)
-    print("Minimized D8421 Plus 9 PCNF D: ", minimized_d8421_plus_9_pcnf_d, end="\n\n")
+    # The four outputs are minimized together, so a clause they share is
+    # built once.
+    d8421_plus_9_minimizer = Minimizer(d8421_plus_9_truth_table)
+    minimized_d8421_plus_9_pcnf = d8421_plus_9_minimizer.minimize_jointly(is_pdnf=False)
+    for output, minimized_pcnf in minimized_d8421_plus_9_pcnf.items():
+        print(f"Minimized D8421 Plus 9 PCNF {output[0]}: ", minimized_pcnf, end="\n\n")
+    for term, outputs in d8421_plus_9_minimizer.shared_terms.items():
+        print(f"Shared term ({term}): ", ", ".join(outputs))
 
 
 if __name__ == "__main__":
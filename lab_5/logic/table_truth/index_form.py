@@ -0,0 +1,132 @@
+import decimal
+from typing import Dict, List
+
+from logic.table_truth.packed import BitColumn
+
+# Byte value with its bit order reversed: the index form reads row 0 first
+# (most significant), a packed column stores it in the lowest bit.
+REVERSED_BYTES = bytes(int(f"{value:08b}"[::-1], 2) for value in range(256))
+# Decimal conversions below this size are left to int() and Decimal(); int()
+# refuses anything past sys.get_int_max_str_digits() (4300 by default).
+DECIMAL_CHUNK_DIGITS = 1024
+DECIMAL_CHUNK_BITS = 2048
+
+
+def int_to_decimal(value: int) -> str:
+    # Splits the bits in halves and joins them back with the decimal module,
+    # whose multiplication stays fast on millions of digits, where repeated
+    # integer division by powers of ten would be quadratic.
+    if value < 0:
+        return "-" + int_to_decimal(-value)
+    context = decimal.Context(
+        prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+    )
+    powers: Dict[int, decimal.Decimal] = {}
+
+    def convert(value: int, width: int) -> decimal.Decimal:
+        if width <= DECIMAL_CHUNK_BITS:
+            return decimal.Decimal(value)
+        low_width = width >> 1
+        high = value >> low_width
+        low = value - (high << low_width)
+        if low_width not in powers:
+            powers[low_width] = context.power(decimal.Decimal(2), low_width)
+        return context.add(
+            convert(low, low_width),
+            context.multiply(convert(high, width - low_width), powers[low_width]),
+        )
+
+    return format(convert(value, value.bit_length()), "f")
+
+
+def decimal_to_int(text: str) -> int:
+    text = text.strip()
+    if len(text) <= DECIMAL_CHUNK_DIGITS:
+        return int(text)
+    if not text.isdigit():
+        raise ValueError("Decimal index form must contain only digits")
+    # high * 10**k + low: big int multiplication is subquadratic.
+    low_width = len(text) // 2
+    return decimal_to_int(text[:-low_width]) * 10**low_width + decimal_to_int(
+        text[-low_width:]
+    )
+
+
+class IndexForm:
+    # The result column read as one binary number, row 0 being the most
+    # significant bit, so "0001" (a & b) is 1 and "0111" (a | b) is 7.
+    def __init__(self, number: int, variables_count: int):
+        self.variables_count = variables_count
+        self.rows_count = 2**variables_count
+        if not 0 <= number < 1 << self.rows_count:
+            raise ValueError("Index number does not fit the number of variables")
+        self.number = number
+
+    @classmethod
+    def from_column(cls, column: BitColumn) -> "IndexForm":
+        rows_count = len(column)
+        data = bytes(column.data[: (rows_count + 7) // 8]).translate(REVERSED_BYTES)
+        number = int.from_bytes(data, "big")
+        if rows_count < 8:
+            number >>= 8 - rows_count
+        return cls(number, rows_count.bit_length() - 1)
+
+    @classmethod
+    def from_binary(cls, text: str) -> "IndexForm":
+        text = text.strip()
+        rows_count = len(text)
+        if rows_count == 0 or rows_count & (rows_count - 1):
+            raise ValueError("Binary index form length must be a power of two")
+        return cls(int(text, 2), rows_count.bit_length() - 1)
+
+    @classmethod
+    def from_hex(cls, text: str, variables_count: int) -> "IndexForm":
+        return cls(int(text, 16), variables_count)
+
+    @classmethod
+    def from_decimal(cls, text: str, variables_count: int) -> "IndexForm":
+        return cls(decimal_to_int(text), variables_count)
+
+    def to_column(self) -> BitColumn:
+        number = self.number
+        if self.rows_count < 8:
+            number <<= 8 - self.rows_count
+        data = number.to_bytes((self.rows_count + 7) // 8, "big")
+        return BitColumn(bytearray(data.translate(REVERSED_BYTES)), self.rows_count)
+
+    def to_binary(self) -> str:
+        return format(self.number, f"0{self.rows_count}b")
+
+    def to_hex(self) -> str:
+        return format(self.number, f"0{(self.rows_count + 3) // 4}x")
+
+    def to_decimal(self) -> str:
+        return int_to_decimal(self.number)
+
+    def to_bytes(self) -> bytes:
+        # Packed big-endian bits of the number, row 0 first.
+        return self.number.to_bytes((self.rows_count + 7) // 8, "big")
+
+    def __int__(self) -> int:
+        return self.number
+
+    def __index__(self) -> int:
+        return self.number
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, IndexForm):
+            return NotImplemented
+        return (self.number, self.variables_count) == (
+            other.number,
+            other.variables_count,
+        )
+
+    def __str__(self) -> str:
+        return self.to_binary()
+
+    def __repr__(self) -> str:
+        return f"IndexForm(0x{self.to_hex()}, {self.variables_count})"
+
+
+def default_variables(variables_count: int) -> List[str]:
+    return [f"x{i + 1}" for i in range(variables_count)]
@@ -1,3 +1,4 @@
+import re
 from typing import Set, List
 
 VARIABLE, CONST, EQU, IMP, OR, AND, NOT, LPAREN, RPAREN, SPACE, EOF = (
@@ -13,6 +14,7 @@ VARIABLE, CONST, EQU, IMP, OR, AND, NOT, LPAREN, RPAREN, SPACE, EOF = (
     "SPACE",
     "EOF",
 )
+XOR, NAND, NOR = "XOR", "NAND", "NOR"
 
 
 class Token:
@@ -31,12 +33,12 @@ class Lexer:
     def __init__(self, text: str):
         self.text = text
         self.pos = 0
-        self.current_char = self.text[self.pos] if self.text else None      
+        self.current_char = self.text[self.pos] if self.text else None
         self.variables: Set[str] = set()
 
     def error(self):
         raise Exception("Invalid character")
-    
+
     def get_variables(self) -> List[str]:
         return sorted(list(self.variables))
 
@@ -76,12 +78,24 @@ class Lexer:
                 self.advance()
                 return Token(OR, "|")
 
+            if self.current_char == "^":
+                self.advance()
+                return Token(XOR, "^")
+
             if self.current_char == "&":
                 self.advance()
                 return Token(AND, "&")
 
             if self.current_char == "!":
                 self.advance()
+                # "!&" and "!|" are NAND and NOR; a negation is never
+                # followed by a binary operator.
+                if self.current_char == "&":
+                    self.advance()
+                    return Token(NAND, "!&")
+                if self.current_char == "|":
+                    self.advance()
+                    return Token(NOR, "!|")
                 return Token(NOT, "!")
 
             if self.current_char == "(":
@@ -94,4 +108,74 @@ class Lexer:
 
             self.error()
 
-        return Token(EOF, None)
\ No newline at end of file
+        return Token(EOF, None)
+
+
+# One lexeme per match; leading whitespace is folded into the match, so spaces
+# never produce matches of their own.
+LEXEME_PATTERN = re.compile(r"\s*([^\W\d]\w*|\d\w*|![&|]|\S)")
+
+OPERATOR_TYPES = {
+    "~": EQU,
+    ">": IMP,
+    "|": OR,
+    "&": AND,
+    "^": XOR,
+    "!&": NAND,
+    "!|": NOR,
+    "!": NOT,
+    "(": LPAREN,
+    ")": RPAREN,
+}
+
+
+class RegexLexer:
+    # Tokenizes the whole formula in one regex pass. Variables may be
+    # multi-character identifiers (q4, x_10), 0 and 1 are constants.
+    def __init__(self, text: str):
+        self.text = text
+        self.variables: Set[str] = set()
+        self.tokens = self.tokenize()
+        self.pos = 0
+
+    def error(self, lexeme_index: int):
+        match = next(
+            m
+            for i, m in enumerate(LEXEME_PATTERN.finditer(self.text))
+            if i == lexeme_index
+        )
+        position = match.start(1)
+        raise Exception(
+            f"Invalid character {self.text[position]!r} at position {position}"
+        )
+
+    def get_variables(self) -> List[str]:
+        return sorted(self.variables)
+
+    def tokenize(self) -> List[Token]:
+        # Tokens are never mutated, so one instance per distinct lexeme is
+        # shared by all its occurrences.
+        known_tokens = {
+            char: Token(token_type, char) for char, token_type in OPERATOR_TYPES.items()
+        }
+        tokens = []
+        for value in LEXEME_PATTERN.findall(self.text):
+            token = known_tokens.get(value)
+            if token is None:
+                if value.isidentifier():
+                    self.variables.add(value)
+                    token = Token(VARIABLE, value)
+                elif value in ("0", "1"):
+                    token = Token(CONST, int(value))
+                else:
+                    self.error(len(tokens))
+                known_tokens[value] = token
+            tokens.append(token)
+        tokens.append(Token(EOF, None))
+        return tokens
+
+    def get_next_token(self) -> Token:
+        token = self.tokens[self.pos]
+        if self.pos < len(self.tokens) - 1:
+            self.pos += 1
+        return token
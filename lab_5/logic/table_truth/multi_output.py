@@ -0,0 +1,166 @@
+import sys
+from typing import Iterator, List, Optional, Sequence, TextIO, Union
+from tabulate import tabulate
+
+from logic.table_truth.logical_function import LogicalFunction
+from logic.table_truth.bitwise import BitwiseEvaluator
+from logic.table_truth.packed import BitColumn
+from logic.table_truth.truth_table import DONT_CARE, TruthTable, TruthTableRows
+from logic.table_truth.table_file import TableFile, write_table_file
+
+
+class MultiOutputTruthTable:
+    # Several functions of the same inputs: one packed result column per
+    # output. The input columns are not stored at all, a row's inputs being
+    # the bits of its index, and output() hands out a single-output
+    # TruthTable over the very same column instead of a copy.
+    def __init__(
+        self,
+        variables: List[str],
+        columns: Sequence[Union[BitColumn, int]],
+        outputs: Optional[List[str]] = None,
+        dont_cares: Optional[Sequence[Optional[Union[BitColumn, int]]]] = None,
+    ):
+        self.variables = list(variables)
+        self.rows_count = 2 ** len(self.variables)
+        if outputs is None:
+            outputs = [f"f{k}" for k in range(len(columns))]
+        if len(outputs) != len(columns):
+            raise ValueError("Every column needs an output name")
+        if len(set(outputs)) != len(outputs):
+            raise ValueError("Output names must be unique")
+        self.outputs = list(outputs)
+
+        self.columns: List[BitColumn] = []
+        for column in columns:
+            if isinstance(column, int):
+                column = BitColumn.from_int(column, self.rows_count)
+            if len(column) != self.rows_count:
+                raise ValueError("Column length must be 2 ** len(variables)")
+            self.columns.append(column)
+
+        # Per output, the column of its don't-care rows or None.
+        if dont_cares is None:
+            dont_cares = [None] * len(self.columns)
+        if len(dont_cares) != len(self.columns):
+            raise ValueError("Every column needs its don't-cares or None")
+        self.dont_care_columns: List[Optional[BitColumn]] = []
+        for column in dont_cares:
+            if isinstance(column, int):
+                column = BitColumn.from_int(column, self.rows_count)
+            if column is not None and len(column) != self.rows_count:
+                raise ValueError("Column length must be 2 ** len(variables)")
+            self.dont_care_columns.append(column)
+
+    @classmethod
+    def from_rows(
+        cls,
+        table: List[List[int]],
+        variables: List[str],
+        outputs: Optional[List[str]] = None,
+    ) -> "MultiOutputTruthTable":
+        # Rows of the inputs followed by every output, as written by hand in
+        # lab_4 and lab_5; all the columns are filled in one pass. An output
+        # may be DONT_CARE.
+        rows_count = 2 ** len(variables)
+        if len(table) != rows_count:
+            raise ValueError("Table must have 2 ** len(variables) rows")
+        count = len(variables)
+        outputs_count = len(table[0]) - count if outputs is None else len(outputs)
+        columns = [BitColumn.zeros(rows_count) for _ in range(outputs_count)]
+        dont_cares: List[Optional[BitColumn]] = [None] * outputs_count
+        for i, row in enumerate(table):
+            if len(row) != count + outputs_count:
+                raise ValueError("Every row must hold the inputs and all outputs")
+            for k, value in enumerate(row[count:]):
+                if value == 1:
+                    columns[k][i] = 1
+                elif value == DONT_CARE:
+                    if dont_cares[k] is None:
+                        dont_cares[k] = BitColumn.zeros(rows_count)
+                    dont_cares[k][i] = 1
+        return cls(variables, columns, outputs, dont_cares)
+
+    @classmethod
+    def from_functions(
+        cls, functions: List[LogicalFunction], outputs: Optional[List[str]] = None
+    ) -> "MultiOutputTruthTable":
+        # Every function is evaluated over the union of their variables.
+        variables = sorted(set().union(*(function.variables for function in functions)))
+        columns = [
+            BitwiseEvaluator(function.ast, variables).evaluate()
+            for function in functions
+        ]
+        if outputs is None:
+            outputs = [function.formula for function in functions]
+        return cls(variables, columns, outputs)
+
+    @classmethod
+    def from_file(cls, table_file: TableFile) -> "MultiOutputTruthTable":
+        # Every column stays a view of the mapped file.
+        columns = [table_file.column(k) for k in range(len(table_file))]
+        return cls(table_file.variables, columns, table_file.outputs)
+
+    @property
+    def table(self) -> TruthTableRows:
+        return TruthTableRows(self)
+
+    def __len__(self) -> int:
+        return len(self.outputs)
+
+    def __getitem__(self, output: Union[int, str]) -> TruthTable:
+        return self.output(output)
+
+    def __iter__(self) -> Iterator[TruthTable]:
+        for k in range(len(self.outputs)):
+            yield self.output(k)
+
+    def output_index(self, output: Union[int, str]) -> int:
+        if isinstance(output, str):
+            if output not in self.outputs:
+                raise ValueError(f"Unknown output: {output}")
+            return self.outputs.index(output)
+        if not 0 <= output < len(self.outputs):
+            raise IndexError("Output index out of range")
+        return output
+
+    def output(self, output: Union[int, str]) -> TruthTable:
+        k = self.output_index(output)
+        view = TruthTable(
+            variables=self.variables,
+            column=self.columns[k],
+            dont_cares=self.dont_care_columns[k],
+        )
+        view.output_name = self.outputs[k]
+        return view
+
+    def get_row(self, index: int) -> List[int]:
+        if not 0 <= index < self.rows_count:
+            raise IndexError("Row index out of range")
+        count = len(self.variables)
+        row = [(index >> (count - 1 - k)) & 1 for k in range(count)]
+        row.extend(
+            DONT_CARE if dont_cares is not None and dont_cares[index] else column[index]
+            for column, dont_cares in zip(self.columns, self.dont_care_columns)
+        )
+        return row
+
+    def display(self) -> None:
+        headers = self.variables + self.outputs
+        print(tabulate(self.table, headers=headers, tablefmt="simple_grid"))
+
+    def write(self, stream: Optional[TextIO] = None) -> None:
+        stream = sys.stdout if stream is None else stream
+        headers = self.variables + self.outputs
+        widths = [len(header) for header in headers]
+        stream.write(" ".join(headers) + "\n")
+        for row in self.table:
+            stream.write(
+                " ".join(str(cell).rjust(width) for cell, width in zip(row, widths))
+                + "\n"
+            )
+
+    def save(self, path: str) -> int:
+        if any(column is not None for column in self.dont_care_columns):
+            raise ValueError("Table files do not store don't-cares")
+        return write_table_file(path, self.variables, self.columns, self.outputs)
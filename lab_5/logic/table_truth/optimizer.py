@@ -0,0 +1,183 @@
+from typing import Dict, List, Optional, Set
+
+from logic.table_truth.language import Token, VARIABLE, CONST, NOT, AND, OR, IMP, EQU
+from logic.table_truth.language import XOR, NAND, NOR
+from logic.table_truth.nodes import (
+    ExpressionNode,
+    InterningNodeFactory,
+    iter_postorder,
+)
+
+CHAIN_SYMBOLS = {AND: "&", OR: "|", XOR: "^"}
+# NAND and NOR are rewritten as the negated AND and OR.
+NEGATED_CHAINS = {NAND: AND, NOR: OR}
+
+
+class FormulaOptimizer:
+    # Bottom-up rewriting: every node is simplified once its operands are.
+    # The result is built through an interning factory, so structurally equal
+    # subformulas are the same object and "x & x" or "x | !x" are found by
+    # identity.
+    def __init__(self, factory: Optional[InterningNodeFactory] = None):
+        self.factory = InterningNodeFactory() if factory is None else factory
+        self.false = self.factory.constant(Token(CONST, 0))
+        self.true = self.factory.constant(Token(CONST, 1))
+        self.not_token = Token(NOT, "!")
+        self.chain_tokens = {
+            operator: Token(operator, symbol)
+            for operator, symbol in CHAIN_SYMBOLS.items()
+        }
+
+    def optimize(self, root: ExpressionNode) -> ExpressionNode:
+        nodes = list(iter_postorder(root))
+        consumers: Dict[int, int] = {}
+        for node in nodes:
+            for operand in node.operands:
+                consumers[id(operand)] = consumers.get(id(operand), 0) + 1
+
+        values: Dict[int, ExpressionNode] = {}
+        # Chains used by several parents are not flattened into them, or every
+        # parent would repeat the whole chain instead of reading its result.
+        shared: Set[int] = set()
+        for node in nodes:
+            operands = [values[id(operand)] for operand in node.operands]
+            if node.operator == VARIABLE:
+                value = self.factory.variable(Token(VARIABLE, node.name))
+            elif node.operator == CONST:
+                value = self.true if node.value else self.false
+            elif node.operator == NOT:
+                value = self.negate(operands[0])
+            elif node.operator == XOR:
+                value = self.parity(operands, shared)
+            elif node.operator in CHAIN_SYMBOLS:
+                value = self.chain(node.operator, operands, shared)
+            elif node.operator in NEGATED_CHAINS:
+                value = self.negate(
+                    self.chain(NEGATED_CHAINS[node.operator], operands, shared)
+                )
+            elif node.operator == IMP:
+                value = self.implication(*operands)
+            elif node.operator == EQU:
+                value = self.equivalence(*operands)
+            else:
+                raise ValueError("Unknown operator")
+            if consumers.get(id(node), 0) > 1:
+                shared.add(id(value))
+            values[id(node)] = value
+        return values[id(root)]
+
+    def negate(self, operand: ExpressionNode) -> ExpressionNode:
+        if operand is self.false:
+            return self.true
+        if operand is self.true:
+            return self.false
+        # Double negation.
+        if operand.operator == NOT:
+            return operand.operands[0]
+        return self.factory.unary(self.not_token, operand)
+
+    def chain(
+        self, operator: str, operands: List[ExpressionNode], shared: Set[int]
+    ) -> ExpressionNode:
+        if operator == AND:
+            absorbing, neutral, dual = self.false, self.true, OR
+        else:
+            absorbing, neutral, dual = self.true, self.false, AND
+
+        flat: List[ExpressionNode] = []
+        for operand in operands:
+            if operand.operator == operator and id(operand) not in shared:
+                flat.extend(operand.operands)
+            else:
+                flat.append(operand)
+
+        # Constants and idempotence: x & 0 = 0, x & 1 = x, x & x = x.
+        unique: Dict[int, ExpressionNode] = {}
+        for operand in flat:
+            if operand is absorbing:
+                return absorbing
+            if operand is not neutral:
+                unique.setdefault(id(operand), operand)
+
+        # Complement: x & !x = 0.
+        for operand in unique.values():
+            if operand.operator == NOT and id(operand.operands[0]) in unique:
+                return absorbing
+
+        # Absorption: x & (x | y) = x.
+        kept = [
+            operand
+            for operand in unique.values()
+            if operand.operator != dual
+            or not any(id(inner) in unique for inner in operand.operands)
+        ]
+        if not kept:
+            return neutral
+        if len(kept) == 1:
+            return kept[0]
+        return self.factory.nary(self.chain_tokens[operator], tuple(kept))
+
+    def parity(
+        self, operands: List[ExpressionNode], shared: Set[int]
+    ) -> ExpressionNode:
+        # Negations and 1s are pulled out (!x ^ y = !(x ^ y)), 0s dropped and
+        # operands met an even number of times cancel: x ^ x = 0, x ^ !x = 1.
+        flat: List[ExpressionNode] = []
+        for operand in operands:
+            if operand.operator == XOR and id(operand) not in shared:
+                flat.extend(operand.operands)
+            else:
+                flat.append(operand)
+
+        negated = False
+        odd: Dict[int, ExpressionNode] = {}
+        for operand in flat:
+            if operand is self.false:
+                continue
+            if operand is self.true:
+                negated = not negated
+                continue
+            if operand.operator == NOT:
+                negated = not negated
+                operand = operand.operands[0]
+            if odd.pop(id(operand), None) is None:
+                odd[id(operand)] = operand
+
+        if not odd:
+            result = self.false
+        elif len(odd) == 1:
+            result = next(iter(odd.values()))
+        else:
+            result = self.factory.nary(self.chain_tokens[XOR], tuple(odd.values()))
+        return self.negate(result) if negated else result
+
+    def implication(
+        self, left: ExpressionNode, right: ExpressionNode
+    ) -> ExpressionNode:
+        if left is self.false or right is self.true or left is right:
+            return self.true
+        if left is self.true:
+            return right
+        if right is self.false:
+            return self.negate(left)
+        return self.factory.binary(left, Token(IMP, ">"), right)
+
+    def equivalence(
+        self, left: ExpressionNode, right: ExpressionNode
+    ) -> ExpressionNode:
+        if left is right:
+            return self.true
+        if (left.operator == NOT and left.operands[0] is right) or (
+            right.operator == NOT and right.operands[0] is left
+        ):
+            return self.false
+        for constant, other in ((left, right), (right, left)):
+            if constant is self.true:
+                return other
+            if constant is self.false:
+                return self.negate(other)
+        return self.factory.binary(left, Token(EQU, "~"), right)
+
+
+def optimize(root: ExpressionNode) -> ExpressionNode:
+    return FormulaOptimizer().optimize(root)
@@ -0,0 +1,137 @@
+import mmap
+import struct
+from typing import BinaryIO, List, Optional, Sequence, Union
+
+from logic.table_truth.packed import BitColumn
+
+# Layout, little-endian:
+#   magic, version, variables count, outputs count, reserved, rows count
+#   every variable name, then every output name: 4-byte length and UTF-8
+#   zero padding up to a multiple of 8 bytes
+#   the packed result columns one after another, (rows + 7) // 8 bytes each,
+#   bit i of a column in byte i // 8 at bit position i % 8, as in BitColumn
+MAGIC = b"TTBL"
+# Version 1 stored 2-byte name lengths, too short for a formula as the
+# name of the output of a large table.
+VERSION = 2
+HEADER = struct.Struct("<4sHHHHQ")
+NAME_LENGTH = struct.Struct("<I")
+ALIGNMENT = 8
+
+
+def write_columns(
+    stream: BinaryIO,
+    variables: List[str],
+    columns: Sequence[Union[BitColumn, int]],
+    outputs: Optional[List[str]] = None,
+) -> int:
+    # Returns the number of bytes written.
+    rows_count = 2 ** len(variables)
+    if outputs is None:
+        outputs = [f"f{k}" for k in range(len(columns))]
+    if len(outputs) != len(columns):
+        raise ValueError("Every column needs an output name")
+
+    header = bytearray(
+        HEADER.pack(MAGIC, VERSION, len(variables), len(columns), 0, rows_count)
+    )
+    for name in list(variables) + list(outputs):
+        encoded = name.encode("utf-8")
+        header += NAME_LENGTH.pack(len(encoded)) + encoded
+    header += bytes(-len(header) % ALIGNMENT)
+    written = stream.write(header)
+
+    for column in columns:
+        if isinstance(column, int):
+            column = BitColumn.from_int(column, rows_count)
+        if len(column) != rows_count:
+            raise ValueError("Column length must be 2 ** len(variables)")
+        written += stream.write(column.data[: column.nbytes])
+    return written
+
+
+def write_table_file(
+    path: str,
+    variables: List[str],
+    columns: Sequence[Union[BitColumn, int]],
+    outputs: Optional[List[str]] = None,
+) -> int:
+    with open(path, "wb") as stream:
+        return write_columns(stream, variables, columns, outputs)
+
+
+class TableFile:
+    # Maps the file read-only: opening costs only the header, and a column is
+    # a BitColumn over a slice of the mapping, so rows are paged in by the OS
+    # when they are queried and never copied.
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as stream:
+            self.mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mmap)
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_header(self) -> None:
+        if len(self.view) < HEADER.size:
+            raise ValueError("Not a truth table file")
+        magic, version, variables_count, outputs_count, _, rows_count = (
+            HEADER.unpack_from(self.view)
+        )
+        if magic != MAGIC:
+            raise ValueError("Not a truth table file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported truth table file version: {version}")
+        if rows_count != 2**variables_count:
+            raise ValueError("Rows count must be 2 ** variables count")
+
+        offset = HEADER.size
+        names = []
+        for _ in range(variables_count + outputs_count):
+            if offset + NAME_LENGTH.size > len(self.view):
+                raise ValueError("Truncated truth table file")
+            (length,) = NAME_LENGTH.unpack_from(self.view, offset)
+            offset += NAME_LENGTH.size
+            if offset + length > len(self.view):
+                raise ValueError("Truncated truth table file")
+            names.append(str(self.view[offset : offset + length], "utf-8"))
+            offset += length
+        offset += -offset % ALIGNMENT
+
+        self.variables = names[:variables_count]
+        self.outputs = names[variables_count:]
+        self.rows_count = rows_count
+        self.column_nbytes = (rows_count + 7) // 8
+        self.data_offset = offset
+        if offset + outputs_count * self.column_nbytes > len(self.view):
+            raise ValueError("Truncated truth table file")
+
+    def __len__(self) -> int:
+        return len(self.outputs)
+
+    def output_index(self, output: Union[int, str]) -> int:
+        if isinstance(output, str):
+            if output not in self.outputs:
+                raise ValueError(f"Unknown output: {output}")
+            return self.outputs.index(output)
+        if not 0 <= output < len(self.outputs):
+            raise IndexError("Output index out of range")
+        return output
+
+    def column(self, output: Union[int, str] = 0) -> BitColumn:
+        start = self.data_offset + self.output_index(output) * self.column_nbytes
+        return BitColumn(self.view[start : start + self.column_nbytes], self.rows_count)
+
+    def close(self) -> None:
+        # Fails with BufferError while columns taken from the file are alive.
+        self.view.release()
+        self.mmap.close()
+
+    def __enter__(self) -> "TableFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,72 @@
+from typing import Iterable, Iterator, List, TextIO, Tuple
+
+# A term is (value, mask): bit (n - 1 - k) of mask says whether variable k
+# appears in the term, the same bit of value says whether it is 1. Bits follow
+# the row-index order, so a PDNF constituent of row i is (i, 2**n - 1).
+Term = Tuple[int, int]
+
+
+def format_term(term: Term, variables: List[str], is_pdnf: bool) -> str:
+    # "(a&!b)" for a conjunction, "(!a|b)" for a disjunction; a variable equal
+    # to 1 is negated in a PCNF maxterm.
+    value, mask = term
+    count = len(variables)
+    literals = []
+    for k, var in enumerate(variables):
+        bit = 1 << (count - 1 - k)
+        if mask & bit:
+            negated = not value & bit if is_pdnf else value & bit
+            literals.append(f"!{var}" if negated else var)
+    return "(" + ("&" if is_pdnf else "|").join(literals) + ")"
+
+
+def iter_formatted_terms(
+    terms: Iterable[Term], variables: List[str], is_pdnf: bool
+) -> Iterator[str]:
+    for term in terms:
+        yield format_term(term, variables, is_pdnf)
+
+
+def write_terms(
+    stream: TextIO, terms: Iterable[Term], variables: List[str], is_pdnf: bool
+) -> int:
+    # Terms go out one at a time with their separator, so no joined string is
+    # built; returns how many terms were written.
+    separator = "|" if is_pdnf else "&"
+    written = 0
+    for text in iter_formatted_terms(terms, variables, is_pdnf):
+        if written:
+            stream.write(separator)
+        stream.write(text)
+        written += 1
+    return written
+
+
+def iter_term_rows(term: Term, variables_count: int) -> Iterator[int]:
+    # Indexes of the rows the term covers, in ascending order.
+    value, mask = term
+    free = ~mask & ((1 << variables_count) - 1)
+    value &= mask
+    subset = 0
+    while True:
+        yield value | subset
+        if subset == free:
+            break
+        subset = ((subset | mask) + 1) & free
+
+
+def terms_to_column(
+    terms: Iterable[Term], variables_count: int, is_pdnf: bool = True
+) -> int:
+    # Column int (bit i = row i) of the function the terms describe: their
+    # union for a DNF, the complement of it for a CNF.
+    column = 0
+    for term in terms:
+        if term[1] == (1 << variables_count) - 1:
+            column |= 1 << term[0]
+        else:
+            for i in iter_term_rows(term, variables_count):
+                column |= 1 << i
+    if is_pdnf:
+        return column
+    return ((1 << 2**variables_count) - 1) ^ column